@@ -0,0 +1,2 @@
+-- Separate database for the test suite, which drops and recreates its tables
+CREATE DATABASE lang_portal_test OWNER lang_portal;
@@ -0,0 +1,18 @@
+CREATE TABLE word_review_stats (
+    word_id INTEGER PRIMARY KEY,
+    correct_count INTEGER NOT NULL DEFAULT 0,
+    wrong_count INTEGER NOT NULL DEFAULT 0,
+    last_reviewed TIMESTAMP,
+    FOREIGN KEY (word_id) REFERENCES words (id)
+);
+
+-- Backfill the rollup from any reviews recorded before this table existed
+INSERT INTO word_review_stats (word_id, correct_count, wrong_count, last_reviewed)
+SELECT
+    word_id,
+    SUM(CASE WHEN correct THEN 1 ELSE 0 END),
+    SUM(CASE WHEN correct THEN 0 ELSE 1 END),
+    MAX(created_at)
+FROM word_review_items
+WHERE word_id IS NOT NULL
+GROUP BY word_id;
@@ -0,0 +1,17 @@
+-- Indexes for the lookups the services actually run; see the matching
+-- __table_args__ on the models.
+
+-- group -> words (the primary key only covers word -> groups)
+CREATE INDEX IF NOT EXISTS ix_words_groups_group_id ON words_groups (group_id, word_id);
+
+-- /api/groups/:id/study_sessions, newest first
+CREATE INDEX IF NOT EXISTS ix_study_sessions_group_id_created_at ON study_sessions (group_id, created_at);
+
+-- last study session on the dashboard
+CREATE INDEX IF NOT EXISTS ix_study_sessions_created_at ON study_sessions (created_at, id);
+
+-- review history for a word, and distinct reviewed words
+CREATE INDEX IF NOT EXISTS ix_word_review_items_word_id ON word_review_items (word_id);
+
+-- per-session correct/total counts and reviewed word list, answered from the index alone
+CREATE INDEX IF NOT EXISTS ix_word_review_items_session ON word_review_items (study_session_id, correct, word_id);
@@ -0,0 +1,2 @@
+-- Lookup index for the (japanese, romaji) dedup key used by /api/words:import
+CREATE INDEX IF NOT EXISTS ix_words_japanese_romaji ON words (japanese, romaji);
@@ -0,0 +1,7 @@
+CREATE TABLE change_versions (
+    table_name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0
+);
+
+-- Random per-database epoch, so ETags issued before a rebuild never match after it
+INSERT INTO change_versions (table_name, version) VALUES ('_epoch', abs(random()) % 1000000000);
@@ -0,0 +1,29 @@
+-- updated_at tracking for the vocabulary tables. SQLite cannot add a column
+-- with a CURRENT_TIMESTAMP default, so the application sets it on write.
+ALTER TABLE words ADD COLUMN updated_at TIMESTAMP;
+ALTER TABLE groups ADD COLUMN updated_at TIMESTAMP;
+ALTER TABLE words_groups ADD COLUMN updated_at TIMESTAMP;
+
+UPDATE words SET updated_at = CURRENT_TIMESTAMP;
+UPDATE groups SET updated_at = COALESCE(created_at, CURRENT_TIMESTAMP);
+UPDATE words_groups SET updated_at = CURRENT_TIMESTAMP;
+
+-- Change feed: upserts and tombstones ordered by a sequence that is never reused
+CREATE TABLE change_log (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    table_name TEXT NOT NULL,
+    op TEXT NOT NULL,
+    word_id INTEGER,
+    group_id INTEGER,
+    changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Seed the feed with the existing vocabulary so a sync from the start is complete
+INSERT INTO change_log (table_name, op, group_id)
+SELECT 'groups', 'upsert', id FROM groups ORDER BY id;
+
+INSERT INTO change_log (table_name, op, word_id)
+SELECT 'words', 'upsert', id FROM words ORDER BY id;
+
+INSERT INTO change_log (table_name, op, word_id, group_id)
+SELECT 'words_groups', 'upsert', word_id, group_id FROM words_groups ORDER BY group_id, word_id;
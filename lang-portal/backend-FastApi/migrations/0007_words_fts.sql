@@ -0,0 +1,33 @@
+-- Full-text index over words, kept in sync with the words table by triggers.
+-- Keep in step with src/models/word_search.py, which creates the same
+-- objects for databases built with create_all.
+--
+-- parts is indexed as the space-separated text values of its JSON (the stored
+-- JSON escapes kana as \uXXXX), so words_fts keeps its own copy of the text.
+CREATE VIRTUAL TABLE IF NOT EXISTS words_fts USING fts5(
+    japanese, romaji, english, parts,
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='1 2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS words_fts_ai AFTER INSERT ON words BEGIN
+    INSERT INTO words_fts (rowid, japanese, romaji, english, parts)
+    VALUES (new.id, new.japanese, new.romaji, new.english,
+            (SELECT group_concat(value, ' ') FROM json_tree(new.parts) WHERE type = 'text' AND json_valid(new.parts)));
+END;
+
+CREATE TRIGGER IF NOT EXISTS words_fts_ad AFTER DELETE ON words BEGIN
+    DELETE FROM words_fts WHERE rowid = old.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS words_fts_au AFTER UPDATE ON words BEGIN
+    DELETE FROM words_fts WHERE rowid = old.id;
+    INSERT INTO words_fts (rowid, japanese, romaji, english, parts)
+    VALUES (new.id, new.japanese, new.romaji, new.english,
+            (SELECT group_concat(value, ' ') FROM json_tree(new.parts) WHERE type = 'text' AND json_valid(new.parts)));
+END;
+
+INSERT INTO words_fts (rowid, japanese, romaji, english, parts)
+SELECT id, japanese, romaji, english,
+       (SELECT group_concat(value, ' ') FROM json_tree(words.parts) WHERE type = 'text' AND json_valid(words.parts))
+FROM words;
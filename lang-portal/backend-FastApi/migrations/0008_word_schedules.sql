@@ -0,0 +1,16 @@
+-- Spaced-repetition state per (group, word); rows are created by the first
+-- review, so words reviewed before this migration start as new cards.
+CREATE TABLE IF NOT EXISTS word_schedules (
+    group_id INTEGER NOT NULL,
+    word_id INTEGER NOT NULL,
+    due_at TIMESTAMP NOT NULL,
+    interval_days FLOAT NOT NULL DEFAULT 0.0,
+    ease FLOAT NOT NULL DEFAULT 2.5,
+    repetitions INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (group_id, word_id),
+    FOREIGN KEY (group_id) REFERENCES groups (id),
+    FOREIGN KEY (word_id) REFERENCES words (id)
+);
+
+CREATE INDEX IF NOT EXISTS ix_word_schedules_group_due ON word_schedules (group_id, due_at, word_id);
+CREATE INDEX IF NOT EXISTS ix_word_schedules_word_id ON word_schedules (word_id);
@@ -0,0 +1,31 @@
+-- Per-day, per-group activity rollup; group_id 0 stands for "no group".
+-- The primary key leads with day, so date ranges are index range scans.
+CREATE TABLE IF NOT EXISTS daily_activity (
+    day DATE NOT NULL,
+    group_id INTEGER NOT NULL DEFAULT 0,
+    reviews INTEGER NOT NULL DEFAULT 0,
+    correct INTEGER NOT NULL DEFAULT 0,
+    sessions INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, group_id)
+);
+
+-- Backfill from existing history; scripts/backfill_daily_activity.py rebuilds
+-- the same rollup on demand
+INSERT INTO daily_activity (day, group_id, reviews, correct, sessions)
+SELECT day, group_id, SUM(reviews), SUM(correct), SUM(sessions)
+FROM (
+    SELECT
+        date(r.created_at) AS day,
+        COALESCE(s.group_id, 0) AS group_id,
+        COUNT(*) AS reviews,
+        SUM(CASE WHEN r.correct THEN 1 ELSE 0 END) AS correct,
+        0 AS sessions
+    FROM word_review_items r
+    LEFT JOIN study_sessions s ON s.id = r.study_session_id
+    GROUP BY 1, 2
+    UNION ALL
+    SELECT date(created_at), COALESCE(group_id, 0), 0, 0, COUNT(*)
+    FROM study_sessions
+    GROUP BY 1, 2
+)
+GROUP BY day, group_id;
@@ -0,0 +1,39 @@
+-- Denormalized per-group counters for GET /api/groups, kept in step by
+-- triggers. Keep in step with src/models/group_counters.py.
+ALTER TABLE groups ADD COLUMN word_count INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE groups ADD COLUMN session_count INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE groups ADD COLUMN last_studied_at TIMESTAMP;
+
+UPDATE groups SET
+    word_count = (SELECT COUNT(*) FROM words_groups WHERE group_id = groups.id),
+    session_count = (SELECT COUNT(*) FROM study_sessions WHERE group_id = groups.id),
+    last_studied_at = (SELECT MAX(created_at) FROM study_sessions WHERE group_id = groups.id);
+
+CREATE TRIGGER IF NOT EXISTS words_groups_count_ai AFTER INSERT ON words_groups BEGIN
+    UPDATE groups SET word_count = word_count + 1 WHERE id = new.group_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS words_groups_count_ad AFTER DELETE ON words_groups BEGIN
+    UPDATE groups SET word_count = word_count - 1 WHERE id = old.group_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS words_groups_count_au AFTER UPDATE OF group_id ON words_groups BEGIN
+    UPDATE groups SET word_count = word_count - 1 WHERE id = old.group_id;
+    UPDATE groups SET word_count = word_count + 1 WHERE id = new.group_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS study_sessions_count_ai AFTER INSERT ON study_sessions BEGIN
+    UPDATE groups
+    SET session_count = session_count + 1,
+        last_studied_at = max(coalesce(last_studied_at, new.created_at), new.created_at)
+    WHERE id = new.group_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS study_sessions_count_ad AFTER DELETE ON study_sessions BEGIN
+    UPDATE groups
+    SET session_count = session_count - 1,
+        last_studied_at = (
+            SELECT max(created_at) FROM study_sessions WHERE group_id = old.group_id
+        )
+    WHERE id = old.group_id;
+END;
@@ -0,0 +1,37 @@
+-- Kanji and kana characters of each word's japanese text and parts, for
+-- GET /api/words?contains_char=. Kept in step by WordPartService; the
+-- backfill mirrors char_kind() in src/core/japanese.py.
+CREATE TABLE IF NOT EXISTS word_parts (
+    char VARCHAR NOT NULL,
+    word_id INTEGER NOT NULL,
+    kind VARCHAR NOT NULL,
+    PRIMARY KEY (char, word_id),
+    FOREIGN KEY (word_id) REFERENCES words (id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS ix_word_parts_word_id ON word_parts (word_id);
+
+WITH RECURSIVE
+    texts (word_id, rest) AS (
+        SELECT id, japanese FROM words
+        UNION ALL
+        SELECT words.id, tree.value
+        FROM words, json_tree(words.parts) AS tree
+        WHERE json_valid(words.parts) AND tree.type = 'text'
+    ),
+    chars (word_id, char, rest) AS (
+        SELECT word_id, substr(rest, 1, 1), substr(rest, 2) FROM texts WHERE rest <> ''
+        UNION ALL
+        SELECT word_id, substr(rest, 1, 1), substr(rest, 2) FROM chars WHERE rest <> ''
+    ),
+    kinds (word_id, char, kind) AS (
+        SELECT word_id, char, CASE
+            WHEN unicode(char) BETWEEN 19968 AND 40959 OR unicode(char) BETWEEN 13312 AND 19903
+                THEN 'kanji'
+            WHEN unicode(char) BETWEEN 12353 AND 12438 THEN 'hiragana'
+            WHEN unicode(char) BETWEEN 12449 AND 12534 OR char = 'ー' THEN 'katakana'
+        END
+        FROM chars
+    )
+INSERT OR IGNORE INTO word_parts (char, word_id, kind)
+SELECT char, word_id, kind FROM kinds WHERE kind IS NOT NULL;
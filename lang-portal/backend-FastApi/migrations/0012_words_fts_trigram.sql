@@ -0,0 +1,30 @@
+-- Substring index over the Japanese text of words. unicode61 (words_fts)
+-- treats an unspaced run of Japanese as one token, so only whole words or
+-- their starts match there; trigram matches any substring (LIKE '%...%').
+-- Keep in step with src/models/word_search.py.
+CREATE VIRTUAL TABLE IF NOT EXISTS words_fts_ja USING fts5(
+    japanese, parts,
+    tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS words_fts_ja_ai AFTER INSERT ON words BEGIN
+    INSERT INTO words_fts_ja (rowid, japanese, parts)
+    VALUES (new.id, new.japanese,
+            (SELECT group_concat(value, ' ') FROM json_tree(new.parts) WHERE type = 'text' AND json_valid(new.parts)));
+END;
+
+CREATE TRIGGER IF NOT EXISTS words_fts_ja_ad AFTER DELETE ON words BEGIN
+    DELETE FROM words_fts_ja WHERE rowid = old.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS words_fts_ja_au AFTER UPDATE ON words BEGIN
+    DELETE FROM words_fts_ja WHERE rowid = old.id;
+    INSERT INTO words_fts_ja (rowid, japanese, parts)
+    VALUES (new.id, new.japanese,
+            (SELECT group_concat(value, ' ') FROM json_tree(new.parts) WHERE type = 'text' AND json_valid(new.parts)));
+END;
+
+INSERT INTO words_fts_ja (rowid, japanese, parts)
+SELECT id, japanese,
+       (SELECT group_concat(value, ' ') FROM json_tree(words.parts) WHERE type = 'text' AND json_valid(words.parts))
+FROM words;
@@ -0,0 +1,162 @@
+-- PostgreSQL schema, equivalent to migrations/0001-0011 applied to SQLite.
+-- PostgreSQL databases start their own history here; schema changes from
+-- now on add a migration to both directories.
+--
+-- Differences from SQLite: the group counters are plpgsql trigger
+-- functions, and there is no words_fts table (GET /api/words/search falls
+-- back to substring matching).
+
+CREATE TABLE IF NOT EXISTS groups (
+    id SERIAL PRIMARY KEY,
+    name VARCHAR NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+    updated_at TIMESTAMP WITH TIME ZONE,
+    word_count INTEGER NOT NULL DEFAULT 0,
+    session_count INTEGER NOT NULL DEFAULT 0,
+    last_studied_at TIMESTAMP WITH TIME ZONE
+);
+
+CREATE TABLE IF NOT EXISTS words (
+    id SERIAL PRIMARY KEY,
+    japanese VARCHAR NOT NULL,
+    romaji VARCHAR NOT NULL,
+    english VARCHAR NOT NULL,
+    parts JSON,
+    updated_at TIMESTAMP WITH TIME ZONE
+);
+
+CREATE INDEX IF NOT EXISTS ix_words_japanese_romaji ON words (japanese, romaji);
+
+CREATE TABLE IF NOT EXISTS words_groups (
+    word_id INTEGER NOT NULL REFERENCES words (id),
+    group_id INTEGER NOT NULL REFERENCES groups (id),
+    updated_at TIMESTAMP WITH TIME ZONE,
+    PRIMARY KEY (word_id, group_id)
+);
+
+CREATE INDEX IF NOT EXISTS ix_words_groups_group_id ON words_groups (group_id, word_id);
+
+CREATE TABLE IF NOT EXISTS study_activities (
+    id SERIAL PRIMARY KEY,
+    name VARCHAR NOT NULL,
+    type VARCHAR NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now()
+);
+
+CREATE TABLE IF NOT EXISTS study_sessions (
+    id SERIAL PRIMARY KEY,
+    group_id INTEGER REFERENCES groups (id),
+    study_activity_id INTEGER REFERENCES study_activities (id),
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS ix_study_sessions_created_at ON study_sessions (created_at, id);
+CREATE INDEX IF NOT EXISTS ix_study_sessions_group_id_created_at ON study_sessions (group_id, created_at);
+
+CREATE TABLE IF NOT EXISTS word_review_items (
+    id SERIAL PRIMARY KEY,
+    word_id INTEGER REFERENCES words (id),
+    study_session_id INTEGER REFERENCES study_sessions (id),
+    correct BOOLEAN NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS ix_word_review_items_session ON word_review_items (study_session_id, correct, word_id);
+CREATE INDEX IF NOT EXISTS ix_word_review_items_word_id ON word_review_items (word_id);
+
+CREATE TABLE IF NOT EXISTS word_review_stats (
+    word_id INTEGER PRIMARY KEY REFERENCES words (id),
+    correct_count INTEGER NOT NULL DEFAULT 0,
+    wrong_count INTEGER NOT NULL DEFAULT 0,
+    last_reviewed TIMESTAMP WITH TIME ZONE
+);
+
+CREATE TABLE IF NOT EXISTS change_versions (
+    table_name VARCHAR PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0
+);
+
+-- Random per-database epoch, so cached versions never carry over to a rebuilt database
+INSERT INTO change_versions (table_name, version)
+VALUES ('_epoch', floor(random() * 1000000000)::integer)
+ON CONFLICT DO NOTHING;
+
+CREATE TABLE IF NOT EXISTS change_log (
+    seq SERIAL PRIMARY KEY,
+    table_name VARCHAR NOT NULL,
+    op VARCHAR NOT NULL,
+    word_id INTEGER,
+    group_id INTEGER,
+    changed_at TIMESTAMP WITH TIME ZONE DEFAULT now()
+);
+
+CREATE TABLE IF NOT EXISTS word_schedules (
+    group_id INTEGER NOT NULL REFERENCES groups (id),
+    word_id INTEGER NOT NULL REFERENCES words (id),
+    due_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    interval_days FLOAT NOT NULL DEFAULT 0.0,
+    ease FLOAT NOT NULL DEFAULT 2.5,
+    repetitions INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (group_id, word_id)
+);
+
+CREATE INDEX IF NOT EXISTS ix_word_schedules_group_due ON word_schedules (group_id, due_at, word_id);
+CREATE INDEX IF NOT EXISTS ix_word_schedules_word_id ON word_schedules (word_id);
+
+CREATE TABLE IF NOT EXISTS daily_activity (
+    day DATE NOT NULL,
+    group_id INTEGER NOT NULL DEFAULT 0,
+    reviews INTEGER NOT NULL DEFAULT 0,
+    correct INTEGER NOT NULL DEFAULT 0,
+    sessions INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, group_id)
+);
+
+CREATE TABLE IF NOT EXISTS word_parts (
+    char VARCHAR NOT NULL,
+    word_id INTEGER NOT NULL REFERENCES words (id),
+    kind VARCHAR NOT NULL,
+    PRIMARY KEY (char, word_id)
+);
+
+CREATE INDEX IF NOT EXISTS ix_word_parts_word_id ON word_parts (word_id);
+
+-- Group counters; keep in step with src/models/group_counters.py
+CREATE OR REPLACE FUNCTION words_groups_count() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('DELETE', 'UPDATE') THEN
+        UPDATE groups SET word_count = word_count - 1 WHERE id = OLD.group_id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE groups SET word_count = word_count + 1 WHERE id = NEW.group_id;
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER words_groups_count
+AFTER INSERT OR DELETE OR UPDATE OF group_id ON words_groups
+FOR EACH ROW EXECUTE FUNCTION words_groups_count();
+
+CREATE OR REPLACE FUNCTION study_sessions_count() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE groups
+        SET session_count = session_count + 1,
+            last_studied_at = greatest(last_studied_at, NEW.created_at)
+        WHERE id = NEW.group_id;
+    ELSE
+        UPDATE groups
+        SET session_count = session_count - 1,
+            last_studied_at = (
+                SELECT max(created_at) FROM study_sessions WHERE group_id = OLD.group_id
+            )
+        WHERE id = OLD.group_id;
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER study_sessions_count
+AFTER INSERT OR DELETE ON study_sessions
+FOR EACH ROW EXECUTE FUNCTION study_sessions_count();
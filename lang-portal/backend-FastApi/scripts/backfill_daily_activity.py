@@ -0,0 +1,30 @@
+from sqlalchemy import delete, insert
+from .utils import setup_path
+
+setup_path()
+from src.core.database import SessionLocal
+from src.models.daily_activity import DailyActivity
+from src.models import group, study_activity, word, word_review_stats  # noqa: F401 - registers mappers
+from src.services.activity_service import rollup_from_history
+
+def backfill_daily_activity(db) -> int:
+    """Rebuild the daily_activity rollup from review and session history"""
+    db.execute(delete(DailyActivity))
+    result = db.execute(
+        insert(DailyActivity).from_select(
+            ["day", "group_id", "reviews", "correct", "sessions"], rollup_from_history()
+        )
+    )
+    db.commit()
+    return result.rowcount
+
+def main():
+    db = SessionLocal()
+    try:
+        rows = backfill_daily_activity(db)
+        print(f"Rebuilt daily_activity: {rows} day/group row(s)")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
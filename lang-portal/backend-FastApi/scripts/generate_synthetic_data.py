@@ -0,0 +1,199 @@
+import argparse
+import itertools
+import random
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import case, create_engine, delete, func, insert, select
+from sqlalchemy.orm import Session
+from .utils import setup_path
+
+setup_path()
+from src.core.database import Base
+from src.models import (  # noqa: F401 - full schema for create_all
+    change_log, change_version, daily_activity, group_counters, word_schedule, word_search,
+)
+from src.models.group import Group
+from src.models.study_activity import StudyActivity
+from src.models.study_session import StudySession
+from src.models.word import Word, words_groups
+from src.models.word_part import WordPart
+from src.models.word_review import WordReviewItem
+from src.models.word_review_stats import WordReviewStats
+from src.services.change_service import record_loaded_vocabulary
+from src.services.version_service import bump_statement
+from src.services.word_part_service import word_part_rows
+from .backfill_daily_activity import backfill_daily_activity
+
+SYLLABLES = [
+    ("あ", "a"), ("い", "i"), ("う", "u"), ("え", "e"), ("お", "o"),
+    ("か", "ka"), ("き", "ki"), ("く", "ku"), ("け", "ke"), ("こ", "ko"),
+    ("さ", "sa"), ("し", "shi"), ("す", "su"), ("せ", "se"), ("そ", "so"),
+    ("た", "ta"), ("ち", "chi"), ("つ", "tsu"), ("て", "te"), ("と", "to"),
+    ("な", "na"), ("に", "ni"), ("ぬ", "nu"), ("ね", "ne"), ("の", "no"),
+    ("は", "ha"), ("ひ", "hi"), ("ふ", "fu"), ("へ", "he"), ("ほ", "ho"),
+    ("ま", "ma"), ("み", "mi"), ("む", "mu"), ("め", "me"), ("も", "mo"),
+    ("や", "ya"), ("ゆ", "yu"), ("よ", "yo"), ("ら", "ra"), ("り", "ri"),
+    ("る", "ru"), ("れ", "re"), ("ろ", "ro"), ("わ", "wa"), ("ん", "n"),
+]
+
+# Rows per executemany batch
+INSERT_BATCH_SIZE = 5000
+
+# Sessions are spread over this many days before now
+HISTORY_DAYS = 90
+
+def _zipf_cum_weights(n: int, s: float = 1.1):
+    """Cumulative Zipf weights: rank 1 is picked far more often than rank n"""
+    return list(itertools.accumulate(1 / (rank ** s) for rank in range(1, n + 1)))
+
+def _insert(db: Session, table, rows):
+    for start in range(0, len(rows), INSERT_BATCH_SIZE):
+        db.execute(insert(table), rows[start:start + INSERT_BATCH_SIZE])
+
+def _rebuild_review_stats(db: Session):
+    db.execute(delete(WordReviewStats))
+    db.execute(
+        insert(WordReviewStats).from_select(
+            ["word_id", "correct_count", "wrong_count", "last_reviewed"],
+            select(
+                WordReviewItem.word_id,
+                func.sum(case((WordReviewItem.correct == True, 1), else_=0)),
+                func.sum(case((WordReviewItem.correct == True, 0), else_=1)),
+                func.max(WordReviewItem.created_at),
+            ).group_by(WordReviewItem.word_id),
+        )
+    )
+
+def generate(
+    db: Session,
+    words: int = 1000,
+    groups: int = 10,
+    sessions: int = 100,
+    reviews: int = 10000,
+    seed: int = 0,
+) -> dict:
+    """Fill an empty database with reproducible synthetic data.
+
+    Group sizes, the words drawn for review and the sessions reviews land in
+    all follow Zipf-like skew, and every word gets its own success rate, so
+    the rollups and indexes see the uneven shape of real study history.
+    Returns the generated ids.
+    """
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+
+    word_rows = []
+    for i in range(1, words + 1):
+        syllables = [rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))]
+        word_rows.append({
+            "id": i,
+            "japanese": "".join(kana for kana, _ in syllables),
+            "romaji": "".join(romaji for _, romaji in syllables),
+            "english": f"word {i}",
+            "parts": {"hiragana": [kana for kana, _ in syllables]},
+            "updated_at": now,
+        })
+    _insert(db, Word, word_rows)
+    _insert(db, WordPart, [
+        part for row in word_rows for part in word_part_rows(row["id"], row["japanese"], row["parts"])
+    ])
+
+    group_ids = list(range(1, groups + 1))
+    _insert(db, Group, [
+        {"id": group_id, "name": f"Synthetic Group {group_id}", "updated_at": now}
+        for group_id in group_ids
+    ])
+
+    # Every word joins one group, some a second; low group ids are the big ones
+    group_weights = _zipf_cum_weights(groups, s=0.8)
+    members = {group_id: set() for group_id in group_ids}
+    for word_id in range(1, words + 1):
+        for group_id in rng.choices(group_ids, cum_weights=group_weights, k=rng.choice((1, 1, 2))):
+            members[group_id].add(word_id)
+    _insert(db, words_groups, [
+        {"word_id": word_id, "group_id": group_id, "updated_at": now}
+        for group_id, word_ids in members.items()
+        for word_id in sorted(word_ids)
+    ])
+
+    activity_id = db.scalar(
+        insert(StudyActivity)
+        .values(name="Synthetic Flashcards", type="flashcards")
+        .returning(StudyActivity.id)
+    )
+    active_groups = [group_id for group_id in group_ids if members[group_id]]
+    active_weights = _zipf_cum_weights(len(active_groups), s=0.8)
+    session_rows = [
+        {
+            "id": session_id,
+            "group_id": rng.choices(active_groups, cum_weights=active_weights)[0],
+            "study_activity_id": activity_id,
+            "created_at": now - timedelta(minutes=rng.randrange(HISTORY_DAYS * 24 * 60)),
+        }
+        for session_id in range(1, sessions + 1)
+    ] if active_groups else []
+    _insert(db, StudySession, session_rows)
+
+    # A few sessions and, within each group, a few words get most reviews
+    difficulty = {word_id: rng.uniform(0.5, 0.95) for word_id in range(1, words + 1)}
+    group_words = {group_id: sorted(word_ids) for group_id, word_ids in members.items()}
+    word_weights = {
+        group_id: _zipf_cum_weights(len(word_ids)) for group_id, word_ids in group_words.items()
+    }
+    review_rows = []
+    if session_rows:
+        session_weights = _zipf_cum_weights(len(session_rows), s=0.5)
+        for review_id in range(1, reviews + 1):
+            session = rng.choices(session_rows, cum_weights=session_weights)[0]
+            group_id = session["group_id"]
+            word_id = rng.choices(group_words[group_id], cum_weights=word_weights[group_id])[0]
+            review_rows.append({
+                "id": review_id,
+                "word_id": word_id,
+                "study_session_id": session["id"],
+                "correct": rng.random() < difficulty[word_id],
+                "created_at": session["created_at"] + timedelta(seconds=rng.randrange(1800)),
+            })
+    _insert(db, WordReviewItem, review_rows)
+
+    _rebuild_review_stats(db)
+    record_loaded_vocabulary(
+        db,
+        group_ids,
+        [row["id"] for row in word_rows],
+        [(word_id, group_id) for group_id, word_ids in members.items() for word_id in sorted(word_ids)],
+    )
+    db.execute(bump_statement(db, "study_activities", "study_sessions", "word_review_items"))
+    db.commit()
+    backfill_daily_activity(db)
+    return {
+        "word_ids": [row["id"] for row in word_rows],
+        "group_ids": group_ids,
+        "session_ids": [row["id"] for row in session_rows],
+        "activity_id": activity_id,
+        "reviews": len(review_rows),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic lang-portal database")
+    parser.add_argument("database", help="path of the SQLite file to create (must not exist)")
+    parser.add_argument("--words", type=int, default=10000)
+    parser.add_argument("--groups", type=int, default=50)
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--reviews", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    engine = create_engine(f"sqlite:///{args.database}")
+    with engine.connect() as conn:
+        if conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'table'").first():
+            parser.error(f"{args.database} already has tables; generate into a new file")
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        ids = generate(db, args.words, args.groups, args.sessions, args.reviews, args.seed)
+    print(
+        f"Generated {len(ids['word_ids'])} words, {len(ids['group_ids'])} groups, "
+        f"{len(ids['session_ids'])} sessions and {ids['reviews']} reviews in {args.database}"
+    )
+
+if __name__ == "__main__":
+    main()
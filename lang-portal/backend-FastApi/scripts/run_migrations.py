@@ -1,37 +1,226 @@
+import argparse
+import hashlib
 import sqlite3
 from pathlib import Path
+from sqlalchemy import create_engine, make_url, text
+from sqlalchemy.pool import NullPool
 from .utils import setup_path
 
 setup_path()
-from src.core.config import settings
+from src.core.config import settings, sync_database_url
 
-def run_migrations():
+SCHEMA_MIGRATIONS_DDL = """
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version TEXT PRIMARY KEY,
+        checksum TEXT NOT NULL,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+class MigrationError(Exception):
+    pass
+
+def database_path() -> Path:
+    return Path(settings.DATABASE_URL.replace("sqlite:///", ""))
+
+def is_sqlite(url: str) -> bool:
+    return make_url(url).get_backend_name() == "sqlite"
+
+def migration_files(migrations_dir: Path):
+    return sorted(Path(migrations_dir).glob("*.sql"))
+
+def checksum(migration_file: Path) -> str:
+    return hashlib.sha256(migration_file.read_bytes()).hexdigest()
+
+class SQLiteTarget:
+    """Migration history and execution on a SQLite file, through sqlite3"""
+
+    def __init__(self, db_path: Path):
+        # Autocommit mode: each migration manages its own transaction
+        self.conn = sqlite3.connect(db_path, isolation_level=None)
+
+    def has_user_tables(self) -> bool:
+        return self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' "
+            "AND name NOT LIKE 'sqlite_%' AND name != 'schema_migrations'"
+        ).fetchone() is not None
+
+    def has_history(self) -> bool:
+        return self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'schema_migrations'"
+        ).fetchone() is not None
+
+    def create_history(self):
+        self.conn.execute(SCHEMA_MIGRATIONS_DDL)
+
+    def applied(self) -> dict:
+        return dict(self.conn.execute("SELECT version, checksum FROM schema_migrations"))
+
+    def mark_applied(self, version: str, digest: str):
+        self.conn.execute(
+            "INSERT OR IGNORE INTO schema_migrations (version, checksum) VALUES (?, ?)",
+            (version, digest),
+        )
+
+    def apply(self, migration_file: Path):
+        """Run one migration file and record it, all in a single transaction"""
+        sql = migration_file.read_text()
+        try:
+            self.conn.executescript("BEGIN;\n" + sql + "\n;")
+            self.conn.execute(
+                "INSERT INTO schema_migrations (version, checksum) VALUES (?, ?)",
+                (migration_file.stem, checksum(migration_file)),
+            )
+            self.conn.execute("COMMIT")
+        except Exception:
+            if self.conn.in_transaction:
+                self.conn.execute("ROLLBACK")
+            raise
+
+    def close(self):
+        self.conn.close()
+
+class PostgresTarget:
+    """Migration history and execution on PostgreSQL, whose DDL is transactional too"""
+
+    def __init__(self, url: str):
+        self.engine = create_engine(sync_database_url(url), poolclass=NullPool)
+
+    def has_user_tables(self) -> bool:
+        with self.engine.connect() as conn:
+            return conn.exec_driver_sql(
+                "SELECT 1 FROM information_schema.tables WHERE table_schema = current_schema() "
+                "AND table_name != 'schema_migrations'"
+            ).first() is not None
+
+    def has_history(self) -> bool:
+        with self.engine.connect() as conn:
+            return conn.exec_driver_sql(
+                "SELECT 1 FROM information_schema.tables WHERE table_schema = current_schema() "
+                "AND table_name = 'schema_migrations'"
+            ).first() is not None
+
+    def create_history(self):
+        with self.engine.begin() as conn:
+            conn.exec_driver_sql(SCHEMA_MIGRATIONS_DDL)
+
+    def applied(self) -> dict:
+        with self.engine.connect() as conn:
+            return dict(conn.exec_driver_sql("SELECT version, checksum FROM schema_migrations").all())
+
+    def mark_applied(self, version: str, digest: str):
+        with self.engine.begin() as conn:
+            conn.execute(
+                text(
+                    "INSERT INTO schema_migrations (version, checksum) VALUES (:version, :checksum) "
+                    "ON CONFLICT DO NOTHING"
+                ),
+                {"version": version, "checksum": digest},
+            )
+
+    def apply(self, migration_file: Path):
+        """Run one migration file and record it, all in a single transaction"""
+        with self.engine.begin() as conn:
+            conn.exec_driver_sql(migration_file.read_text())
+            conn.execute(
+                text("INSERT INTO schema_migrations (version, checksum) VALUES (:version, :checksum)"),
+                {"version": migration_file.stem, "checksum": checksum(migration_file)},
+            )
+
+    def close(self):
+        self.engine.dispose()
+
+def run_migrations(
+    db_path: Path = None,
+    migrations_dir: Path = None,
+    baseline: str = None,
+    database_url: str = None,
+):
+    """Apply every migration not yet recorded in schema_migrations, in order.
+
+    SQLite databases (a `db_path`, or a sqlite DATABASE_URL) run the files in
+    migrations/; PostgreSQL runs its own history in migrations/postgresql/.
+    Already-applied files are checksummed and must not have changed. A
+    database created by the old drop-and-recreate runner has tables but no
+    history; pass `baseline` (e.g. "0001_init") to record the migrations up
+    to and including it as applied without running them.
+    """
+    url = database_url or (None if db_path else settings.DATABASE_URL)
+    if url is not None and not is_sqlite(url):
+        target = PostgresTarget(url)
+        migrations_dir = Path(migrations_dir or settings.MIGRATIONS_DIR / "postgresql")
+    else:
+        target = SQLiteTarget(Path(db_path or database_path()))
+        migrations_dir = Path(migrations_dir or settings.MIGRATIONS_DIR)
     print("Starting database migrations...")
-    conn = sqlite3.connect(settings.DATABASE_URL.replace("sqlite:///", ""))
-    cursor = conn.cursor()
-    
-    # Drop existing tables if they exist
-    cursor.executescript("""
-        DROP TABLE IF EXISTS word_review_items;
-        DROP TABLE IF EXISTS study_sessions;
-        DROP TABLE IF EXISTS study_activities;
-        DROP TABLE IF EXISTS words_groups;
-        DROP TABLE IF EXISTS words;
-        DROP TABLE IF EXISTS groups;
-    """)
-    
-    migrations_dir = Path(settings.MIGRATIONS_DIR)
-    migration_files = sorted(migrations_dir.glob("*.sql"))
-    
-    for migration_file in migration_files:
-        print(f"Running migration: {migration_file.name}")
-        with open(migration_file) as f:
-            sql = f.read()
-            cursor.executescript(sql)
-    
-    conn.commit()
-    conn.close()
-    print("Migrations completed successfully")
+
+    try:
+        legacy = target.has_user_tables() and not target.has_history()
+        target.create_history()
+
+        files = migration_files(migrations_dir)
+        if baseline:
+            if baseline not in {f.stem for f in files}:
+                raise MigrationError(f"Unknown baseline migration: {baseline}")
+            for migration_file in files:
+                if migration_file.stem > baseline:
+                    break
+                target.mark_applied(migration_file.stem, checksum(migration_file))
+                print(f"Baselined migration: {migration_file.name}")
+        elif legacy:
+            raise MigrationError(
+                "Database has tables but no schema_migrations history; rerun with "
+                "--baseline <last applied migration> or --fresh"
+            )
+
+        applied = target.applied()
+        pending = []
+        for migration_file in files:
+            version = migration_file.stem
+            if version in applied:
+                if applied[version] != checksum(migration_file):
+                    raise MigrationError(
+                        f"Migration {migration_file.name} was modified after being applied"
+                    )
+            else:
+                pending.append(migration_file)
+
+        for migration_file in pending:
+            print(f"Running migration: {migration_file.name}")
+            target.apply(migration_file)
+    finally:
+        target.close()
+
+    if pending:
+        print(f"Applied {len(pending)} migration(s) successfully")
+    else:
+        print("Database is up to date")
+
+def reset_database(db_path: Path = None, database_url: str = None):
+    """Start from an empty database: delete the SQLite file (and WAL side
+    files), or drop and recreate the PostgreSQL schema"""
+    url = database_url or (None if db_path else settings.DATABASE_URL)
+    if url is not None and not is_sqlite(url):
+        engine = create_engine(sync_database_url(url), poolclass=NullPool)
+        with engine.begin() as conn:
+            conn.exec_driver_sql("DROP SCHEMA public CASCADE; CREATE SCHEMA public")
+        engine.dispose()
+        return
+    db_path = Path(db_path or database_path())
+    for path in (db_path, Path(f"{db_path}-wal"), Path(f"{db_path}-shm")):
+        path.unlink(missing_ok=True)
 
 if __name__ == "__main__":
-    run_migrations() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Apply pending SQL migrations")
+    parser.add_argument(
+        "--fresh", action="store_true",
+        help="delete the database and rebuild it from all migrations",
+    )
+    parser.add_argument(
+        "--baseline", metavar="VERSION",
+        help="mark migrations up to VERSION as applied without running them",
+    )
+    args = parser.parse_args()
+    if args.fresh:
+        reset_database()
+    run_migrations(baseline=args.baseline)
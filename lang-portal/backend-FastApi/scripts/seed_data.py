@@ -1,48 +1,73 @@
 import json
 from pathlib import Path
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
 from .utils import setup_path
 
 setup_path()
 from src.core.database import SessionLocal
 from src.models.word import Word
 from src.models.group import Group
+from src.models.word_part import WordPart
+from src.services.change_service import record_loaded_vocabulary
+from src.services.word_part_service import word_part_rows
+
+def seed(db: Session):
+    # Seed basic groups
+    groups = {
+        "basic_greetings": Group(name="Basic Greetings"),
+        "numbers": Group(name="Numbers"),
+        "colors": Group(name="Colors"),
+        "family": Group(name="Family Members"),
+        "basic_verbs": Group(name="Basic Verbs"),
+        "foods": Group(name="Foods")
+    }
+
+    for group in groups.values():
+        db.add(group)
+    db.commit()
+
+    # Seed words from JSON files
+    seeds_dir = Path(__file__).parent.parent / "seeds"
+    words = []
+    for seed_file in seeds_dir.glob("*.json"):
+        group_name = seed_file.stem
+        if group_name in groups:
+            with open(seed_file) as f:
+                words_data = json.load(f)
+                # Handle both list and dictionary formats
+                if isinstance(words_data, dict) and "vocabulary" in words_data:
+                    words_list = words_data["vocabulary"]
+                else:
+                    words_list = words_data
+
+                for word_data in words_list:
+                    word = Word(**word_data)
+                    word.groups.append(groups[group_name])
+                    db.add(word)
+                    words.append(word)
+
+    # Index the kanji and kana of every word for ?contains_char=
+    db.flush()
+    part_rows = [
+        row for word in words for row in word_part_rows(word.id, word.japanese, word.parts)
+    ]
+    if part_rows:
+        db.execute(insert(WordPart), part_rows)
+
+    # Publish everything to the change feed, so a sync from the start sees it
+    record_loaded_vocabulary(
+        db,
+        [group.id for group in groups.values()],
+        [word.id for word in words],
+        [(word.id, group.id) for word in words for group in word.groups],
+    )
+    db.commit()
 
 def seed_data():
     db = SessionLocal()
     try:
-        # Seed basic groups
-        groups = {
-            "basic_greetings": Group(name="Basic Greetings"),
-            "numbers": Group(name="Numbers"),
-            "colors": Group(name="Colors"),
-            "family": Group(name="Family Members"),
-            "basic_verbs": Group(name="Basic Verbs"),
-            "foods": Group(name="Foods")
-        }
-        
-        for group in groups.values():
-            db.add(group)
-        db.commit()
-
-        # Seed words from JSON files
-        seeds_dir = Path(__file__).parent.parent / "seeds"
-        for seed_file in seeds_dir.glob("*.json"):
-            group_name = seed_file.stem
-            if group_name in groups:
-                with open(seed_file) as f:
-                    words_data = json.load(f)
-                    # Handle both list and dictionary formats
-                    if isinstance(words_data, dict) and "vocabulary" in words_data:
-                        words_list = words_data["vocabulary"]
-                    else:
-                        words_list = words_data
-                        
-                    for word_data in words_list:
-                        word = Word(**word_data)
-                        word.groups.append(groups[group_name])
-                        db.add(word)
-        
-        db.commit()
+        seed(db)
     finally:
         db.close()
 
@@ -1,4 +1,4 @@
 #!/bin/bash
 export PYTHONPATH=.
-python -m scripts.run_migrations
+python -m scripts.run_migrations --fresh
 python -m scripts.seed_data 
\ No newline at end of file
@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from ..core.database import get_db
+from ..core.pagination import decode_cursor, encode_cursor
+from ..services.change_service import ChangeService
+from ..schemas.change import ChangeFeed
+
+router = APIRouter()
+
+@router.get("/changes", response_model=ChangeFeed)
+async def get_changes(
+    since: Optional[str] = None,
+    limit: int = Query(500, ge=1, le=5000),
+    db: AsyncSession = Depends(get_db)
+):
+    """Vocabulary changes after the `since` token; omit it to sync from the start.
+
+    Store `next_token` and pass it as `since` on the next call. Keep paging
+    while `has_more` is true.
+    """
+    after = decode_cursor(since)
+    since_seq = after[0] if after else 0
+    if not isinstance(since_seq, int) or isinstance(since_seq, bool) or len(after or [0]) != 1:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    feed = await ChangeService.get_changes(db, since_seq, limit)
+    return {
+        "changes": feed["changes"],
+        "next_token": encode_cursor([feed["last_seq"]]),
+        "has_more": feed["has_more"],
+    }
@@ -1,14 +1,20 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from ..core.database import get_db
 from ..services.dashboard_service import DashboardService
-from ..schemas.dashboard import LastStudySession, StudyProgress, QuickStats
+from ..schemas.dashboard import LastStudySession, StudyProgress, QuickStats, DashboardSummary
 from ..services.study_session_service import StudySessionService
 
 router = APIRouter()
 
+@router.get("/dashboard/summary", response_model=DashboardSummary)
+async def get_dashboard_summary(db: AsyncSession = Depends(get_db)):
+    """Study progress, quick stats and the last session from one aggregated query,
+    plus the streak lookup"""
+    return await DashboardService.get_summary(db)
+
 @router.get("/dashboard/last_study_session")
-async def get_last_study_session(db: Session = Depends(get_db)):
+async def get_last_study_session(db: AsyncSession = Depends(get_db)):
     try:
         session = await StudySessionService.get_latest_session(db)
         if not session:
@@ -37,9 +43,9 @@ async def get_last_study_session(db: Session = Depends(get_db)):
         }
 
 @router.get("/dashboard/study_progress", response_model=StudyProgress)
-async def get_study_progress(db: Session = Depends(get_db)):
+async def get_study_progress(db: AsyncSession = Depends(get_db)):
     return await DashboardService.get_study_progress(db)
 
 @router.get("/dashboard/quick-stats", response_model=QuickStats)
-async def get_quick_stats(db: Session = Depends(get_db)):
+async def get_quick_stats(db: AsyncSession = Depends(get_db)):
     return await DashboardService.get_quick_stats(db) 
\ No newline at end of file
@@ -0,0 +1,58 @@
+import hashlib
+from fastapi import Depends, HTTPException, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict
+from ..core.database import get_db
+from ..core.snapshot_cache import PageSnapshot
+from ..services.version_service import VersionService
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so ignore any W/ prefix
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
+
+async def _check_etag(
+    request: Request, response: Response, db: AsyncSession, tables
+) -> Dict[str, int]:
+    versions = await VersionService.get_versions(db, tables)
+    fingerprint = "|".join(
+        [str(request.url.path), str(request.url.query)]
+        + [f"{table}={version}" for table, version in sorted(versions.items())]
+    )
+    etag = '"' + hashlib.sha1(fingerprint.encode()).hexdigest() + '"'
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        raise HTTPException(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return versions
+
+def conditional_get(*tables: str):
+    """Dependency that answers 304 Not Modified before the endpoint runs.
+
+    The strong ETag is derived from the change versions of `tables` (the
+    tables the endpoint's response is built from) and the request URL, so a
+    matching If-None-Match costs one lookup in change_versions.
+    """
+    async def dependency(
+        request: Request, response: Response, db: AsyncSession = Depends(get_db)
+    ):
+        await _check_etag(request, response, db, tables)
+
+    return Depends(dependency)
+
+def cached_page(*tables: str):
+    """conditional_get that also hands the endpoint a PageSnapshot.
+
+    The page is cached under its URL against the same versions the ETag
+    is built from, so the one change_versions lookup serves both.
+    """
+    async def dependency(
+        request: Request, response: Response, db: AsyncSession = Depends(get_db)
+    ) -> PageSnapshot:
+        versions = await _check_etag(request, response, db, tables)
+        return PageSnapshot((request.url.path, request.url.query), versions, response)
+
+    return Depends(dependency)
@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from ..core.database import get_sessionmaker
+from ..services.export_service import ExportService, MEDIA_TYPES
+from ..schemas.export import ExportDataset, ExportFormat
+
+router = APIRouter()
+
+@router.get("/export/{dataset}", response_class=StreamingResponse)
+async def export_dataset(
+    dataset: ExportDataset,
+    format: ExportFormat = ExportFormat.ndjson,
+    sessionmaker: async_sessionmaker = Depends(get_sessionmaker)
+):
+    """Stream every row of words, reviews or sessions as NDJSON or CSV"""
+    return StreamingResponse(
+        ExportService.stream(sessionmaker, dataset, format),
+        media_type=MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{dataset.value}.{format.value}"'
+        },
+    )
@@ -1,49 +1,128 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 from ..core.database import get_db
+from ..core.pagination import decode_cursor, set_next_cursor, TOTAL_COUNT_HEADER
+from ..core.responses import encode_rows
+from ..core.snapshot_cache import PageSnapshot
+from .deps import cached_page, conditional_get
 from ..services.group_service import GroupService
-from ..schemas.group import Group, GroupCreate, GroupDetail
-from ..schemas.word import Word
+from ..services.schedule_service import ScheduleService
+from ..schemas.group import Group, GroupCreate, GroupDetail, GroupWordsAdd
+from ..schemas.word import WordWithStats, WordSortField, SortOrder
 from ..schemas.study_session import StudySession
+from ..schemas.word_review import DueWord
 
 router = APIRouter()
 
 @router.get("/groups", response_model=List[Group])
 async def get_groups(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    page: PageSnapshot = cached_page("groups", "words_groups", "study_sessions"),
+    db: AsyncSession = Depends(get_db)
 ):
-    return await GroupService.get_groups(db, skip, limit)
+    cached = page.cached()
+    if cached is not None:
+        return cached
+    groups = await GroupService.get_groups(db, skip, limit, decode_cursor(cursor))
+    set_next_cursor(response, groups, limit, lambda group: [group.id])
+    return page.store(encode_rows(groups))
 
-@router.get("/groups/{group_id}", response_model=GroupDetail)
-async def get_group(group_id: int, db: Session = Depends(get_db)):
+@router.get(
+    "/groups/{group_id}",
+    response_model=GroupDetail,
+    dependencies=[conditional_get("groups", "words", "words_groups", "study_sessions")],
+)
+async def get_group(group_id: int, db: AsyncSession = Depends(get_db)):
     group = await GroupService.get_group(db, group_id)
     if group is None:
         raise HTTPException(status_code=404, detail="Group not found")
     return group
 
-@router.get("/groups/{group_id}/words", response_model=List[Word])
+@router.get("/groups/{group_id}/words", response_model=List[WordWithStats])
 async def get_group_words(
     group_id: int,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    sort_by: WordSortField = WordSortField.id,
+    order: SortOrder = SortOrder.asc,
+    include_total: bool = False,
+    page: PageSnapshot = cached_page("groups", "words", "words_groups", "word_review_items"),
+    db: AsyncSession = Depends(get_db)
 ):
-    words = await GroupService.get_group_words(db, group_id, skip, limit)
+    cached = page.cached()
+    if cached is not None:
+        return cached
+    words = await GroupService.get_group_words(
+        db, group_id, skip, limit, decode_cursor(cursor), sort_by, order
+    )
     if words is None:
         raise HTTPException(status_code=404, detail="Group not found")
-    return words
+    if include_total:
+        response.headers[TOTAL_COUNT_HEADER] = str(
+            await GroupService.count_group_words(db, group_id)
+        )
+    sort_key = (
+        (lambda word: [word.id]) if sort_by == WordSortField.id
+        else (lambda word: [getattr(word, sort_by.value), word.id])
+    )
+    set_next_cursor(response, words, limit, sort_key)
+    return page.store(encode_rows(words))
+
+@router.get("/groups/{group_id}/due", response_model=List[DueWord])
+async def get_group_due_words(
+    group_id: int,
+    limit: int = Query(20, ge=1, le=100),
+    include_new: bool = True,
+    db: AsyncSession = Depends(get_db)
+):
+    """Next words to review in a group, most overdue first"""
+    due = await ScheduleService.get_due(db, group_id, limit, include_new)
+    if due is None:
+        raise HTTPException(status_code=404, detail="Group not found")
+    return due
 
 @router.post("/groups", response_model=Group)
-async def create_group(group: GroupCreate, db: Session = Depends(get_db)):
+async def create_group(group: GroupCreate, db: AsyncSession = Depends(get_db)):
     return await GroupService.create_group(db, group)
 
+@router.delete("/groups/{group_id}", status_code=204)
+async def delete_group(group_id: int, db: AsyncSession = Depends(get_db)):
+    try:
+        deleted = await GroupService.delete_group(db, group_id)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    if not deleted:
+        raise HTTPException(status_code=404, detail="Group not found")
+
+@router.post("/groups/{group_id}/words")
+async def add_group_words(
+    group_id: int,
+    body: GroupWordsAdd,
+    db: AsyncSession = Depends(get_db)
+):
+    try:
+        added = await GroupService.add_words(db, group_id, body.word_ids)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    if added is None:
+        raise HTTPException(status_code=404, detail="Group not found")
+    return {"added": added}
+
+@router.delete("/groups/{group_id}/words/{word_id}", status_code=204)
+async def remove_group_word(group_id: int, word_id: int, db: AsyncSession = Depends(get_db)):
+    if not await GroupService.remove_word(db, group_id, word_id):
+        raise HTTPException(status_code=404, detail="Word is not in this group")
+
 @router.get("/groups/{group_id}/study_sessions", response_model=List[StudySession])
 async def get_group_study_sessions(
     group_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Get all study sessions for a specific group"""
     try:
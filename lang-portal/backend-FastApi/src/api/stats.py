@@ -0,0 +1,31 @@
+from datetime import date, timedelta
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from ..core.database import get_db
+from ..services.activity_service import ActivityService, Bucket, utc_today
+from ..schemas.stats import TimeseriesPoint
+
+router = APIRouter()
+
+# Widest range one timeseries request may cover
+MAX_TIMESERIES_DAYS = 3660
+
+@router.get("/stats/timeseries", response_model=List[TimeseriesPoint])
+async def get_timeseries(
+    from_: Optional[date] = Query(None, alias="from"),
+    to: Optional[date] = None,
+    bucket: Bucket = Bucket.day,
+    group_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """Reviews, correct answers and sessions per bucket; defaults to the last 30 days"""
+    to = to or utc_today()
+    from_ = from_ or to - timedelta(days=29)
+    if from_ > to:
+        raise HTTPException(status_code=400, detail="from must not be after to")
+    if (to - from_).days >= MAX_TIMESERIES_DAYS:
+        raise HTTPException(
+            status_code=400, detail=f"Range is limited to {MAX_TIMESERIES_DAYS} days"
+        )
+    return await ActivityService.get_timeseries(db, from_, to, bucket, group_id)
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 from ..core.database import get_db
+from ..core.pagination import decode_cursor, set_next_cursor
 from ..services.study_activity_service import StudyActivityService
 from ..schemas.study_activity import StudyActivity, StudyActivityCreate, StudyActivityDetail
 
@@ -9,14 +10,20 @@ router = APIRouter()
 
 @router.get("/study_activities", response_model=List[StudyActivity])
 async def get_study_activities(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
 ):
-    return await StudyActivityService.get_study_activities(db, skip, limit)
+    activities = await StudyActivityService.get_study_activities(
+        db, skip, limit, decode_cursor(cursor)
+    )
+    set_next_cursor(response, activities, limit, lambda activity: [activity.id])
+    return activities
 
 @router.get("/study_activities/{activity_id}", response_model=StudyActivityDetail)
-async def get_study_activity(activity_id: int, db: Session = Depends(get_db)):
+async def get_study_activity(activity_id: int, db: AsyncSession = Depends(get_db)):
     activity = await StudyActivityService.get_study_activity(db, activity_id)
     if activity is None:
         raise HTTPException(status_code=404, detail="Study activity not found")
@@ -1,22 +1,37 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Body, Depends, HTTPException, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 from ..core.database import get_db
+from ..core.pagination import decode_cursor, set_next_cursor
+from ..core.responses import rows_response
 from ..services.study_session_service import StudySessionService
+from ..services.review_service import ReviewService
 from ..schemas.study_session import StudySession, StudySessionCreate, StudySessionDetail
+from ..schemas.word_review import (
+    WordReviewCreate, WordReviewResult, WordReviewBatchItem, StudySessionStats
+)
 
 router = APIRouter()
 
+# Upper bound on reviews accepted by one batch request
+MAX_REVIEW_BATCH = 1000
+
 @router.get("/study_sessions", response_model=List[StudySession])
 async def get_study_sessions(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
 ):
-    return await StudySessionService.get_study_sessions(db, skip, limit)
+    sessions = await StudySessionService.get_study_sessions(
+        db, skip, limit, decode_cursor(cursor)
+    )
+    set_next_cursor(response, sessions, limit, lambda session: [session.id])
+    return rows_response(sessions, response)
 
 @router.get("/study_sessions/{session_id}", response_model=StudySessionDetail)
-async def get_study_session(session_id: int, db: Session = Depends(get_db)):
+async def get_study_session(session_id: int, db: AsyncSession = Depends(get_db)):
     session = await StudySessionService.get_study_session(db, session_id)
     if session is None:
         raise HTTPException(status_code=404, detail="Study session not found")
@@ -25,6 +40,45 @@ async def get_study_session(session_id: int, db: Session = Depends(get_db)):
 @router.post("/study_sessions", response_model=StudySession)
 async def create_study_session(
     session: StudySessionCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
+):
+    return await StudySessionService.create_study_session(db, session) 
+
+@router.post(
+    "/study_sessions/{session_id}/words/{word_id}/review",
+    response_model=WordReviewResult,
+)
+async def review_word(
+    session_id: int,
+    word_id: int,
+    review: WordReviewCreate,
+    db: AsyncSession = Depends(get_db)
 ):
-    return await StudySessionService.create_study_session(db, session) 
\ No newline at end of file
+    review_item = await ReviewService.record_review(db, session_id, word_id, review.correct)
+    if review_item is None:
+        raise HTTPException(status_code=404, detail="Study session or word not found")
+    return WordReviewResult(
+        word_id=review_item.word_id,
+        study_session_id=review_item.study_session_id,
+        correct=review_item.correct,
+        created_at=review_item.created_at,
+    )
+
+@router.post(
+    "/study_sessions/{session_id}/reviews:batch",
+    response_model=StudySessionStats,
+)
+async def review_words_batch(
+    session_id: int,
+    reviews: List[WordReviewBatchItem] = Body(..., max_length=MAX_REVIEW_BATCH),
+    db: AsyncSession = Depends(get_db)
+):
+    """Record a whole study session's reviews in one request and one commit"""
+    try:
+        stats = await ReviewService.record_reviews(db, session_id, reviews)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    if stats is None:
+        raise HTTPException(status_code=404, detail="Study session not found")
+    return stats
+
@@ -1,39 +1,149 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from ..core import japanese as ja
 from ..core.database import get_db
-from ..services.word_service import WordService
-from ..schemas.word import Word, WordCreate, WordUpdate, WordWithStats
+from ..core.pagination import decode_cursor, set_next_cursor
+from ..core.json_stream import iter_json_array, iter_ndjson
+from ..core.responses import encode_rows
+from ..core.snapshot_cache import PageSnapshot
+from .deps import cached_page, conditional_get
+from ..services.word_service import WordImportError, WordService
+from ..schemas.word import Word, WordCreate, WordPatch, WordUpdate, WordWithStats, WordImportResult
 
 router = APIRouter()
 
-@router.get("/words", response_model=List[Word])
+# Most ids one GET /words?ids= request may ask for
+MAX_IDS = 500
+
+def _parse_ids(ids: str) -> List[int]:
+    try:
+        parsed = [int(part) for part in ids.split(",") if part.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids must be comma-separated integers")
+    if len(parsed) > MAX_IDS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_IDS} ids per request")
+    return parsed
+
+def _parse_char(contains_char: str) -> str:
+    char = ja.normalize(contains_char)
+    if len(char) != 1 or ja.char_kind(char) is None:
+        raise HTTPException(
+            status_code=400, detail="contains_char must be a single kanji or kana character"
+        )
+    return char
+
+@router.get("/words", response_model=List[WordWithStats])
 async def get_words(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    ids: Optional[str] = Query(None, description="Comma-separated ids; returns those words in this order"),
+    contains_char: Optional[str] = Query(None, description="Only words containing this kanji or kana"),
+    page: PageSnapshot = cached_page("words", "word_review_items"),
+    db: AsyncSession = Depends(get_db)
 ):
-    words = await WordService.get_words(db, skip, limit)
+    cached = page.cached()
+    if cached is not None:
+        return cached
+    if ids is not None:
+        words = await WordService.get_words_by_ids(db, _parse_ids(ids))
+    else:
+        words = await WordService.get_words(
+            db, skip, limit, decode_cursor(cursor),
+            _parse_char(contains_char) if contains_char is not None else None,
+        )
+        set_next_cursor(response, words, limit, lambda word: [word.id])
+    return page.store(encode_rows(words))
+
+@router.get("/words/random", response_model=List[WordWithStats])
+async def get_random_words(
+    n: int = Query(10, ge=1, le=100),
+    group_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """n distinct words picked at random, optionally from one group"""
+    words = await WordService.get_random_words(db, n, group_id)
+    if words is None:
+        raise HTTPException(status_code=404, detail="Group not found")
     return words
 
-@router.get("/words/{word_id}", response_model=WordWithStats)
-async def get_word(word_id: int, db: Session = Depends(get_db)):
+@router.get(
+    "/words/search",
+    response_model=List[WordWithStats],
+    dependencies=[conditional_get("words", "word_review_items")],
+)
+async def search_words(
+    q: str = Query(..., min_length=1, description="Japanese, kana, romaji or English"),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db)
+):
+    return await WordService.search_words(db, q, limit)
+
+@router.get(
+    "/words/{word_id}",
+    response_model=WordWithStats,
+    dependencies=[conditional_get("words", "word_review_items")],
+)
+async def get_word(word_id: int, db: AsyncSession = Depends(get_db)):
     word = await WordService.get_word(db, word_id)
     if word is None:
         raise HTTPException(status_code=404, detail="Word not found")
     return word
 
 @router.post("/words", response_model=Word)
-async def create_word(word: WordCreate, db: Session = Depends(get_db)):
+async def create_word(word: WordCreate, db: AsyncSession = Depends(get_db)):
     return await WordService.create_word(db, word)
 
 @router.put("/words/{word_id}", response_model=Word)
 async def update_word(
     word_id: int,
     word: WordUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     updated_word = await WordService.update_word(db, word_id, word)
     if updated_word is None:
         raise HTTPException(status_code=404, detail="Word not found")
-    return updated_word 
\ No newline at end of file
+    return updated_word 
+
+@router.patch("/words:batch", response_model=List[Word])
+async def patch_words(patches: List[WordPatch], db: AsyncSession = Depends(get_db)):
+    """Partially update many words in one transaction; unknown ids reject the whole batch"""
+    try:
+        return await WordService.patch_words(db, patches)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+@router.delete("/words/{word_id}", status_code=204)
+async def delete_word(word_id: int, db: AsyncSession = Depends(get_db)):
+    if not await WordService.delete_word(db, word_id):
+        raise HTTPException(status_code=404, detail="Word not found")
+
+@router.post("/words:import", response_model=WordImportResult)
+async def import_words(
+    request: Request,
+    group_id: Optional[int] = None,
+    batch_size: int = Query(1000, ge=1, le=5000),
+    db: AsyncSession = Depends(get_db)
+):
+    """Stream a JSON array (or {"vocabulary": [...]}) or NDJSON body into the words table.
+
+    Batches are committed as they fill, so a body that turns out malformed is
+    imported up to that point: the 400 reports the progress and the `offset`
+    of the unreadable item, from which a retry can resume.
+    """
+    if "ndjson" in request.headers.get("content-type", ""):
+        items = iter_ndjson(request.stream())
+    else:
+        items = iter_json_array(request.stream())
+    try:
+        result = await WordService.import_words(db, items, group_id, batch_size)
+    except WordImportError as e:
+        raise HTTPException(
+            status_code=400, detail={"error": str(e), "offset": e.offset, **e.result}
+        )
+    if result is None:
+        raise HTTPException(status_code=404, detail="Group not found")
+    return result
+
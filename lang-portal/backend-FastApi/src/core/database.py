@@ -1,24 +1,89 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, make_url
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from .config import settings
+from .metrics import instrument_engine
 
-# Create SQLite engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False}  # Needed for SQLite
-)
+def engine_options(url: str) -> dict:
+    """create_engine / create_async_engine arguments for the URL's backend.
+
+    SQLite keeps the default pool. PostgreSQL gets a sized QueuePool with
+    pre-ping, so connections dropped by the server are replaced instead of
+    failing a request, plus a per-connection statement timeout and UTC
+    session time zone.
+    """
+    url = make_url(url)
+    if url.get_backend_name() == "sqlite":
+        return {"connect_args": {"check_same_thread": False}}
+
+    session = {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS), "timezone": "UTC"}
+    if url.get_driver_name() == "asyncpg":
+        connect_args = {"server_settings": session}
+    else:
+        # libpq drivers (psycopg2, psycopg) take them as startup options
+        connect_args = {"options": " ".join(f"-c {k}={v}" for k, v in session.items())}
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": True,
+        "connect_args": connect_args,
+    }
+
+# Synchronous engine, used by scripts under scripts/
+engine = create_engine(settings.SYNC_DATABASE_URL, **engine_options(settings.DATABASE_URL))
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for the API, so queries don't block the event loop
+async_engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL, **engine_options(settings.ASYNC_DATABASE_URL)
+)
+
+# Objects stay usable after commit; lazy loads are not allowed under asyncio
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """WAL lets dashboard reads proceed while reviews are being written"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+    cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE}")
+    cursor.execute(f"PRAGMA cache_size={settings.SQLITE_CACHE_SIZE}")
+    cursor.execute(f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.close()
+
+def configure_sqlite(sync_engine):
+    """Register the connection pragmas on a (sync) SQLite engine"""
+    if sync_engine.dialect.name == "sqlite":
+        event.listen(sync_engine, "connect", _set_sqlite_pragmas)
+
+configure_sqlite(engine)
+configure_sqlite(async_engine.sync_engine)
+instrument_engine(async_engine.sync_engine)
+
+# INSERT constructs with ON CONFLICT support, per dialect
+_DIALECT_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+def dialect_insert(db: AsyncSession, table):
+    """INSERT for `table` in the session's dialect, for on_conflict_do_update/do_nothing"""
+    return _DIALECT_INSERTS[db.get_bind().dialect.name](table)
+
 # Create declarative base
 Base = declarative_base()
 
 # DB Session dependency
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close() 
\ No newline at end of file
+
+# For streaming responses, which outlive the request's get_db session and
+# must open their own
+def get_sessionmaker() -> async_sessionmaker:
+    return AsyncSessionLocal
@@ -0,0 +1,56 @@
+import unicodedata
+from typing import Optional
+
+# Hiragana and katakana occupy parallel blocks 0x60 code points apart
+_HIRAGANA_START, _HIRAGANA_END = 0x3041, 0x3096
+_KATAKANA_START, _KATAKANA_END = 0x30A1, 0x30F6
+_KANA_OFFSET = _KATAKANA_START - _HIRAGANA_START
+
+# Wapuro spellings of long vowels; folded so "toukyou" and "tokyo" meet
+_LONG_VOWELS = (("ou", "o"), ("oo", "o"), ("uu", "u"), ("aa", "a"), ("ii", "i"), ("ee", "e"))
+
+def normalize(text: str) -> str:
+    """NFKC (full-width latin and half-width kana to their usual forms) + lowercase"""
+    return unicodedata.normalize("NFKC", text).lower()
+
+def is_hiragana(char: str) -> bool:
+    return _HIRAGANA_START <= ord(char) <= _HIRAGANA_END
+
+def is_katakana(char: str) -> bool:
+    return _KATAKANA_START <= ord(char) <= _KATAKANA_END or char == "ー"
+
+def is_kanji(char: str) -> bool:
+    return 0x4E00 <= ord(char) <= 0x9FFF or 0x3400 <= ord(char) <= 0x4DBF
+
+def is_kana(text: str) -> bool:
+    return bool(text) and all(is_hiragana(c) or is_katakana(c) for c in text)
+
+def to_hiragana(text: str) -> str:
+    return "".join(
+        chr(ord(c) - _KANA_OFFSET) if _KATAKANA_START <= ord(c) <= _KATAKANA_END else c
+        for c in text
+    )
+
+def to_katakana(text: str) -> str:
+    return "".join(
+        chr(ord(c) + _KANA_OFFSET) if _HIRAGANA_START <= ord(c) <= _HIRAGANA_END else c
+        for c in text
+    )
+
+def fold_long_vowels(romaji: str) -> str:
+    for long, short in _LONG_VOWELS:
+        romaji = romaji.replace(long, short)
+    return romaji
+
+# Character kinds indexed in word_parts
+KANJI, HIRAGANA, KATAKANA = "kanji", "hiragana", "katakana"
+
+def char_kind(char: str) -> Optional[str]:
+    """KANJI, HIRAGANA or KATAKANA, or None for anything else (latin, punctuation)"""
+    if is_kanji(char):
+        return KANJI
+    if is_hiragana(char):
+        return HIRAGANA
+    if is_katakana(char):
+        return KATAKANA
+    return None
@@ -0,0 +1,147 @@
+import codecs
+import json
+from typing import Any, AsyncIterable, AsyncIterator, List, Optional
+
+# Drop consumed text from the buffer once this much has been read
+_COMPACT_THRESHOLD = 64 * 1024
+
+# Longest single JSON value or NDJSON line accepted, in characters
+MAX_VALUE_CHARS = 1024 * 1024
+
+class _StreamReader:
+    """Incrementally decodes JSON values from an async stream of byte chunks"""
+
+    def __init__(self, chunks: AsyncIterable[bytes]):
+        self._chunks = chunks.__aiter__()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    async def _fill(self) -> bool:
+        if self._eof:
+            return False
+        if self._pos > _COMPACT_THRESHOLD:
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        try:
+            chunk = await self._chunks.__anext__()
+        except StopAsyncIteration:
+            self._buffer += self._utf8.decode(b"", final=True)
+            self._eof = True
+            return False
+        self._buffer += self._utf8.decode(chunk)
+        return True
+
+    async def peek(self) -> Optional[str]:
+        """Next non-whitespace character, or None at end of input"""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos].isspace():
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not await self._fill():
+                return None
+
+    async def expect(self, char: str):
+        if await self.peek() != char:
+            raise ValueError(f"Malformed JSON: expected {char!r}")
+        self._pos += 1
+
+    def advance(self):
+        self._pos += 1
+
+    async def decode_value(self) -> Any:
+        await self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # An incomplete value; wait for more of it, up to the cap
+                if len(self._buffer) - self._pos > MAX_VALUE_CHARS:
+                    raise ValueError(f"JSON value longer than {MAX_VALUE_CHARS} characters")
+                if await self._fill():
+                    continue
+                raise ValueError("Malformed JSON value")
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self._buffer) and not self._eof and await self._fill():
+                continue
+            if end - self._pos > MAX_VALUE_CHARS:
+                raise ValueError(f"JSON value longer than {MAX_VALUE_CHARS} characters")
+            self._pos = end
+            return value
+
+async def iter_json_array(
+    chunks: AsyncIterable[bytes], wrapper_key: str = "vocabulary"
+) -> AsyncIterator[Any]:
+    """Yield the items of a JSON array without loading the whole document.
+
+    Accepts a top-level array, or an object holding the array under
+    `wrapper_key` (the {"vocabulary": [...]} layout used by the seed files
+    and the vocab-importer export).
+    """
+    reader = _StreamReader(chunks)
+    if await reader.peek() == "{":
+        reader.advance()
+        while True:
+            if await reader.peek() == "}":
+                raise ValueError(f"Missing {wrapper_key!r} array")
+            key = await reader.decode_value()
+            await reader.expect(":")
+            if key == wrapper_key:
+                break
+            await reader.decode_value()
+            if await reader.peek() == ",":
+                reader.advance()
+
+    await reader.expect("[")
+    if await reader.peek() == "]":
+        return
+    while True:
+        yield await reader.decode_value()
+        next_char = await reader.peek()
+        if next_char == ",":
+            reader.advance()
+        elif next_char == "]":
+            return
+        else:
+            raise ValueError("Malformed JSON: expected ',' or ']'")
+
+async def iter_ndjson(chunks: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    """Yield one decoded value per non-empty line of newline-delimited JSON"""
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    # The unfinished line, as the pieces of it seen so far
+    parts: List[str] = []
+    size = 0
+    async for chunk in chunks:
+        text = utf8.decode(chunk)
+        start = 0
+        # Only the new text is searched, so a long line costs O(n) overall
+        end = text.find("\n")
+        while end != -1:
+            parts.append(text[start:end])
+            line = "".join(parts)
+            parts.clear()
+            size = 0
+            if line.strip():
+                yield _loads_line(line)
+            start = end + 1
+            end = text.find("\n", start)
+        if start < len(text):
+            parts.append(text[start:])
+            size += len(text) - start
+            if size > MAX_VALUE_CHARS:
+                raise ValueError(f"NDJSON line longer than {MAX_VALUE_CHARS} characters")
+    parts.append(utf8.decode(b"", final=True))
+    line = "".join(parts)
+    if line.strip():
+        yield _loads_line(line)
+
+def _loads_line(line: str) -> Any:
+    if len(line) > MAX_VALUE_CHARS:
+        raise ValueError(f"NDJSON line longer than {MAX_VALUE_CHARS} characters")
+    try:
+        return json.loads(line)
+    except json.JSONDecodeError:
+        raise ValueError("Malformed NDJSON line")
@@ -0,0 +1,232 @@
+"""In-process request and SQL metrics, rendered in the Prometheus text format.
+
+The middleware opens a RequestStats for each HTTP request in a context
+variable; the engine hooks add every statement's count and duration to it.
+SQLAlchemy runs the sync hooks in a greenlet that inherits the request
+task's context, so statements are attributed to the request that issued them.
+"""
+import time
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass
+from sqlalchemy import event
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Tuple
+from .config import settings
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SQL_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50, 100)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)) + "}"
+
+class Histogram:
+    def __init__(self, name: str, help: str, labels: Sequence[str], buckets: Sequence[float]):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        # label values -> (per-bucket counts, sum, count)
+        self.series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *label_values: str):
+        series = self.series.setdefault(label_values, [[0] * len(self.buckets), 0.0, 0])
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                series[0][i] += 1
+        series[1] += value
+        series[2] += 1
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for label_values, (counts, total, count) in sorted(self.series.items()):
+            for bound, bucket_count in zip(self.buckets, counts):
+                labels = _labels(self.labels + ("le",), label_values + (f"{bound:g}",))
+                lines.append(f"{self.name}_bucket{labels} {bucket_count}")
+            labels = _labels(self.labels + ("le",), label_values + ("+Inf",))
+            lines.append(f"{self.name}_bucket{labels} {count}")
+            labels = _labels(self.labels, label_values)
+            lines.append(f"{self.name}_sum{labels} {total:.6f}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return "\n".join(lines)
+
+class Counter:
+    def __init__(self, name: str, help: str, labels: Sequence[str]):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.series: Dict[Tuple[str, ...], int] = {}
+
+    def inc(self, *label_values: str):
+        self.series[label_values] = self.series.get(label_values, 0) + 1
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for label_values, value in sorted(self.series.items()):
+            lines.append(f"{self.name}{_labels(self.labels, label_values)} {value}")
+        return "\n".join(lines)
+
+@dataclass
+class SlowQuery:
+    route: str
+    statement: str
+    seconds: float
+
+@dataclass
+class RequestStats:
+    scope: dict
+    sql_count: int = 0
+    sql_seconds: float = 0.0
+
+    @property
+    def route(self) -> str:
+        return _route_label(self.scope)
+
+class MetricsRegistry:
+    def __init__(self):
+        # Render functions of other in-process components; these survive reset()
+        self.collectors: List[Callable[[], str]] = []
+        self.reset()
+
+    def register_collector(self, render: Callable[[], str]):
+        self.collectors.append(render)
+
+    def reset(self):
+        self.request_seconds = Histogram(
+            "http_request_duration_seconds", "HTTP request latency",
+            ("method", "route", "status"), LATENCY_BUCKETS,
+        )
+        self.request_sql_statements = Histogram(
+            "http_request_sql_statements", "SQL statements issued per HTTP request",
+            ("method", "route"), SQL_COUNT_BUCKETS,
+        )
+        self.request_sql_seconds = Histogram(
+            "http_request_sql_seconds", "Time spent in SQL per HTTP request",
+            ("method", "route"), LATENCY_BUCKETS,
+        )
+        self.slow_queries_total = Counter(
+            "db_slow_queries_total",
+            f"SQL statements slower than {settings.SLOW_QUERY_MS:g} ms",
+            ("route",),
+        )
+        self.slow_queries: Deque[SlowQuery] = deque(maxlen=settings.SLOW_QUERY_SAMPLES)
+
+    def observe_request(self, method: str, stats: RequestStats, status: int, seconds: float):
+        self.request_seconds.observe(seconds, method, stats.route, str(status))
+        self.request_sql_statements.observe(stats.sql_count, method, stats.route)
+        self.request_sql_seconds.observe(stats.sql_seconds, method, stats.route)
+
+    def observe_query(self, statement: str, seconds: float, stats: Optional[RequestStats]):
+        if seconds * 1000 < settings.SLOW_QUERY_MS:
+            return
+        route = stats.route if stats is not None else UNMATCHED_ROUTE
+        self.slow_queries_total.inc(route)
+        statement = " ".join(statement.split())[: settings.SLOW_QUERY_MAX_CHARS]
+        self.slow_queries.append(SlowQuery(route, statement, seconds))
+
+    def render(self) -> str:
+        samples = [
+            "# HELP db_slow_query_sample_seconds Most recent slow SQL statements",
+            "# TYPE db_slow_query_sample_seconds gauge",
+        ] + [
+            "db_slow_query_sample_seconds"
+            f"{_labels(('route', 'statement'), (sample.route, sample.statement))} {sample.seconds:.6f}"
+            for sample in self.slow_queries
+        ]
+        parts = [
+            self.request_seconds,
+            self.request_sql_statements,
+            self.request_sql_seconds,
+            self.slow_queries_total,
+        ]
+        return "\n".join(
+            [part.render() for part in parts]
+            + ["\n".join(samples)]
+            + [render() for render in self.collectors]
+        ) + "\n"
+
+metrics = MetricsRegistry()
+
+_current_request: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    seconds = time.perf_counter() - conn.info["query_start"].pop()
+    stats = _current_request.get()
+    if stats is not None:
+        stats.sql_count += 1
+        stats.sql_seconds += seconds
+    metrics.observe_query(statement, seconds, stats)
+
+def instrument_engine(sync_engine):
+    """Time every statement on a (sync) engine and attribute it to the current request"""
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+def _route_label(scope) -> str:
+    """Path template of the matched route, e.g. /api/words/{word_id}"""
+    route = scope.get("route")
+    endpoint = scope.get("endpoint")
+    if route is None and endpoint is not None:
+        # Older Starlette only records the endpoint
+        routes = getattr(scope.get("app"), "routes", ())
+        route = next((r for r in routes if getattr(r, "endpoint", None) is endpoint), None)
+    template = getattr(route, "path", None)
+    if template is None:
+        return UNMATCHED_ROUTE
+    # Routes of included routers may carry their path without the include
+    # prefix; take the prefix from the leading segments of the actual path
+    segments = scope["path"].split("/")
+    prefix_length = len(segments) - len(template.split("/")) + 1
+    return "/".join(segments[:max(prefix_length, 1)]) + template
+
+class MetricsMiddleware:
+    """ASGI middleware recording latency and SQL usage per route.
+
+    With server_timing, responses carry a Server-Timing header with the SQL
+    count and time spent up to the moment the headers are sent.
+    """
+
+    def __init__(self, app, server_timing: bool = False, exclude_paths: Sequence[str] = ()):
+        self.app = app
+        self.server_timing = server_timing
+        self.exclude_paths = set(exclude_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats(scope)
+        token = _current_request.set(stats)
+        start = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if self.server_timing:
+                    elapsed_ms = (time.perf_counter() - start) * 1000
+                    header = (
+                        f'app;dur={elapsed_ms:.1f}, '
+                        f'db;dur={stats.sql_seconds * 1000:.1f};desc="{stats.sql_count} queries"'
+                    )
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"server-timing", header.encode())
+                    ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            metrics.observe_request(scope["method"], stats, status, time.perf_counter() - start)
+            _current_request.reset(token)
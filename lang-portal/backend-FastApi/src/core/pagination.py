@@ -0,0 +1,64 @@
+import base64
+import binascii
+import json
+from typing import Any, Callable, List, Optional, Sequence
+from fastapi import HTTPException, Response
+from sqlalchemy import tuple_
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the sort key of the last row of a page as an opaque token"""
+    payload = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+def decode_cursor(cursor: Optional[str]) -> Optional[List[Any]]:
+    """Decode a token produced by encode_cursor, rejecting anything malformed"""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(values, list) or not values:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+def _matches_type(column: Any, value: Any) -> bool:
+    """Whether a decoded cursor value can be compared with the column"""
+    try:
+        expected = column.type.python_type
+    except NotImplementedError:
+        return isinstance(value, (int, float, str))
+    if expected is int:
+        # bool is an int subclass, but true/false was never encoded for an id
+        return isinstance(value, int) and not isinstance(value, bool)
+    return isinstance(value, expected)
+
+def keyset_filter(columns: Sequence[Any], after: Sequence[Any], descending: bool = False):
+    """Filter for rows strictly after `after` in (columns...) order.
+
+    The columns must match the query's ORDER BY so the database can seek
+    straight to the next page instead of counting past skipped rows.
+    """
+    if len(columns) != len(after) or not all(
+        _matches_type(column, value) for column, value in zip(columns, after)
+    ):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if len(columns) == 1:
+        left, right = columns[0], after[0]
+    else:
+        left, right = tuple_(*columns), tuple_(*after)
+    return left < right if descending else left > right
+
+def set_next_cursor(
+    response: Response, rows: Sequence[Any], limit: int, key: Callable[[Any], Sequence[Any]]
+) -> Optional[str]:
+    """Expose the cursor for the following page, if this page was full"""
+    if not rows or len(rows) < limit:
+        return None
+    cursor = encode_cursor(key(rows[-1]))
+    response.headers[NEXT_CURSOR_HEADER] = cursor
+    return cursor
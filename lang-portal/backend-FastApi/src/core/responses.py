@@ -0,0 +1,33 @@
+"""orjson encoding for list endpoints that select plain rows instead of ORM objects.
+
+A list endpoint selects exactly its response model's fields, labelled with
+the field names and in the model's field order. Encoding those rows
+directly gives the same bytes the model would serialize, without building
+ORM objects or model instances per row.
+"""
+import orjson
+from fastapi import Response
+from typing import Any, Sequence
+
+# Aware UTC datetimes as "Z", like Pydantic
+ORJSON_OPTIONS = orjson.OPT_UTC_Z
+
+def encode_rows(rows: Sequence[Any]) -> bytes:
+    """JSON array with one object per row, keyed by the rows' column labels"""
+    if not rows:
+        return b"[]"
+    fields = rows[0]._fields
+    return orjson.dumps([dict(zip(fields, row)) for row in rows], option=ORJSON_OPTIONS)
+
+class RowsResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Sequence[Any]) -> bytes:
+        return encode_rows(content)
+
+def rows_response(rows: Sequence[Any], response: Response) -> RowsResponse:
+    """RowsResponse carrying the headers the endpoint set on its injected Response.
+
+    FastAPI only merges those headers into responses it builds itself.
+    """
+    return RowsResponse(rows, headers=dict(response.headers))
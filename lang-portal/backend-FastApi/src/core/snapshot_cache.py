@@ -0,0 +1,125 @@
+"""Process-local cache of serialized list pages, keyed by change versions.
+
+A page is kept as the exact JSON bytes and headers of its response, built
+against one set of change versions. Every write path bumps those versions,
+so a hit is only served while none of the page's tables has changed since;
+a hit costs the ETag's change_versions lookup and nothing else: no ORM rows,
+no Pydantic validation. Pages are evicted least recently used first once
+their total size passes the byte cap.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from fastapi import Response
+from typing import Dict, Optional, Tuple
+from .config import settings
+from .metrics import metrics
+
+SnapshotKey = Tuple[str, str]
+Versions = Tuple[Tuple[str, int], ...]
+
+@dataclass(frozen=True)
+class Snapshot:
+    versions: Versions
+    body: bytes
+    headers: Tuple[Tuple[str, str], ...]
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(name) + len(value) for name, value in self.headers)
+
+class SnapshotCache:
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.clear()
+
+    def clear(self):
+        self.entries: "OrderedDict[SnapshotKey, Snapshot]" = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: SnapshotKey, versions: Versions) -> Optional[Snapshot]:
+        snapshot = self.entries.get(key)
+        if snapshot is not None and snapshot.versions != versions:
+            self._drop(key)
+            snapshot = None
+        if snapshot is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return snapshot
+
+    def put(self, key: SnapshotKey, snapshot: Snapshot):
+        if key in self.entries:
+            self._drop(key)
+        if snapshot.size > self.max_bytes:
+            return
+        self.entries[key] = snapshot
+        self.size += snapshot.size
+        while self.size > self.max_bytes:
+            self._drop(next(iter(self.entries)))
+            self.evictions += 1
+
+    def _drop(self, key: SnapshotKey):
+        self.size -= self.entries.pop(key).size
+
+    def render(self) -> str:
+        lookups = self.hits + self.misses
+        ratio = self.hits / lookups if lookups else 0.0
+        series = [
+            ("snapshot_cache_hits_total", "counter", "Pages served from the snapshot cache", self.hits),
+            ("snapshot_cache_misses_total", "counter", "Pages built from the database", self.misses),
+            ("snapshot_cache_evictions_total", "counter", "Pages evicted by the byte cap", self.evictions),
+            ("snapshot_cache_hit_ratio", "gauge", "Share of page lookups served from the cache", f"{ratio:.6f}"),
+            ("snapshot_cache_entries", "gauge", "Pages currently cached", len(self.entries)),
+            ("snapshot_cache_bytes", "gauge", "Size of the cached pages", self.size),
+            ("snapshot_cache_max_bytes", "gauge", "Byte cap of the snapshot cache", self.max_bytes),
+        ]
+        lines = []
+        for name, kind, help, value in series:
+            lines += [f"# HELP {name} {help}", f"# TYPE {name} {kind}", f"{name} {value}"]
+        return "\n".join(lines)
+
+snapshot_cache = SnapshotCache(settings.SNAPSHOT_CACHE_MAX_BYTES)
+metrics.register_collector(snapshot_cache.render)
+
+class PageSnapshot:
+    """One request's handle on the snapshot cache, handed out by cached_page.
+
+    `cached()` returns the stored response, if still current; otherwise the
+    endpoint loads and encodes its page and returns `store(body)`, which
+    keeps the bytes for the next request.
+    Headers the endpoint set on its injected Response (cursors, totals)
+    are stored along with the body.
+    """
+
+    def __init__(self, key: SnapshotKey, versions: Dict[str, int], response: Response):
+        self.key = key
+        self.versions: Versions = tuple(sorted(versions.items()))
+        self.response = response
+
+    def cached(self) -> Optional[Response]:
+        if snapshot_cache.max_bytes <= 0:
+            return None
+        snapshot = snapshot_cache.get(self.key, self.versions)
+        if snapshot is None:
+            return None
+        return self._respond(snapshot.body, dict(snapshot.headers))
+
+    def store(self, body: bytes) -> Response:
+        headers = {
+            name: value for name, value in self.response.headers.items() if name != "etag"
+        }
+        if snapshot_cache.max_bytes > 0:
+            snapshot_cache.put(
+                self.key, Snapshot(self.versions, body, tuple(sorted(headers.items())))
+            )
+        return self._respond(body, headers)
+
+    def _respond(self, body: bytes, headers: Dict[str, str]) -> Response:
+        etag = self.response.headers.get("etag")
+        if etag is not None:
+            headers["etag"] = etag
+        return Response(content=body, media_type="application/json", headers=headers)
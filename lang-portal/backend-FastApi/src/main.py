@@ -1,7 +1,10 @@
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from .core.config import settings
-from .api import words, groups, study_sessions, study_activities, dashboard
+from .core.metrics import MetricsMiddleware, metrics
+from .core.pagination import NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER
+from .api import words, groups, study_sessions, study_activities, dashboard, changes, stats, export
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -15,6 +18,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER, "ETag"],
 )
 
 # Include routers
@@ -23,6 +27,9 @@ app.include_router(words.router, prefix=settings.API_V1_STR)
 app.include_router(groups.router, prefix=settings.API_V1_STR)
 app.include_router(study_sessions.router, prefix=settings.API_V1_STR)
 app.include_router(study_activities.router, prefix=settings.API_V1_STR)
+app.include_router(changes.router, prefix=settings.API_V1_STR)
+app.include_router(stats.router, prefix=settings.API_V1_STR)
+app.include_router(export.router, prefix=settings.API_V1_STR)
 
 app.add_middleware(
     CORSMiddleware,
@@ -32,6 +39,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Outermost, so latency covers the whole stack
+app.add_middleware(
+    MetricsMiddleware,
+    server_timing=settings.SERVER_TIMING_ENABLED,
+    exclude_paths=["/metrics"],
+)
+
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"} 
\ No newline at end of file
+    return {"status": "healthy"}
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Request latency, SQL usage per route and slow queries in Prometheus text format"""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4") 
\ No newline at end of file
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+from ..core.database import Base
+
+class ChangeLogEntry(Base):
+    """Append-only feed of vocabulary changes, ordered by a monotonic seq.
+
+    words rows carry word_id, groups rows carry group_id and words_groups
+    rows carry both. op is "upsert" or "delete" (a tombstone).
+    """
+    __tablename__ = "change_log"
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    seq = Column(Integer, primary_key=True, autoincrement=True)
+    table_name = Column(String, nullable=False)
+    op = Column(String, nullable=False)
+    word_id = Column(Integer)
+    group_id = Column(Integer)
+    changed_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Integer, String, DDL, event
+from ..core.database import Base
+
+class ChangeVersion(Base):
+    """Monotonic per-table write counter; read endpoints derive ETags from it"""
+    __tablename__ = "change_versions"
+
+    table_name = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+# Random per-database epoch, as in migrations/0005_change_versions.sql and
+# migrations/postgresql/0001_init.sql, so versions (and anything cached
+# against them) never carry over to a rebuilt database
+event.listen(
+    ChangeVersion.__table__, "after_create",
+    DDL(
+        "INSERT INTO change_versions (table_name, version) "
+        "VALUES ('_epoch', abs(random()) %% 1000000000)"
+    ).execute_if(dialect="sqlite"),
+)
+event.listen(
+    ChangeVersion.__table__, "after_create",
+    DDL(
+        "INSERT INTO change_versions (table_name, version) "
+        "VALUES ('_epoch', floor(random() * 1000000000)::integer)"
+    ).execute_if(dialect="postgresql"),
+)
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, Date
+from ..core.database import Base
+
+# group_id for sessions that are not tied to a group
+NO_GROUP = 0
+
+class DailyActivity(Base):
+    """Per-day, per-group rollup of reviews and sessions, updated alongside every write.
+
+    Days are UTC calendar days, matching the server timestamps on reviews and sessions.
+    """
+    __tablename__ = "daily_activity"
+
+    day = Column(Date, primary_key=True)
+    group_id = Column(Integer, primary_key=True, default=NO_GROUP)
+    reviews = Column(Integer, nullable=False, default=0)
+    correct = Column(Integer, nullable=False, default=0)
+    sessions = Column(Integer, nullable=False, default=0)
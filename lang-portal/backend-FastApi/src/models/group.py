@@ -10,6 +10,11 @@ class Group(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, index=True, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), default=func.now(), onupdate=func.now())
+    # Maintained by the triggers in group_counters.py
+    word_count = Column(Integer, nullable=False, default=0, server_default="0")
+    session_count = Column(Integer, nullable=False, default=0, server_default="0")
+    last_studied_at = Column(DateTime(timezone=True))
 
     # Relationships
     words = relationship("Word", secondary=words_groups, back_populates="groups")
@@ -0,0 +1,107 @@
+from sqlalchemy import DDL, event
+from .study_session import StudySession
+from .word import words_groups
+
+# Triggers keeping groups.word_count, session_count and last_studied_at in
+# step with words_groups and study_sessions, whichever code path writes them
+# (services, imports, seed scripts). Attached to the tables for create_all;
+# migrations/0010_group_counters.sql creates the same triggers.
+WORDS_GROUPS_COUNTER_DDL = [
+    """
+    CREATE TRIGGER IF NOT EXISTS words_groups_count_ai AFTER INSERT ON words_groups BEGIN
+        UPDATE groups SET word_count = word_count + 1 WHERE id = new.group_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS words_groups_count_ad AFTER DELETE ON words_groups BEGIN
+        UPDATE groups SET word_count = word_count - 1 WHERE id = old.group_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS words_groups_count_au AFTER UPDATE OF group_id ON words_groups BEGIN
+        UPDATE groups SET word_count = word_count - 1 WHERE id = old.group_id;
+        UPDATE groups SET word_count = word_count + 1 WHERE id = new.group_id;
+    END
+    """,
+]
+
+STUDY_SESSIONS_COUNTER_DDL = [
+    """
+    CREATE TRIGGER IF NOT EXISTS study_sessions_count_ai AFTER INSERT ON study_sessions BEGIN
+        UPDATE groups
+        SET session_count = session_count + 1,
+            last_studied_at = max(coalesce(last_studied_at, new.created_at), new.created_at)
+        WHERE id = new.group_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS study_sessions_count_ad AFTER DELETE ON study_sessions BEGIN
+        UPDATE groups
+        SET session_count = session_count - 1,
+            last_studied_at = (
+                SELECT max(created_at) FROM study_sessions WHERE group_id = old.group_id
+            )
+        WHERE id = old.group_id;
+    END
+    """,
+]
+
+# PostgreSQL: the same counters as plpgsql trigger functions, as in
+# migrations/postgresql/0001_init.sql
+WORDS_GROUPS_COUNTER_PG_DDL = [
+    """
+    CREATE OR REPLACE FUNCTION words_groups_count() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('DELETE', 'UPDATE') THEN
+            UPDATE groups SET word_count = word_count - 1 WHERE id = OLD.group_id;
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            UPDATE groups SET word_count = word_count + 1 WHERE id = NEW.group_id;
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER words_groups_count
+    AFTER INSERT OR DELETE OR UPDATE OF group_id ON words_groups
+    FOR EACH ROW EXECUTE FUNCTION words_groups_count()
+    """,
+]
+
+STUDY_SESSIONS_COUNTER_PG_DDL = [
+    """
+    CREATE OR REPLACE FUNCTION study_sessions_count() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            UPDATE groups
+            SET session_count = session_count + 1,
+                last_studied_at = greatest(last_studied_at, NEW.created_at)
+            WHERE id = NEW.group_id;
+        ELSE
+            UPDATE groups
+            SET session_count = session_count - 1,
+                last_studied_at = (
+                    SELECT max(created_at) FROM study_sessions WHERE group_id = OLD.group_id
+                )
+            WHERE id = OLD.group_id;
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER study_sessions_count
+    AFTER INSERT OR DELETE ON study_sessions
+    FOR EACH ROW EXECUTE FUNCTION study_sessions_count()
+    """,
+]
+
+for _table, _statements, _dialect in (
+    (words_groups, WORDS_GROUPS_COUNTER_DDL, "sqlite"),
+    (StudySession.__table__, STUDY_SESSIONS_COUNTER_DDL, "sqlite"),
+    (words_groups, WORDS_GROUPS_COUNTER_PG_DDL, "postgresql"),
+    (StudySession.__table__, STUDY_SESSIONS_COUNTER_PG_DDL, "postgresql"),
+):
+    for _statement in _statements:
+        event.listen(_table, "after_create", DDL(_statement).execute_if(dialect=_dialect))
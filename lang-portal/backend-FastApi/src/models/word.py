@@ -1,5 +1,6 @@
-from sqlalchemy import Column, Integer, String, JSON, ForeignKey, Table
+from sqlalchemy import Column, Integer, String, JSON, DateTime, ForeignKey, Table, Index
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 from ..core.database import Base
 
 # Association table for many-to-many relationship between words and groups
@@ -7,22 +8,48 @@ words_groups = Table(
     'words_groups',
     Base.metadata,
     Column('word_id', Integer, ForeignKey('words.id'), primary_key=True),
-    Column('group_id', Integer, ForeignKey('groups.id'), primary_key=True)
+    Column('group_id', Integer, ForeignKey('groups.id'), primary_key=True),
+    Column('updated_at', DateTime(timezone=True), default=func.now())
 )
+# The primary key serves word -> groups; this serves group -> words
+Index('ix_words_groups_group_id', words_groups.c.group_id, words_groups.c.word_id)
 
 class Word(Base):
     __tablename__ = "words"
+    __table_args__ = (
+        # Import dedup key
+        Index("ix_words_japanese_romaji", "japanese", "romaji"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     japanese = Column(String, index=True, nullable=False)
     romaji = Column(String, nullable=False)
     english = Column(String, nullable=False)
     parts = Column(JSON)
+    updated_at = Column(DateTime(timezone=True), default=func.now(), onupdate=func.now())
 
     # Relationships
     groups = relationship("Group", secondary=words_groups, back_populates="words")
     # Move this relationship to WordReviewItem model instead
     # review_items = relationship("WordReviewItem", back_populates="word")
 
+    # Review stats are read from the word_review_stats rollup (see WordReviewStats)
+    @property
+    def correct_count(self):
+        return self.stats.correct_count if self.stats else 0
+
+    @property
+    def wrong_count(self):
+        return self.stats.wrong_count if self.stats else 0
+
+    @property
+    def success_rate(self):
+        total = self.correct_count + self.wrong_count
+        return (self.correct_count / total * 100) if total > 0 else 0.0
+
+    @property
+    def last_reviewed(self):
+        return self.stats.last_reviewed if self.stats else None
+
     def __repr__(self):
         return f"<Word {self.japanese}>" 
\ No newline at end of file
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
+from ..core.database import Base
+
+class WordPart(Base):
+    """One kanji or kana character of a word (its japanese text and parts).
+
+    Rebuilt by WordPartService whenever a word is written, so "words
+    containing X" is an index range scan instead of a pass over Word.parts.
+    """
+    __tablename__ = "word_parts"
+    __table_args__ = (
+        Index("ix_word_parts_word_id", "word_id"),
+        {"sqlite_with_rowid": False},
+    )
+
+    char = Column(String, primary_key=True)
+    word_id = Column(Integer, ForeignKey("words.id"), primary_key=True)
+    kind = Column(String, nullable=False)
@@ -1,10 +1,15 @@
-from sqlalchemy import Column, Integer, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from ..core.database import Base
 
 class WordReviewItem(Base):
     __tablename__ = "word_review_items"
+    __table_args__ = (
+        Index("ix_word_review_items_word_id", "word_id"),
+        # Covers per-session correct/total counts and the reviewed word list
+        Index("ix_word_review_items_session", "study_session_id", "correct", "word_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     word_id = Column(Integer, ForeignKey("words.id"))
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey
+from sqlalchemy.orm import relationship, backref
+from ..core.database import Base
+
+class WordReviewStats(Base):
+    """Per-word rollup of review outcomes, updated alongside every review insert"""
+    __tablename__ = "word_review_stats"
+
+    word_id = Column(Integer, ForeignKey("words.id"), primary_key=True)
+    correct_count = Column(Integer, nullable=False, default=0)
+    wrong_count = Column(Integer, nullable=False, default=0)
+    last_reviewed = Column(DateTime(timezone=True))
+
+    # Relationships
+    word = relationship("Word", backref=backref("stats", uselist=False))
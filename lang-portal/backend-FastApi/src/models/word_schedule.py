@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey, Index
+from sqlalchemy.orm import relationship
+from ..core.database import Base
+
+class WordSchedule(Base):
+    """Spaced-repetition state of a word within a group, updated on every review"""
+    __tablename__ = "word_schedules"
+    __table_args__ = (
+        # Due queue: range scan over a group's rows in due order
+        Index("ix_word_schedules_group_due", "group_id", "due_at", "word_id"),
+        Index("ix_word_schedules_word_id", "word_id"),
+    )
+
+    group_id = Column(Integer, ForeignKey("groups.id"), primary_key=True)
+    word_id = Column(Integer, ForeignKey("words.id"), primary_key=True)
+    due_at = Column(DateTime(timezone=True), nullable=False)
+    interval_days = Column(Float, nullable=False, default=0.0)
+    ease = Column(Float, nullable=False, default=2.5)
+    repetitions = Column(Integer, nullable=False, default=0)
+
+    # Relationships
+    word = relationship("Word")
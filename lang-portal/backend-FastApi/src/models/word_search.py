@@ -0,0 +1,81 @@
+from sqlalchemy import DDL, event
+from .word import Word
+
+# SQLite FTS5 indexes over words, kept in sync by triggers. create_all cannot
+# express virtual tables or triggers, so they are attached to the words table
+# here; migrations/0007_words_fts.sql and 0012_words_fts_trigram.sql create
+# the same objects for migrated databases.
+#
+# words_fts (unicode61) ranks terms and prefixes. It sees an unspaced run of
+# Japanese as one token, so words_fts_ja (trigram) answers substrings of the
+# Japanese text instead.
+#
+# parts is indexed as the space-separated text values of its JSON (the stored
+# JSON escapes kana as \uXXXX), which is why words_fts keeps its own copy of
+# the text instead of reading the words table as external content.
+_PARTS_TEXT = (
+    "(SELECT group_concat(value, ' ') FROM json_tree({row}.parts) "
+    "WHERE type = 'text' AND json_valid({row}.parts))"
+)
+
+WORDS_FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS words_fts USING fts5(
+        japanese, romaji, english, parts,
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='1 2 3'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS words_fts_ai AFTER INSERT ON words BEGIN
+        INSERT INTO words_fts (rowid, japanese, romaji, english, parts)
+        VALUES (new.id, new.japanese, new.romaji, new.english, {_PARTS_TEXT.format(row="new")});
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS words_fts_ad AFTER DELETE ON words BEGIN
+        DELETE FROM words_fts WHERE rowid = old.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS words_fts_au AFTER UPDATE ON words BEGIN
+        DELETE FROM words_fts WHERE rowid = old.id;
+        INSERT INTO words_fts (rowid, japanese, romaji, english, parts)
+        VALUES (new.id, new.japanese, new.romaji, new.english, {_PARTS_TEXT.format(row="new")});
+    END
+    """,
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS words_fts_ja USING fts5(
+        japanese, parts,
+        tokenize='trigram'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS words_fts_ja_ai AFTER INSERT ON words BEGIN
+        INSERT INTO words_fts_ja (rowid, japanese, parts)
+        VALUES (new.id, new.japanese, {_PARTS_TEXT.format(row="new")});
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS words_fts_ja_ad AFTER DELETE ON words BEGIN
+        DELETE FROM words_fts_ja WHERE rowid = old.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS words_fts_ja_au AFTER UPDATE ON words BEGIN
+        DELETE FROM words_fts_ja WHERE rowid = old.id;
+        INSERT INTO words_fts_ja (rowid, japanese, parts)
+        VALUES (new.id, new.japanese, {_PARTS_TEXT.format(row="new")});
+    END
+    """,
+]
+
+for _statement in WORDS_FTS_DDL:
+    event.listen(Word.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+
+# Triggers go with the words table; the FTS tables have to be dropped explicitly
+for _fts_table in ("words_fts", "words_fts_ja"):
+    event.listen(
+        Word.__table__, "before_drop",
+        DDL(f"DROP TABLE IF EXISTS {_fts_table}").execute_if(dialect="sqlite"),
+    )
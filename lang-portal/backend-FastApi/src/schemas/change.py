@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+
+class ChangeEntry(BaseModel):
+    seq: int
+    table: str
+    op: str
+    word_id: Optional[int] = None
+    group_id: Optional[int] = None
+    changed_at: Optional[datetime] = None
+    data: Optional[Dict[str, Any]] = None
+
+class ChangeFeed(BaseModel):
+    changes: List[ChangeEntry]
+    next_token: Optional[str] = None
+    has_more: bool = False
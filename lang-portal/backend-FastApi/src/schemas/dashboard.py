@@ -17,4 +17,9 @@ class QuickStats(BaseModel):
     success_rate: float
     total_study_sessions: int
     total_active_groups: int
-    study_streak_days: int 
\ No newline at end of file
+    study_streak_days: int 
+
+class DashboardSummary(BaseModel):
+    study_progress: StudyProgress
+    quick_stats: QuickStats
+    last_study_session: Optional[LastStudySession] = None
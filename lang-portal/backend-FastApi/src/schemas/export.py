@@ -0,0 +1,10 @@
+from enum import Enum
+
+class ExportDataset(str, Enum):
+    words = "words"
+    reviews = "reviews"
+    sessions = "sessions"
+
+class ExportFormat(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
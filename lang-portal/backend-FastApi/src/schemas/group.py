@@ -14,7 +14,9 @@ class GroupUpdate(GroupBase):
 
 class Group(GroupBase):
     id: int
-    word_count: Optional[int] = 0
+    word_count: int = 0
+    session_count: int = 0
+    last_studied_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
@@ -23,4 +25,7 @@ class GroupDetail(Group):
     words: List[Word] = []
     created_at: datetime
     total_words: int = 0
-    study_sessions_count: int = 0 
\ No newline at end of file
+    study_sessions_count: int = 0 
+
+class GroupWordsAdd(BaseModel):
+    word_ids: List[int] = Field(..., description="Ids of the words to add to the group")
@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+from datetime import date
+
+class TimeseriesPoint(BaseModel):
+    start: date
+    reviews: int
+    correct: int
+    sessions: int
@@ -1,6 +1,7 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import Optional, Dict, List
 from datetime import datetime
+from enum import Enum
 
 class WordBase(BaseModel):
     japanese: str = Field(..., description="Japanese word/phrase")
@@ -14,6 +15,21 @@ class WordCreate(WordBase):
 class WordUpdate(WordBase):
     pass
 
+class WordPatch(BaseModel):
+    """Partial update of one word; fields left out are not changed"""
+    id: int
+    japanese: Optional[str] = None
+    romaji: Optional[str] = None
+    english: Optional[str] = None
+    parts: Optional[Dict] = None
+
+    @field_validator("japanese", "romaji", "english")
+    @classmethod
+    def not_null(cls, value):
+        if value is None:
+            raise ValueError("may be omitted but not null")
+        return value
+
 class Word(WordBase):
     id: int
     
@@ -27,4 +43,30 @@ class WordWithStats(Word):
     correct_count: int = 0
     wrong_count: int = 0
     success_rate: float = 0.0
-    last_reviewed: Optional[datetime] = None 
\ No newline at end of file
+    last_reviewed: Optional[datetime] = None 
+
+class WordSortField(str, Enum):
+    id = "id"
+    japanese = "japanese"
+    romaji = "romaji"
+    english = "english"
+    correct_count = "correct_count"
+    wrong_count = "wrong_count"
+
+class SortOrder(str, Enum):
+    asc = "asc"
+    desc = "desc"
+
+class WordImportBatch(BaseModel):
+    batch: int
+    received: int
+    inserted: int
+    duplicates: int
+    linked: int
+
+class WordImportResult(BaseModel):
+    inserted: int
+    duplicates: int
+    invalid: int
+    linked: int
+    batches: List[WordImportBatch]
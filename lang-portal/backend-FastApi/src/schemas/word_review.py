@@ -0,0 +1,32 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional
+from .word import WordWithStats
+
+class WordReviewCreate(BaseModel):
+    correct: bool
+
+class WordReviewResult(BaseModel):
+    success: bool = True
+    word_id: int
+    study_session_id: int
+    correct: bool
+    created_at: datetime
+
+class WordReviewBatchItem(BaseModel):
+    word_id: int
+    correct: bool
+
+class StudySessionStats(BaseModel):
+    study_session_id: int
+    correct_count: int
+    wrong_count: int
+    total_count: int
+    success_rate: float
+
+class DueWord(BaseModel):
+    word: WordWithStats
+    due_at: Optional[datetime] = None  # None for words never reviewed in the group
+    interval_days: float
+    ease: float
+    repetitions: int
@@ -0,0 +1,177 @@
+from datetime import date, datetime, timedelta, timezone
+from enum import Enum
+from sqlalchemy import Date, Select, case, func, literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, List, Optional, Union
+from ..core.database import dialect_insert
+from ..models.daily_activity import DailyActivity, NO_GROUP
+from ..models.study_session import StudySession
+from ..models.word_review import WordReviewItem
+
+class Bucket(str, Enum):
+    day = "day"
+    week = "week"
+    month = "month"
+
+def utc_today() -> date:
+    return datetime.now(timezone.utc).date()
+
+def bucket_start(day: date, bucket: Bucket) -> date:
+    if bucket == Bucket.week:
+        return day - timedelta(days=day.weekday())
+    if bucket == Bucket.month:
+        return day.replace(day=1)
+    return day
+
+# Every path (live writes, word deletes, the backfill) buckets rows by the
+# database's own date(created_at), so they always agree on a row's day
+def _review_rollup(*where):
+    """reviews/correct per (day, group_id) from word_review_items"""
+    group_id = func.coalesce(StudySession.group_id, NO_GROUP)
+    day = func.date(WordReviewItem.created_at, type_=Date)
+    return (
+        select(
+            day.label("day"),
+            group_id.label("group_id"),
+            func.count().label("reviews"),
+            func.sum(case((WordReviewItem.correct == True, 1), else_=0)).label("correct"),
+            literal(0).label("sessions"),
+        )
+        .select_from(WordReviewItem)
+        .outerjoin(StudySession, StudySession.id == WordReviewItem.study_session_id)
+        .where(*where)
+        .group_by(day, group_id)
+    )
+
+def _session_rollup(*where):
+    """sessions per (day, group_id) from study_sessions"""
+    group_id = func.coalesce(StudySession.group_id, NO_GROUP)
+    day = func.date(StudySession.created_at, type_=Date)
+    return (
+        select(
+            day.label("day"),
+            group_id.label("group_id"),
+            literal(0).label("reviews"),
+            literal(0).label("correct"),
+            func.count().label("sessions"),
+        )
+        .where(*where)
+        .group_by(day, group_id)
+    )
+
+def rollup_from_history():
+    """SELECT rebuilding daily_activity from review and session history"""
+    history = union_all(_review_rollup(), _session_rollup()).subquery()
+    return select(
+        history.c.day,
+        history.c.group_id,
+        func.sum(history.c.reviews),
+        func.sum(history.c.correct),
+        func.sum(history.c.sessions),
+    ).group_by(history.c.day, history.c.group_id)
+
+ROLLUP_COLUMNS = ["day", "group_id", "reviews", "correct", "sessions"]
+
+class ActivityService:
+    @staticmethod
+    async def _add(db: AsyncSession, rows: Union[List[dict], Select]):
+        """Add rows, or the rows of a rollup SELECT, onto the existing counts"""
+        if isinstance(rows, Select):
+            stmt = dialect_insert(db, DailyActivity).from_select(ROLLUP_COLUMNS, rows)
+        elif rows:
+            stmt = dialect_insert(db, DailyActivity).values(rows)
+        else:
+            return
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[DailyActivity.day, DailyActivity.group_id],
+            set_={
+                "reviews": DailyActivity.reviews + stmt.excluded.reviews,
+                "correct": DailyActivity.correct + stmt.excluded.correct,
+                "sessions": DailyActivity.sessions + stmt.excluded.sessions,
+            },
+        )
+        await db.execute(stmt)
+
+    @staticmethod
+    async def record_reviews(db: AsyncSession, review_ids: List[int]):
+        """Add new (flushed) reviews to the rollup in the caller's transaction"""
+        if review_ids:
+            await ActivityService._add(db, _review_rollup(WordReviewItem.id.in_(review_ids)))
+
+    @staticmethod
+    async def record_session(db: AsyncSession, session_id: int):
+        """Add a new (flushed) study session to the rollup in the caller's transaction"""
+        await ActivityService._add(db, _session_rollup(StudySession.id == session_id))
+
+    @staticmethod
+    async def remove_word_reviews(db: AsyncSession, word_id: int):
+        """Take a word's reviews back out of the rollup before they are deleted"""
+        rows = await db.execute(_review_rollup(WordReviewItem.word_id == word_id))
+        await ActivityService._add(db, [
+            {
+                "day": row.day,
+                "group_id": row.group_id,
+                "reviews": -row.reviews,
+                "correct": -row.correct,
+                "sessions": 0,
+            }
+            for row in rows
+        ])
+
+    @staticmethod
+    async def get_streak(db: AsyncSession, today: Optional[date] = None) -> int:
+        """Consecutive active days ending today, or yesterday if today has no activity yet"""
+        today = today or utc_today()
+        active_days = await db.stream_scalars(
+            select(DailyActivity.day)
+            .where(DailyActivity.day <= today)
+            .group_by(DailyActivity.day)
+            .having(func.sum(DailyActivity.reviews + DailyActivity.sessions) > 0)
+            .order_by(DailyActivity.day.desc())
+        )
+        streak = 0
+        expected = today
+        async for day in active_days:
+            if streak == 0 and day == today - timedelta(days=1):
+                expected = day
+            if day != expected:
+                break
+            streak += 1
+            expected = day - timedelta(days=1)
+        await active_days.close()
+        return streak
+
+    @staticmethod
+    async def get_timeseries(
+        db: AsyncSession,
+        start: date,
+        end: date,
+        bucket: Bucket = Bucket.day,
+        group_id: Optional[int] = None,
+    ) -> List[dict]:
+        """Activity totals per bucket between start and end inclusive, zero-filled"""
+        query = (
+            select(
+                DailyActivity.day,
+                func.sum(DailyActivity.reviews).label("reviews"),
+                func.sum(DailyActivity.correct).label("correct"),
+                func.sum(DailyActivity.sessions).label("sessions"),
+            )
+            .where(DailyActivity.day >= start, DailyActivity.day <= end)
+            .group_by(DailyActivity.day)
+        )
+        if group_id is not None:
+            query = query.where(DailyActivity.group_id == group_id)
+
+        points: Dict[date, dict] = {}
+        day = start
+        while day <= end:
+            key = bucket_start(day, bucket)
+            points.setdefault(key, {"start": key, "reviews": 0, "correct": 0, "sessions": 0})
+            day += timedelta(days=1)
+        for row in await db.execute(query):
+            point = points[bucket_start(row.day, bucket)]
+            point["reviews"] += row.reviews
+            point["correct"] += row.correct
+            point["sessions"] += row.sessions
+        return list(points.values())
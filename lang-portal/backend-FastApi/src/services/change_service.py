@@ -0,0 +1,140 @@
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from typing import Dict, Iterable, List, Optional, Tuple
+from ..models.change_log import ChangeLogEntry
+from ..models.group import Group
+from ..models.word import Word
+from ..schemas.group import Group as GroupSchema
+from ..schemas.word import Word as WordSchema
+from .version_service import VersionService, bump_statement
+
+UPSERT = "upsert"
+DELETE = "delete"
+
+# pg_advisory_xact_lock key serializing change_log writers
+FEED_LOCK_KEY = 0x6368616E6765
+
+def feed_lock_statement(db):
+    """Statement that holds the change feed until the transaction ends, or None.
+
+    PostgreSQL hands out seq values at insert time, so without it a reader
+    could see seq N+1 from a transaction that committed first, move `since`
+    past it, and never see N. Taking the lock before inserting makes seqs
+    follow commit order. SQLite already allows one writer at a time.
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return None
+    return select(func.pg_advisory_xact_lock(FEED_LOCK_KEY))
+
+def record_loaded_vocabulary(
+    db: Session,
+    group_ids: Iterable[int],
+    word_ids: Iterable[int],
+    links: Iterable[Tuple[int, int]],
+):
+    """Feed entries for vocabulary bulk-loaded by a script, in its sync transaction.
+
+    Scripts insert groups, words and (word_id, group_id) links directly
+    rather than through the services, so this records them as upserts, in
+    the order migration 0006 uses, and bumps their change versions.
+    """
+    keys = [
+        *(("groups", None, group_id) for group_id in group_ids),
+        *(("words", word_id, None) for word_id in word_ids),
+        *(("words_groups", word_id, group_id) for word_id, group_id in links),
+    ]
+    rows = [
+        {"table_name": table, "op": UPSERT, "word_id": word_id, "group_id": group_id}
+        for table, word_id, group_id in keys
+    ]
+    if rows:
+        lock = feed_lock_statement(db)
+        if lock is not None:
+            db.execute(lock)
+        db.execute(insert(ChangeLogEntry), rows)
+    db.execute(bump_statement(db, "groups", "words", "words_groups"))
+
+class ChangeService:
+    @staticmethod
+    async def record(db: AsyncSession, table: str, op: str, keys: List[Dict[str, int]]):
+        """Append change_log entries and bump the table's change version.
+
+        `keys` holds word_id and/or group_id for each changed row. Runs in the
+        caller's transaction, so the feed commits or rolls back with the write.
+        """
+        if not keys:
+            return
+        lock = feed_lock_statement(db)
+        if lock is not None:
+            await db.execute(lock)
+        await db.execute(
+            insert(ChangeLogEntry),
+            [{"table_name": table, "op": op, **key} for key in keys],
+        )
+        await VersionService.bump(db, table)
+
+    @staticmethod
+    async def get_changes(db: AsyncSession, since: int = 0, limit: int = 500) -> dict:
+        """Changes with seq > since, oldest first.
+
+        Repeated changes to the same row within a page collapse to the latest
+        one, and upserts carry the row's current data.
+        """
+        entries = (
+            await db.scalars(
+                select(ChangeLogEntry)
+                .where(ChangeLogEntry.seq > since)
+                .order_by(ChangeLogEntry.seq)
+                .limit(limit + 1)
+            )
+        ).all()
+        has_more = len(entries) > limit
+        entries = entries[:limit]
+
+        latest: Dict[Tuple[str, Optional[int], Optional[int]], ChangeLogEntry] = {}
+        for entry in entries:
+            key = (entry.table_name, entry.word_id, entry.group_id)
+            latest.pop(key, None)
+            latest[key] = entry
+
+        word_ids = {e.word_id for e in latest.values() if e.table_name == "words" and e.op == UPSERT}
+        group_ids = {e.group_id for e in latest.values() if e.table_name == "groups" and e.op == UPSERT}
+        words = {}
+        if word_ids:
+            words = {w.id: w for w in await db.scalars(select(Word).where(Word.id.in_(word_ids)))}
+        groups = {}
+        if group_ids:
+            groups = {g.id: g for g in await db.scalars(select(Group).where(Group.id.in_(group_ids)))}
+
+        changes = []
+        for entry in latest.values():
+            change = {
+                "seq": entry.seq,
+                "table": entry.table_name,
+                "op": entry.op,
+                "word_id": entry.word_id,
+                "group_id": entry.group_id,
+                "changed_at": entry.changed_at,
+            }
+            if entry.op == UPSERT and entry.table_name == "words":
+                word = words.get(entry.word_id)
+                if word is None:
+                    # Deleted later; its tombstone follows in a later entry
+                    continue
+                change["data"] = {
+                    **WordSchema.model_validate(word).model_dump(mode="json"),
+                    "updated_at": word.updated_at.isoformat() if word.updated_at else None,
+                }
+            elif entry.op == UPSERT and entry.table_name == "groups":
+                group = groups.get(entry.group_id)
+                if group is None:
+                    continue
+                change["data"] = {
+                    **GroupSchema.model_validate(group).model_dump(mode="json"),
+                    "updated_at": group.updated_at.isoformat() if group.updated_at else None,
+                }
+            changes.append(change)
+
+        last_seq = entries[-1].seq if entries else since
+        return {"changes": changes, "last_seq": last_seq, "has_more": has_more}
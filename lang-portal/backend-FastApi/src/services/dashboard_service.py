@@ -1,35 +1,135 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select, case, true
 from typing import Optional
 from ..models.study_session import StudySession
 from ..models.word_review import WordReviewItem
 from ..models.word import Word
+from ..models.group import Group
+from .activity_service import ActivityService
+
+# Dashboard sections, each backed by its own columns of the summary statement
+STUDY_PROGRESS = "study_progress"
+QUICK_STATS = "quick_stats"
+LAST_STUDY_SESSION = "last_study_session"
 
 class DashboardService:
     @staticmethod
-    async def get_last_study_session(db: Session):
-        return db.query(StudySession).order_by(StudySession.created_at.desc()).first()
+    def _summary_query(*sections: str):
+        """Build a single statement that aggregates the figures of `sections`.
+
+        Only the tables a section needs are read: study progress counts words
+        and reviewed words, quick stats totals reviews and sessions, and the
+        last session is one indexed lookup. At least one of the first two
+        must be included, since their aggregates provide the single row.
+        """
+        columns = []
+        totals = []
+
+        review_columns = []
+        if STUDY_PROGRESS in sections:
+            columns.append(select(func.count(Word.id)).scalar_subquery().label("total_words"))
+            review_columns.append(
+                func.count(WordReviewItem.word_id.distinct()).label("words_studied")
+            )
+        if QUICK_STATS in sections:
+            review_columns += [
+                func.count(WordReviewItem.id).label("total_reviews"),
+                func.coalesce(
+                    func.sum(case((WordReviewItem.correct == True, 1), else_=0)), 0
+                ).label("correct_reviews"),
+            ]
+        if review_columns:
+            totals.append(select(*review_columns).subquery())
+
+        if QUICK_STATS in sections:
+            totals.append(
+                select(
+                    func.count(StudySession.id).label("total_sessions"),
+                    func.count(StudySession.group_id.distinct()).label("active_groups"),
+                ).subquery()
+            )
+
+        from_clause = totals[0]
+        for subquery in totals:
+            columns += list(subquery.c)
+            if subquery is not from_clause:
+                from_clause = from_clause.join(subquery, true())
+
+        if LAST_STUDY_SESSION in sections:
+            last_session = (
+                select(
+                    StudySession.id.label("last_session_id"),
+                    StudySession.group_id.label("last_session_group_id"),
+                    StudySession.created_at.label("last_session_created_at"),
+                    StudySession.study_activity_id.label("last_session_activity_id"),
+                    Group.name.label("last_session_group_name"),
+                )
+                .join(Group, Group.id == StudySession.group_id)
+                .order_by(StudySession.created_at.desc(), StudySession.id.desc())
+                .limit(1)
+                .subquery()
+            )
+            columns += list(last_session.c)
+            from_clause = from_clause.outerjoin(last_session, true())
+
+        return select(*columns).select_from(from_clause)
 
     @staticmethod
-    async def get_study_progress(db: Session):
-        total_words = db.query(func.count(Word.id)).scalar()
-        studied_words = db.query(func.count(WordReviewItem.word_id.distinct())).scalar()
-        
+    def _study_progress(row) -> dict:
         return {
-            "total_words_studied": studied_words,
-            "total_available_words": total_words
+            "total_words_studied": row.words_studied,
+            "total_available_words": row.total_words,
         }
 
     @staticmethod
-    async def get_quick_stats(db: Session):
-        total_sessions = db.query(func.count(StudySession.id)).scalar()
-        correct_reviews = db.query(WordReviewItem).filter(WordReviewItem.correct == True).count()
-        total_reviews = db.query(WordReviewItem).count()
-        success_rate = (correct_reviews / total_reviews * 100) if total_reviews > 0 else 0
-        
+    async def _quick_stats(db: AsyncSession, row) -> dict:
+        success_rate = (
+            row.correct_reviews / row.total_reviews * 100 if row.total_reviews > 0 else 0
+        )
         return {
             "success_rate": success_rate,
-            "total_study_sessions": total_sessions,
-            "total_active_groups": db.query(func.count(StudySession.group_id.distinct())).scalar(),
-            "study_streak_days": 0  # To be implemented with actual streak calculation
-        } 
\ No newline at end of file
+            "total_study_sessions": row.total_sessions,
+            "total_active_groups": row.active_groups,
+            "study_streak_days": await ActivityService.get_streak(db),
+        }
+
+    @staticmethod
+    def _last_study_session(row) -> Optional[dict]:
+        if row.last_session_id is None:
+            return None
+        return {
+            "id": row.last_session_id,
+            "group_id": row.last_session_group_id,
+            "created_at": row.last_session_created_at,
+            "study_activity_id": row.last_session_activity_id,
+            "group_name": row.last_session_group_name,
+        }
+
+    @staticmethod
+    async def get_summary(db: AsyncSession):
+        row = (
+            await db.execute(
+                DashboardService._summary_query(STUDY_PROGRESS, QUICK_STATS, LAST_STUDY_SESSION)
+            )
+        ).one()
+        return {
+            "study_progress": DashboardService._study_progress(row),
+            "quick_stats": await DashboardService._quick_stats(db, row),
+            "last_study_session": DashboardService._last_study_session(row),
+        }
+
+    @staticmethod
+    async def get_last_study_session(db: AsyncSession):
+        return await db.scalar(
+            select(StudySession).order_by(StudySession.created_at.desc()).limit(1)
+        )
+
+    @staticmethod
+    async def get_study_progress(db: AsyncSession):
+        row = (await db.execute(DashboardService._summary_query(STUDY_PROGRESS))).one()
+        return DashboardService._study_progress(row)
+
+    @staticmethod
+    async def get_quick_stats(db: AsyncSession):
+        row = (await db.execute(DashboardService._summary_query(QUICK_STATS))).one()
+        return await DashboardService._quick_stats(db, row)
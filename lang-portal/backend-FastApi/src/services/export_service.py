@@ -0,0 +1,84 @@
+import csv
+import io
+import json
+from datetime import datetime
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from typing import AsyncIterator, Dict
+from ..models.study_session import StudySession
+from ..models.word import Word
+from ..models.word_review import WordReviewItem
+from ..schemas.export import ExportDataset, ExportFormat
+
+# Rows fetched per round trip; also the unit in which output is flushed
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_QUERIES = {
+    ExportDataset.words: select(
+        Word.id, Word.japanese, Word.romaji, Word.english, Word.parts, Word.updated_at
+    ).order_by(Word.id),
+    ExportDataset.reviews: select(
+        WordReviewItem.id,
+        WordReviewItem.word_id,
+        WordReviewItem.study_session_id,
+        WordReviewItem.correct,
+        WordReviewItem.created_at,
+    ).order_by(WordReviewItem.id),
+    ExportDataset.sessions: select(
+        StudySession.id,
+        StudySession.group_id,
+        StudySession.study_activity_id,
+        StudySession.created_at,
+    ).order_by(StudySession.id),
+}
+
+MEDIA_TYPES = {
+    ExportFormat.ndjson: "application/x-ndjson",
+    ExportFormat.csv: "text/csv; charset=utf-8",
+}
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+def _csv_value(value):
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+def _ndjson_lines(rows) -> str:
+    return "".join(
+        json.dumps(dict(row._mapping), ensure_ascii=False, default=_json_default) + "\n"
+        for row in rows
+    )
+
+def _csv_lines(rows) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows([_csv_value(value) for value in row] for row in rows)
+    return buffer.getvalue()
+
+class ExportService:
+    @staticmethod
+    async def stream(
+        sessionmaker: async_sessionmaker, dataset: ExportDataset, fmt: ExportFormat
+    ) -> AsyncIterator[str]:
+        """Yield the dataset one fetched batch at a time over a server-side cursor.
+
+        Opens its own session: the body is produced after the request's
+        get_db session has already been closed.
+        """
+        query = EXPORT_QUERIES[dataset]
+        if fmt == ExportFormat.csv:
+            buffer = io.StringIO()
+            csv.writer(buffer).writerow(query.selected_columns.keys())
+            yield buffer.getvalue()
+
+        encode = _csv_lines if fmt == ExportFormat.csv else _ndjson_lines
+        async with sessionmaker() as db:
+            result = await db.stream(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+            async for rows in result.partitions():
+                yield encode(rows)
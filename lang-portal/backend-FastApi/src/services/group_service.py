@@ -1,44 +1,215 @@
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy import delete, func, select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from typing import List, Optional, Sequence
+from ..core.database import dialect_insert
+from ..core.pagination import keyset_filter
 from ..models.group import Group
+from ..models.group_counters import WORDS_GROUPS_COUNTER_DDL  # noqa: F401 - registers the counter triggers
+from ..models.word import Word, words_groups
+from ..models.word_review_stats import WordReviewStats
+from ..models.word_schedule import WordSchedule
 from ..schemas.group import GroupCreate, GroupUpdate
+from ..schemas.word import WordSortField, SortOrder
 from ..models.study_session import StudySession
+from .change_service import ChangeService, UPSERT, DELETE
+from .word_service import WORD_ROW_COLUMNS
+
+# Sort expressions for group word listings; review stats default to 0 for unreviewed words
+GROUP_WORD_SORT_COLUMNS = {
+    WordSortField.id: Word.id,
+    WordSortField.japanese: Word.japanese,
+    WordSortField.romaji: Word.romaji,
+    WordSortField.english: Word.english,
+    WordSortField.correct_count: func.coalesce(WordReviewStats.correct_count, 0),
+    WordSortField.wrong_count: func.coalesce(WordReviewStats.wrong_count, 0),
+}
+
+# Group schema fields, in order, for the encoded group list
+GROUP_ROW_COLUMNS = (
+    Group.name, Group.id, Group.word_count, Group.session_count, Group.last_studied_at,
+)
 
 class GroupService:
     @staticmethod
-    async def get_groups(db: Session, skip: int = 0, limit: int = 100) -> List[Group]:
-        return db.query(Group).offset(skip).limit(limit).all()
+    async def get_groups(
+        db: AsyncSession, skip: int = 0, limit: int = 100, after: Optional[Sequence] = None
+    ) -> List[Row]:
+        """A page of Group rows (the schema's fields, in its order) by id"""
+        query = select(*GROUP_ROW_COLUMNS).order_by(Group.id)
+        if after is not None:
+            query = query.where(keyset_filter([Group.id], after))
+        else:
+            query = query.offset(skip)
+        return (await db.execute(query.limit(limit))).all()
 
     @staticmethod
-    async def get_group(db: Session, group_id: int) -> Optional[Group]:
-        return db.query(Group).filter(Group.id == group_id).first()
+    async def get_group(db: AsyncSession, group_id: int) -> Optional[dict]:
+        """GroupDetail in two statements.
+
+        Counts come from the group row's trigger-maintained counters, and
+        selectinload fetches all member words in one IN query instead of a
+        lazy load per access.
+        """
+        group = await db.scalar(
+            select(Group).options(selectinload(Group.words)).where(Group.id == group_id)
+        )
+        if group is None:
+            return None
+
+        return {
+            "id": group.id,
+            "name": group.name,
+            "created_at": group.created_at,
+            "words": group.words,
+            "word_count": group.word_count,
+            "session_count": group.session_count,
+            "last_studied_at": group.last_studied_at,
+            "total_words": group.word_count,
+            "study_sessions_count": group.session_count,
+        }
 
     @staticmethod
-    async def create_group(db: Session, group: GroupCreate) -> Group:
+    async def create_group(db: AsyncSession, group: GroupCreate) -> Group:
         db_group = Group(**group.dict())
         db.add(db_group)
-        db.commit()
-        db.refresh(db_group)
+        await db.flush()
+        await ChangeService.record(db, "groups", UPSERT, [{"group_id": db_group.id}])
+        await db.commit()
+        await db.refresh(db_group)
         return db_group
 
     @staticmethod
-    async def get_group_words(db: Session, group_id: int, skip: int = 0, limit: int = 100):
-        group = await GroupService.get_group(db, group_id)
-        if group:
-            return group.words[skip:skip + limit]
-        return []
+    async def delete_group(db: AsyncSession, group_id: int) -> bool:
+        """Delete a group and its memberships; groups with study sessions are kept.
+
+        Raises ValueError if study sessions still reference the group.
+        """
+        group = await db.get(Group, group_id)
+        if group is None:
+            return False
+        if group.session_count:
+            raise ValueError("Group has study sessions and cannot be deleted")
+
+        word_ids = (
+            await db.scalars(
+                delete(words_groups)
+                .where(words_groups.c.group_id == group_id)
+                .returning(words_groups.c.word_id)
+            )
+        ).all()
+        await ChangeService.record(
+            db, "words_groups", DELETE,
+            [{"word_id": word_id, "group_id": group_id} for word_id in word_ids],
+        )
+        await db.execute(delete(Group).where(Group.id == group_id))
+        await ChangeService.record(db, "groups", DELETE, [{"group_id": group_id}])
+        await db.commit()
+        return True
+
+    @staticmethod
+    async def add_words(db: AsyncSession, group_id: int, word_ids: List[int]) -> Optional[int]:
+        """Link words to a group; returns how many links are new, or None if no group.
+
+        Raises ValueError listing unknown word ids, in which case nothing is linked.
+        """
+        if await db.get(Group, group_id) is None:
+            return None
+        word_ids = set(word_ids)
+        known_ids = set((await db.scalars(select(Word.id).where(Word.id.in_(word_ids)))).all())
+        missing_ids = sorted(word_ids - known_ids)
+        if missing_ids:
+            raise ValueError(f"Unknown word ids: {missing_ids}")
+        if not word_ids:
+            return 0
+
+        new_links = (
+            await db.execute(
+                dialect_insert(db, words_groups)
+                .on_conflict_do_nothing()
+                .returning(words_groups.c.word_id),
+                [{"word_id": word_id, "group_id": group_id} for word_id in sorted(word_ids)],
+            )
+        ).all()
+        await ChangeService.record(
+            db, "words_groups", UPSERT,
+            [{"word_id": row.word_id, "group_id": group_id} for row in new_links],
+        )
+        await db.commit()
+        return len(new_links)
+
+    @staticmethod
+    async def remove_word(db: AsyncSession, group_id: int, word_id: int) -> bool:
+        removed = await db.execute(
+            delete(words_groups).where(
+                words_groups.c.group_id == group_id, words_groups.c.word_id == word_id
+            )
+        )
+        if not removed.rowcount:
+            return False
+        await db.execute(
+            delete(WordSchedule).where(
+                WordSchedule.group_id == group_id, WordSchedule.word_id == word_id
+            )
+        )
+        await ChangeService.record(
+            db, "words_groups", DELETE, [{"word_id": word_id, "group_id": group_id}]
+        )
+        await db.commit()
+        return True
 
     @staticmethod
-    async def get_group_study_sessions(db: Session, group_id: int):
+    async def get_group_words(
+        db: AsyncSession,
+        group_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[Sequence] = None,
+        sort_by: WordSortField = WordSortField.id,
+        order: SortOrder = SortOrder.asc,
+    ) -> Optional[List[Row]]:
+        """Page through a group's words, as WordWithStats rows, with the join,
+        sort and limit done in SQL"""
+        if await db.get(Group, group_id) is None:
+            return None
+
+        descending = order == SortOrder.desc
+        sort_columns = [GROUP_WORD_SORT_COLUMNS[sort_by]]
+        if sort_by != WordSortField.id:
+            sort_columns.append(Word.id)
+
+        query = (
+            select(*WORD_ROW_COLUMNS)
+            .join(words_groups, words_groups.c.word_id == Word.id)
+            .outerjoin(WordReviewStats, WordReviewStats.word_id == Word.id)
+            .where(words_groups.c.group_id == group_id)
+            .order_by(*[c.desc() if descending else c.asc() for c in sort_columns])
+        )
+        if after is not None:
+            query = query.where(keyset_filter(sort_columns, after, descending))
+        else:
+            query = query.offset(skip)
+        return (await db.execute(query.limit(limit))).all()
+
+    @staticmethod
+    async def count_group_words(db: AsyncSession, group_id: int) -> int:
+        return await db.scalar(
+            select(func.count())
+            .select_from(words_groups)
+            .where(words_groups.c.group_id == group_id)
+        )
+
+    @staticmethod
+    async def get_group_study_sessions(db: AsyncSession, group_id: int):
         """Get all study sessions for a specific group"""
-        group = db.query(Group).filter(Group.id == group_id).first()
+        group = await db.get(Group, group_id)
         if not group:
             return None
-            
-        sessions = (
-            db.query(StudySession)
-            .filter(StudySession.group_id == group_id)
+
+        sessions = await db.scalars(
+            select(StudySession)
+            .where(StudySession.group_id == group_id)
             .order_by(StudySession.created_at.desc())
-            .all()
         )
-        return sessions 
\ No newline at end of file
+        return sessions.all()
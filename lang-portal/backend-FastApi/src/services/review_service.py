@@ -0,0 +1,133 @@
+from sqlalchemy import case, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import func
+from typing import Dict, List, Optional
+from ..core.database import dialect_insert
+from ..models.study_session import StudySession
+from ..models.word import Word
+from ..models.word_review import WordReviewItem
+from ..models.word_review_stats import WordReviewStats
+from ..schemas.word_review import WordReviewBatchItem
+from .activity_service import ActivityService
+from .schedule_service import ScheduleService
+from .version_service import VersionService
+
+class ReviewService:
+    @staticmethod
+    async def _apply_stats(db: AsyncSession, outcomes: Dict[int, Dict[str, int]]):
+        """Fold review outcomes into the word_review_stats rollup.
+
+        Runs inside the caller's transaction so the rollup never drifts from
+        word_review_items.
+        """
+        if not outcomes:
+            return
+        rows = [
+            {
+                "word_id": word_id,
+                "correct_count": counts["correct"],
+                "wrong_count": counts["wrong"],
+                "last_reviewed": func.now(),
+            }
+            for word_id, counts in outcomes.items()
+        ]
+        stmt = dialect_insert(db, WordReviewStats).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[WordReviewStats.word_id],
+            set_={
+                "correct_count": WordReviewStats.correct_count + stmt.excluded.correct_count,
+                "wrong_count": WordReviewStats.wrong_count + stmt.excluded.wrong_count,
+                "last_reviewed": stmt.excluded.last_reviewed,
+            },
+        )
+        await db.execute(stmt)
+
+    @staticmethod
+    async def record_review(
+        db: AsyncSession, session_id: int, word_id: int, correct: bool
+    ) -> Optional[WordReviewItem]:
+        """Record a single review; returns None if the session or word is missing"""
+        session = await db.get(StudySession, session_id)
+        if session is None or await db.get(Word, word_id) is None:
+            return None
+
+        review = WordReviewItem(
+            word_id=word_id, study_session_id=session_id, correct=correct
+        )
+        db.add(review)
+        await db.flush()
+        await ReviewService._apply_stats(
+            db, {word_id: {"correct": int(correct), "wrong": int(not correct)}}
+        )
+        await ScheduleService.apply_reviews(db, session.group_id, [(word_id, correct)])
+        await ActivityService.record_reviews(db, [review.id])
+        await VersionService.bump(db, "word_review_items")
+        await db.commit()
+        await db.refresh(review)
+        return review
+
+    @staticmethod
+    async def record_reviews(
+        db: AsyncSession, session_id: int, reviews: List[WordReviewBatchItem]
+    ) -> Optional[dict]:
+        """Record many reviews for one session in a single transaction.
+
+        Returns None if the session is missing and raises ValueError listing
+        any unknown word ids, in which case nothing is written.
+        """
+        session = await db.get(StudySession, session_id)
+        if session is None:
+            return None
+
+        word_ids = {review.word_id for review in reviews}
+        known_ids = set(
+            (await db.scalars(select(Word.id).where(Word.id.in_(word_ids)))).all()
+        )
+        missing_ids = sorted(word_ids - known_ids)
+        if missing_ids:
+            raise ValueError(f"Unknown word ids: {missing_ids}")
+
+        outcomes: Dict[int, Dict[str, int]] = {}
+        for review in reviews:
+            counts = outcomes.setdefault(review.word_id, {"correct": 0, "wrong": 0})
+            counts["correct" if review.correct else "wrong"] += 1
+
+        if reviews:
+            review_ids = (await db.scalars(
+                insert(WordReviewItem).returning(WordReviewItem.id),
+                [
+                    {
+                        "word_id": review.word_id,
+                        "study_session_id": session_id,
+                        "correct": review.correct,
+                    }
+                    for review in reviews
+                ],
+            )).all()
+            await ReviewService._apply_stats(db, outcomes)
+            await ScheduleService.apply_reviews(
+                db, session.group_id, [(review.word_id, review.correct) for review in reviews]
+            )
+            await ActivityService.record_reviews(db, review_ids)
+            await VersionService.bump(db, "word_review_items")
+            await db.commit()
+
+        return await ReviewService.get_session_stats(db, session_id)
+
+    @staticmethod
+    async def get_session_stats(db: AsyncSession, session_id: int) -> dict:
+        correct_count, total_count = (
+            await db.execute(
+                select(
+                    func.coalesce(func.sum(case((WordReviewItem.correct == True, 1), else_=0)), 0),
+                    func.count(WordReviewItem.id),
+                ).where(WordReviewItem.study_session_id == session_id)
+            )
+        ).one()
+        return {
+            "study_session_id": session_id,
+            "correct_count": correct_count,
+            "wrong_count": total_count - correct_count,
+            "total_count": total_count,
+            "success_rate": (correct_count / total_count * 100) if total_count > 0 else 0.0,
+        }
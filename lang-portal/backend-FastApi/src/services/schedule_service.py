@@ -0,0 +1,177 @@
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+from ..core.database import dialect_insert
+from ..models.group import Group
+from ..models.word import Word, words_groups
+from ..models.word_schedule import WordSchedule
+
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+# SM-2 grades on a 0-5 scale; reviews here are pass/fail
+CORRECT_QUALITY = 4
+WRONG_QUALITY = 2
+
+class ScheduleState(NamedTuple):
+    repetitions: int
+    interval_days: float
+    ease: float
+
+NEW_CARD = ScheduleState(repetitions=0, interval_days=0.0, ease=DEFAULT_EASE)
+
+def sm2(state: ScheduleState, correct: bool) -> ScheduleState:
+    """Next SM-2 state after one review"""
+    quality = CORRECT_QUALITY if correct else WRONG_QUALITY
+    if correct:
+        if state.repetitions == 0:
+            interval = 1.0
+        elif state.repetitions == 1:
+            interval = 6.0
+        else:
+            interval = state.interval_days * state.ease
+        repetitions = state.repetitions + 1
+    else:
+        interval = 1.0
+        repetitions = 0
+    ease = state.ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02)
+    return ScheduleState(repetitions, interval, max(MIN_EASE, ease))
+
+class ScheduleService:
+    @staticmethod
+    async def apply_reviews(
+        db: AsyncSession, group_id: Optional[int], reviews: Iterable[Tuple[int, bool]]
+    ):
+        """Advance the schedule of each reviewed (word_id, correct) in the group.
+
+        Reviews are applied in order, so a word reviewed twice in one batch
+        moves twice. Words outside the group are not scheduled in it. Runs
+        inside the caller's transaction.
+        """
+        reviews = list(reviews)
+        if group_id is None or not reviews:
+            return
+
+        word_ids = set(
+            await db.scalars(
+                select(words_groups.c.word_id).where(
+                    words_groups.c.group_id == group_id,
+                    words_groups.c.word_id.in_({word_id for word_id, _ in reviews}),
+                )
+            )
+        )
+        reviews = [(word_id, correct) for word_id, correct in reviews if word_id in word_ids]
+        if not reviews:
+            return
+        rows = await db.execute(
+            select(
+                WordSchedule.word_id,
+                WordSchedule.repetitions,
+                WordSchedule.interval_days,
+                WordSchedule.ease,
+            )
+            .where(WordSchedule.group_id == group_id, WordSchedule.word_id.in_(word_ids))
+            # Concurrent reviews of a word (other workers) wait rather than
+            # overwrite each other's step; SQLite already serializes writers
+            .with_for_update()
+        )
+        states = {row.word_id: ScheduleState(*row[1:]) for row in rows}
+        for word_id, correct in reviews:
+            states[word_id] = sm2(states.get(word_id, NEW_CARD), correct)
+
+        now = datetime.now(timezone.utc)
+        stmt = dialect_insert(db, WordSchedule).values(
+            [
+                {
+                    "group_id": group_id,
+                    "word_id": word_id,
+                    "due_at": now + timedelta(days=state.interval_days),
+                    "interval_days": state.interval_days,
+                    "ease": state.ease,
+                    "repetitions": state.repetitions,
+                }
+                for word_id, state in states.items()
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[WordSchedule.group_id, WordSchedule.word_id],
+            set_={
+                "due_at": stmt.excluded.due_at,
+                "interval_days": stmt.excluded.interval_days,
+                "ease": stmt.excluded.ease,
+                "repetitions": stmt.excluded.repetitions,
+            },
+        )
+        await db.execute(stmt)
+
+    @staticmethod
+    def due_query(group_id: int, now: datetime, limit: int):
+        """Scheduled words due in the group, still members of it"""
+        return (
+            select(Word, WordSchedule)
+            .join(WordSchedule, WordSchedule.word_id == Word.id)
+            # A word removed from the group keeps its schedule row, but
+            # leaves the group's queue
+            .join(
+                words_groups,
+                and_(
+                    words_groups.c.group_id == WordSchedule.group_id,
+                    words_groups.c.word_id == WordSchedule.word_id,
+                ),
+            )
+            .options(joinedload(Word.stats))
+            .where(WordSchedule.group_id == group_id, WordSchedule.due_at <= now)
+            .order_by(WordSchedule.due_at, WordSchedule.word_id)
+            .limit(limit)
+        )
+
+    @staticmethod
+    async def get_due(
+        db: AsyncSession, group_id: int, limit: int = 20, include_new: bool = True
+    ) -> Optional[List[dict]]:
+        """Words due for review in a group, most overdue first; None if no group.
+
+        With include_new, any room left under `limit` is filled with group
+        words that have never been reviewed in this group.
+        """
+        if await db.get(Group, group_id) is None:
+            return None
+        now = datetime.now(timezone.utc)
+        due = [
+            {
+                "word": word,
+                "due_at": schedule.due_at,
+                "interval_days": schedule.interval_days,
+                "ease": schedule.ease,
+                "repetitions": schedule.repetitions,
+            }
+            for word, schedule in await db.execute(ScheduleService.due_query(group_id, now, limit))
+        ]
+        if include_new and len(due) < limit:
+            new_words = await db.scalars(
+                select(Word)
+                .join(words_groups, words_groups.c.word_id == Word.id)
+                .outerjoin(
+                    WordSchedule,
+                    and_(
+                        WordSchedule.group_id == words_groups.c.group_id,
+                        WordSchedule.word_id == words_groups.c.word_id,
+                    ),
+                )
+                .options(joinedload(Word.stats))
+                .where(words_groups.c.group_id == group_id, WordSchedule.word_id.is_(None))
+                .order_by(Word.id)
+                .limit(limit - len(due))
+            )
+            due.extend(
+                {
+                    "word": word,
+                    "due_at": None,
+                    "interval_days": NEW_CARD.interval_days,
+                    "ease": NEW_CARD.ease,
+                    "repetitions": NEW_CARD.repetitions,
+                }
+                for word in new_words
+            )
+        return due
@@ -1,21 +1,32 @@
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Sequence
+from ..core.pagination import keyset_filter
 from ..models.study_activity import StudyActivity
 from ..schemas.study_activity import StudyActivityCreate
+from .version_service import VersionService
 
 class StudyActivityService:
     @staticmethod
-    async def get_study_activities(db: Session, skip: int = 0, limit: int = 100) -> List[StudyActivity]:
-        return db.query(StudyActivity).offset(skip).limit(limit).all()
+    async def get_study_activities(
+        db: AsyncSession, skip: int = 0, limit: int = 100, after: Optional[Sequence] = None
+    ) -> List[StudyActivity]:
+        query = select(StudyActivity).order_by(StudyActivity.id)
+        if after is not None:
+            query = query.where(keyset_filter([StudyActivity.id], after))
+        else:
+            query = query.offset(skip)
+        return (await db.scalars(query.limit(limit))).all()
 
     @staticmethod
-    async def get_study_activity(db: Session, activity_id: int) -> Optional[StudyActivity]:
-        return db.query(StudyActivity).filter(StudyActivity.id == activity_id).first()
+    async def get_study_activity(db: AsyncSession, activity_id: int) -> Optional[StudyActivity]:
+        return await db.get(StudyActivity, activity_id)
 
     @staticmethod
-    async def create_study_activity(db: Session, activity: StudyActivityCreate) -> StudyActivity:
+    async def create_study_activity(db: AsyncSession, activity: StudyActivityCreate) -> StudyActivity:
         db_activity = StudyActivity(**activity.dict())
         db.add(db_activity)
-        db.commit()
-        db.refresh(db_activity)
-        return db_activity 
\ No newline at end of file
+        await VersionService.bump(db, "study_activities")
+        await db.commit()
+        await db.refresh(db_activity)
+        return db_activity
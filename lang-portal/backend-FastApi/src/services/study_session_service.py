@@ -1,21 +1,78 @@
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy import select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from typing import List, Optional, Sequence
+from ..core.pagination import keyset_filter
 from ..models.study_session import StudySession
+from ..models.word import Word
+from ..models.word_review import WordReviewItem
+from ..models.word_review_stats import WordReviewStats  # noqa: F401 - registers Word.stats
 from ..schemas.study_session import StudySessionCreate
+from .review_service import ReviewService
+from .activity_service import ActivityService
+from .version_service import VersionService
+
+# StudySession schema fields, in order, for the encoded session list
+STUDY_SESSION_ROW_COLUMNS = (
+    StudySession.group_id, StudySession.study_activity_id, StudySession.id, StudySession.created_at,
+)
 
 class StudySessionService:
     @staticmethod
-    async def get_study_sessions(db: Session, skip: int = 0, limit: int = 100) -> List[StudySession]:
-        return db.query(StudySession).offset(skip).limit(limit).all()
+    async def get_study_sessions(
+        db: AsyncSession, skip: int = 0, limit: int = 100, after: Optional[Sequence] = None
+    ) -> List[Row]:
+        """A page of StudySession rows (the schema's fields, in its order) by id"""
+        # Ids are assigned in creation order, so (id) doubles as (created_at, id)
+        query = select(*STUDY_SESSION_ROW_COLUMNS).order_by(StudySession.id)
+        if after is not None:
+            query = query.where(keyset_filter([StudySession.id], after))
+        else:
+            query = query.offset(skip)
+        return (await db.execute(query.limit(limit))).all()
 
     @staticmethod
-    async def get_study_session(db: Session, session_id: int) -> Optional[StudySession]:
-        return db.query(StudySession).filter(StudySession.id == session_id).first()
+    async def get_study_session(db: AsyncSession, session_id: int) -> Optional[dict]:
+        """StudySessionDetail in three statements regardless of session size.
+
+        Session row, one aggregate for the counts, and the distinct reviewed
+        words with their review stats joined in (never review_items -> word).
+        """
+        session = await db.get(StudySession, session_id)
+        if session is None:
+            return None
+
+        stats = await ReviewService.get_session_stats(db, session_id)
+        reviewed_word_ids = (
+            select(WordReviewItem.word_id)
+            .where(WordReviewItem.study_session_id == session_id)
+            .distinct()
+        )
+        words = await db.scalars(
+            select(Word)
+            .options(joinedload(Word.stats))
+            .where(Word.id.in_(reviewed_word_ids))
+            .order_by(Word.id)
+        )
+
+        return {
+            "id": session.id,
+            "group_id": session.group_id,
+            "study_activity_id": session.study_activity_id,
+            "created_at": session.created_at,
+            "words": words.all(),
+            "correct_count": stats["correct_count"],
+            "total_count": stats["total_count"],
+        }
 
     @staticmethod
-    async def create_study_session(db: Session, session: StudySessionCreate) -> StudySession:
+    async def create_study_session(db: AsyncSession, session: StudySessionCreate) -> StudySession:
         db_session = StudySession(**session.dict())
         db.add(db_session)
-        db.commit()
-        db.refresh(db_session)
-        return db_session 
\ No newline at end of file
+        await db.flush()
+        await ActivityService.record_session(db, db_session.id)
+        await VersionService.bump(db, "study_sessions")
+        await db.commit()
+        await db.refresh(db_session)
+        return db_session
@@ -0,0 +1,37 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, Iterable
+from ..core.database import dialect_insert
+from ..models.change_version import ChangeVersion
+
+EPOCH_KEY = "_epoch"
+
+def bump_statement(db, *tables: str):
+    """UPSERT incrementing the change version of each table; `db` may be a
+    sync (scripts) or async session"""
+    stmt = dialect_insert(db, ChangeVersion).values(
+        [{"table_name": table, "version": 1} for table in tables]
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[ChangeVersion.table_name],
+        set_={"version": ChangeVersion.version + 1},
+    )
+
+class VersionService:
+    @staticmethod
+    async def bump(db: AsyncSession, *tables: str):
+        """Increment the change version of each table in the caller's transaction"""
+        await db.execute(bump_statement(db, *tables))
+
+    @staticmethod
+    async def get_versions(db: AsyncSession, tables: Iterable[str]) -> Dict[str, int]:
+        """Current versions for `tables` plus the database epoch; unknown tables are 0"""
+        keys = [EPOCH_KEY, *tables]
+        rows = await db.execute(
+            select(ChangeVersion.table_name, ChangeVersion.version).where(
+                ChangeVersion.table_name.in_(keys)
+            )
+        )
+        versions = dict.fromkeys(keys, 0)
+        versions.update(dict(rows.all()))
+        return versions
@@ -0,0 +1,48 @@
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+from ..core import japanese as ja
+from ..models.word_part import WordPart
+
+def _texts(value: Any) -> Iterator[str]:
+    """Every string inside a parts JSON value, however it is nested"""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _texts(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _texts(item)
+
+def word_part_rows(word_id: int, japanese: Optional[str], parts: Any) -> List[dict]:
+    """word_parts rows for one word: each distinct kanji or kana character
+    of its japanese text and of the strings in its parts"""
+    rows = {}
+    for text in [japanese or "", *_texts(parts)]:
+        for char in text:
+            kind = ja.char_kind(char)
+            if kind is not None and char not in rows:
+                rows[char] = {"char": char, "word_id": word_id, "kind": kind}
+    return list(rows.values())
+
+class WordPartService:
+    @staticmethod
+    async def add(db: AsyncSession, words: Iterable[Tuple[int, Optional[str], Any]]):
+        """Index new words, given as (id, japanese, parts), in the caller's transaction"""
+        rows = [row for word in words for row in word_part_rows(*word)]
+        if rows:
+            await db.execute(insert(WordPart), rows)
+
+    @staticmethod
+    async def replace(db: AsyncSession, words: Iterable[Tuple[int, Optional[str], Any]]):
+        """Re-index words whose japanese text or parts may have changed"""
+        words = list(words)
+        if not words:
+            return
+        await WordPartService.delete(db, [word[0] for word in words])
+        await WordPartService.add(db, words)
+
+    @staticmethod
+    async def delete(db: AsyncSession, word_ids: List[int]):
+        await db.execute(delete(WordPart).where(WordPart.word_id.in_(word_ids)))
@@ -1,31 +1,496 @@
-from sqlalchemy.orm import Session
-from typing import List, Optional
-from ..models.word import Word
-from ..schemas.word import WordCreate, WordUpdate
+import random
+from collections import OrderedDict
+from pydantic import ValidationError
+from sqlalchemy import (
+    Float, case, cast, column, delete, func, insert, literal_column, or_, select, table, tuple_,
+    update,
+)
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+from ..core.database import dialect_insert
+from ..core import japanese as ja
+from ..core.pagination import keyset_filter
+from ..models.group import Group
+from ..models.word import Word, words_groups
+from ..models.word_review import WordReviewItem
+from ..models.word_review_stats import WordReviewStats
+from ..models.word_part import WordPart
+from ..models.word_schedule import WordSchedule
+from ..models.word_search import WORDS_FTS_DDL  # noqa: F401 - registers the FTS DDL
+from ..schemas.word import WordCreate, WordPatch, WordUpdate
+from .activity_service import ActivityService
+from .change_service import ChangeService, UPSERT, DELETE
+from .version_service import VersionService
+from .word_part_service import WordPartService
+
+words_fts = table("words_fts", column("rowid"))
+words_fts_ja = table("words_fts_ja", column("rowid"), column("japanese"), column("parts"))
+
+# bm25 column weights: japanese, romaji, english, parts
+_FTS_WEIGHTS = (10.0, 5.0, 2.0, 1.0)
+
+def _fts_phrase(text: str) -> str:
+    return '"' + text.replace('"', '""') + '"'
+
+def search_terms(q: str) -> List[List[str]]:
+    """The terms of a search, each with its alternate spellings: kana in both
+    scripts, and romaji with long vowels folded"""
+    terms = []
+    for token in ja.normalize(q).split():
+        token = "".join(c for c in token if c.isalnum())
+        if not token:
+            continue
+        variants = {token}
+        if ja.is_kana(token):
+            variants |= {ja.to_hiragana(token), ja.to_katakana(token)}
+        elif token.isascii():
+            variants.add(ja.fold_long_vowels(token))
+        terms.append(sorted(variants))
+    return terms
+
+def _term_match(variants: List[str]) -> str:
+    """FTS5 query for one term: any spelling as a prefix; kana also match
+    the reading stored as single characters in parts"""
+    alternatives = [_fts_phrase(v) + "*" for v in variants]
+    if ja.is_kana(variants[0]):
+        alternatives.append("parts : " + _fts_phrase(" ".join(ja.to_hiragana(variants[0]))))
+    return "(" + " OR ".join(alternatives) + ")"
+
+def build_match_query(q: str) -> Optional[str]:
+    """Turn user input into an FTS5 prefix query, or None if nothing is searchable.
+
+    Every term must match, in any of its spellings (see search_terms).
+    """
+    terms = [_term_match(variants) for variants in search_terms(q)]
+    return " AND ".join(terms) if terms else None
+
+def _term_filter(variants: List[str]):
+    """Words matching one search term: by prefix in words_fts or, for a
+    Japanese term, anywhere inside the Japanese text via words_fts_ja"""
+    fts = literal_column("words_fts")
+    condition = Word.id.in_(
+        select(words_fts.c.rowid).where(fts.op("MATCH")(_term_match(variants)))
+    )
+    if any(ja.char_kind(char) for char in variants[0]):
+        # trigram answers a phrase of 3+ characters from its index; shorter
+        # terms have no trigram, so they are LIKE scans of the (small) index.
+        # search_terms leaves only alphanumerics, so no LIKE wildcards.
+        fts_ja = literal_column("words_fts_ja")
+        if len(variants[0]) >= 3:
+            match = " OR ".join(_fts_phrase(variant) for variant in variants)
+            substring = fts_ja.op("MATCH")(match)
+        else:
+            substring = or_(*[
+                column.like(f"%{variant}%")
+                for variant in variants
+                for column in (words_fts_ja.c.japanese, words_fts_ja.c.parts)
+            ])
+        condition = condition | Word.id.in_(select(words_fts_ja.c.rowid).where(substring))
+    return condition
+
+_correct_count = func.coalesce(WordReviewStats.correct_count, 0)
+_wrong_count = func.coalesce(WordReviewStats.wrong_count, 0)
+_reviews = _correct_count + _wrong_count
+
+# WordWithStats as plain columns, in the schema's field order, for list
+# endpoints that encode rows directly (see core/responses.py). Select from
+# Word outer-joined to WordReviewStats. success_rate repeats the Word
+# property's arithmetic so both paths produce the same float.
+WORD_ROW_COLUMNS = (
+    Word.japanese,
+    Word.romaji,
+    Word.english,
+    Word.parts,
+    Word.id,
+    _correct_count.label("correct_count"),
+    _wrong_count.label("wrong_count"),
+    case((_reviews > 0, cast(_correct_count, Float) / cast(_reviews, Float) * 100), else_=0.0)
+    .label("success_rate"),
+    WordReviewStats.last_reviewed,
+)
+
+# Tables whose versions decide whether the cached id arrays are still valid
+_RANDOM_ID_TABLES = ("words", "groups", "words_groups")
+
+# Id arrays kept at once; the least recently used group is dropped first
+_RANDOM_ID_MAX_GROUPS = 256
+
+class _RandomIdCache:
+    """Dense word id arrays per group (None key: all words), for O(n) sampling.
+
+    Entries are built against one set of table versions; when any of them
+    moves, the whole cache is dropped and arrays are rebuilt on demand.
+    Unknown groups are not cached, so arbitrary group ids cannot grow it.
+    """
+
+    def __init__(self, max_groups: int = _RANDOM_ID_MAX_GROUPS):
+        self.max_groups = max_groups
+        self.versions: Optional[Dict[str, int]] = None
+        self.ids: "OrderedDict[Optional[int], List[int]]" = OrderedDict()
+
+    async def get(self, db: AsyncSession, group_id: Optional[int]) -> Optional[List[int]]:
+        """Word ids in the group, or None if the group does not exist"""
+        versions = await VersionService.get_versions(db, _RANDOM_ID_TABLES)
+        if versions != self.versions:
+            self.versions, self.ids = versions, OrderedDict()
+        versions = self.versions
+        ids = self.ids.get(group_id)
+        if ids is not None:
+            self.ids.move_to_end(group_id)
+            return ids
+
+        if group_id is None:
+            query = select(Word.id)
+        elif await db.get(Group, group_id) is None:
+            return None
+        else:
+            query = select(words_groups.c.word_id).where(words_groups.c.group_id == group_id)
+        ids = list((await db.scalars(query)).all())
+        # Another request may have reset the cache for newer versions while
+        # this one awaited; its ids were read against the old ones
+        if self.versions is versions:
+            self.ids[group_id] = ids
+            while len(self.ids) > self.max_groups:
+                self.ids.popitem(last=False)
+        return ids
+
+_random_ids = _RandomIdCache()
+
+class WordImportError(ValueError):
+    """The import stream broke off; batches before `offset` are committed.
+
+    `result` holds the progress so far, in the shape import_words returns,
+    and `offset` is the index of the item that could not be read.
+    """
+
+    def __init__(self, message: str, result: dict, offset: int):
+        super().__init__(message)
+        self.result = result
+        self.offset = offset
 
 class WordService:
     @staticmethod
-    async def get_words(db: Session, skip: int = 0, limit: int = 100) -> List[Word]:
-        return db.query(Word).offset(skip).limit(limit).all()
+    def list_query(
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[Sequence] = None,
+        contains_char: Optional[str] = None,
+    ):
+        """A page of WordWithStats rows in id order, optionally only words
+        containing a kanji or kana"""
+        query = select(*WORD_ROW_COLUMNS).outerjoin(
+            WordReviewStats, WordReviewStats.word_id == Word.id
+        )
+        key = Word.id
+        if contains_char is not None:
+            # Ordering by word_parts' own key lets the (char, word_id) primary
+            # key deliver the page in order, without a sort
+            key = WordPart.word_id
+            query = query.join(WordPart, WordPart.word_id == Word.id).where(
+                WordPart.char == contains_char
+            )
+        query = query.order_by(key)
+        if after is not None:
+            query = query.where(keyset_filter([key], after))
+        else:
+            query = query.offset(skip)
+        return query.limit(limit)
+
+    @staticmethod
+    async def get_words(
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[Sequence] = None,
+        contains_char: Optional[str] = None,
+    ) -> List[Row]:
+        query = WordService.list_query(skip, limit, after, contains_char)
+        return (await db.execute(query)).all()
+
+    @staticmethod
+    async def get_word(db: AsyncSession, word_id: int) -> Optional[Word]:
+        """WordWithStats in one statement, with the stats rollup joined in"""
+        return await db.scalar(
+            select(Word).options(joinedload(Word.stats)).where(Word.id == word_id)
+        )
+
+    @staticmethod
+    async def get_words_by_ids(db: AsyncSession, ids: Sequence[int]) -> List[Row]:
+        """WordWithStats rows for `ids` in one IN query, in the order asked for;
+        unknown ids are skipped"""
+        if not ids:
+            return []
+        words = {
+            word.id: word
+            for word in await db.execute(
+                select(*WORD_ROW_COLUMNS)
+                .outerjoin(WordReviewStats, WordReviewStats.word_id == Word.id)
+                .where(Word.id.in_(set(ids)))
+            )
+        }
+        return [words[word_id] for word_id in ids if word_id in words]
 
     @staticmethod
-    async def get_word(db: Session, word_id: int) -> Optional[Word]:
-        return db.query(Word).filter(Word.id == word_id).first()
+    async def get_random_words(
+        db: AsyncSession, n: int, group_id: Optional[int] = None
+    ) -> Optional[List[Row]]:
+        """Up to n distinct random words, optionally from one group; None if no group"""
+        ids = await _random_ids.get(db, group_id)
+        if ids is None:
+            return None
+        return await WordService.get_words_by_ids(db, random.sample(ids, min(n, len(ids))))
 
     @staticmethod
-    async def create_word(db: Session, word: WordCreate) -> Word:
+    async def search_words(db: AsyncSession, q: str, limit: int = 20) -> List[Word]:
+        """Full-text search over japanese, romaji, english and parts, best match first;
+        Japanese terms also match anywhere inside the Japanese text"""
+        if db.get_bind().dialect.name != "sqlite":
+            return await WordService._search_words_like(db, q, limit)
+        terms = search_terms(q)
+        if not terms:
+            return []
+        # bm25 ranks words that match every term by prefix; words found only
+        # by a substring of their Japanese text follow, shortest first
+        fts = literal_column("words_fts")
+        ranked = (
+            select(words_fts.c.rowid, func.bm25(fts, *_FTS_WEIGHTS).label("rank"))
+            .where(fts.op("MATCH")(build_match_query(q)))
+            .subquery()
+        )
+        query = (
+            select(Word)
+            .outerjoin(ranked, ranked.c.rowid == Word.id)
+            .options(joinedload(Word.stats))
+            .where(*[_term_filter(variants) for variants in terms])
+            .order_by(
+                ranked.c.rank.is_(None), ranked.c.rank, func.length(Word.japanese), Word.id
+            )
+            .limit(limit)
+        )
+        return (await db.scalars(query)).all()
+
+    @staticmethod
+    async def _search_words_like(db: AsyncSession, q: str, limit: int) -> List[Word]:
+        """search_words without FTS5 (PostgreSQL): case-insensitive substring
+        matches on japanese, romaji and english, in id order"""
+        terms = search_terms(q)
+        if not terms:
+            return []
+        query = (
+            select(Word)
+            .options(joinedload(Word.stats))
+            .where(*[
+                or_(*[
+                    column.icontains(variant, autoescape=True)
+                    for variant in variants
+                    for column in (Word.japanese, Word.romaji, Word.english)
+                ])
+                for variants in terms
+            ])
+            .order_by(Word.id)
+            .limit(limit)
+        )
+        return (await db.scalars(query)).all()
+
+    @staticmethod
+    async def create_word(db: AsyncSession, word: WordCreate) -> Word:
         db_word = Word(**word.dict())
         db.add(db_word)
-        db.commit()
-        db.refresh(db_word)
+        await db.flush()
+        await WordPartService.add(db, [(db_word.id, db_word.japanese, db_word.parts)])
+        await ChangeService.record(db, "words", UPSERT, [{"word_id": db_word.id}])
+        await db.commit()
+        await db.refresh(db_word)
         return db_word
 
     @staticmethod
-    async def update_word(db: Session, word_id: int, word: WordUpdate) -> Optional[Word]:
+    async def update_word(db: AsyncSession, word_id: int, word: WordUpdate) -> Optional[Word]:
         db_word = await WordService.get_word(db, word_id)
         if db_word:
-            for key, value in word.dict(exclude_unset=True).items():
+            changes = word.dict(exclude_unset=True)
+            for key, value in changes.items():
                 setattr(db_word, key, value)
-            db.commit()
-            db.refresh(db_word)
-        return db_word 
\ No newline at end of file
+            if changes.keys() & {"japanese", "parts"}:
+                await WordPartService.replace(db, [(word_id, db_word.japanese, db_word.parts)])
+            await ChangeService.record(db, "words", UPSERT, [{"word_id": word_id}])
+            await db.commit()
+            await db.refresh(db_word)
+        return db_word
+
+    @staticmethod
+    async def patch_words(db: AsyncSession, patches: List[WordPatch]) -> List[Word]:
+        """Apply partial updates to many words in one transaction.
+
+        Raises ValueError listing unknown word ids, in which case nothing is
+        written. Returns the updated words in request order.
+        """
+        word_ids = [patch.id for patch in patches]
+        known_ids = set((await db.scalars(select(Word.id).where(Word.id.in_(set(word_ids))))).all())
+        missing_ids = sorted(set(word_ids) - known_ids)
+        if missing_ids:
+            raise ValueError(f"Unknown word ids: {missing_ids}")
+
+        # Bulk UPDATE by primary key: one executemany per distinct set of fields
+        rows = [patch.model_dump(exclude_unset=True) for patch in patches]
+        rows = [row for row in rows if len(row) > 1]
+        if rows:
+            await db.execute(update(Word), rows)
+            reindex_ids = {row["id"] for row in rows if row.keys() & {"japanese", "parts"}}
+            if reindex_ids:
+                await WordPartService.replace(db, await db.execute(
+                    select(Word.id, Word.japanese, Word.parts).where(Word.id.in_(reindex_ids))
+                ))
+            await ChangeService.record(
+                db, "words", UPSERT,
+                [{"word_id": word_id} for word_id in dict.fromkeys(row["id"] for row in rows)],
+            )
+            await db.commit()
+        return await WordService.get_words_by_ids(db, list(dict.fromkeys(word_ids)))
+
+    @staticmethod
+    async def delete_word(db: AsyncSession, word_id: int) -> bool:
+        """Delete a word with its group memberships and review history"""
+        if await db.get(Word, word_id) is None:
+            return False
+
+        group_ids = (
+            await db.scalars(
+                delete(words_groups)
+                .where(words_groups.c.word_id == word_id)
+                .returning(words_groups.c.group_id)
+            )
+        ).all()
+        await ChangeService.record(
+            db, "words_groups", DELETE,
+            [{"word_id": word_id, "group_id": group_id} for group_id in group_ids],
+        )
+
+        await ActivityService.remove_word_reviews(db, word_id)
+        await db.execute(delete(WordReviewStats).where(WordReviewStats.word_id == word_id))
+        await db.execute(delete(WordSchedule).where(WordSchedule.word_id == word_id))
+        await WordPartService.delete(db, [word_id])
+        reviews = await db.execute(delete(WordReviewItem).where(WordReviewItem.word_id == word_id))
+        if reviews.rowcount:
+            await VersionService.bump(db, "word_review_items")
+
+        await db.execute(delete(Word).where(Word.id == word_id))
+        await ChangeService.record(db, "words", DELETE, [{"word_id": word_id}])
+        await db.commit()
+        return True
+
+    @staticmethod
+    async def import_words(
+        db: AsyncSession,
+        items: AsyncIterator[Any],
+        group_id: Optional[int] = None,
+        batch_size: int = 1000,
+    ) -> Optional[dict]:
+        """Bulk-import words from an async stream of dicts, one commit per batch.
+
+        Words are deduplicated on (japanese, romaji) against the database and
+        within the import; duplicates are still linked to `group_id`. Returns
+        None if the group does not exist. If the stream turns out malformed,
+        the items read before that point are committed and WordImportError
+        reports them.
+        """
+        if group_id is not None and await db.get(Group, group_id) is None:
+            return None
+
+        result = {"inserted": 0, "duplicates": 0, "invalid": 0, "linked": 0, "batches": []}
+        seen: set = set()
+        batch: List[WordCreate] = []
+
+        async def flush():
+            progress = await WordService._import_batch(db, batch, group_id, seen)
+            progress["batch"] = len(result["batches"]) + 1
+            result["batches"].append(progress)
+            for key in ("inserted", "duplicates", "linked"):
+                result[key] += progress[key]
+            batch.clear()
+
+        offset = 0
+        try:
+            async for item in items:
+                offset += 1
+                try:
+                    batch.append(WordCreate.model_validate(item))
+                except ValidationError:
+                    result["invalid"] += 1
+                    continue
+                if len(batch) >= batch_size:
+                    await flush()
+        except ValueError as e:
+            if batch:
+                await flush()
+            raise WordImportError(str(e), result, offset)
+        if batch:
+            await flush()
+        return result
+
+    @staticmethod
+    async def _import_batch(
+        db: AsyncSession, batch: List[WordCreate], group_id: Optional[int], seen: set
+    ) -> Dict[str, int]:
+        word_ids: Dict[Tuple[str, str], int] = {}
+        new_rows = []
+        duplicates = 0
+
+        keys = {(word.japanese, word.romaji) for word in batch}
+        existing = await db.execute(
+            select(Word.id, Word.japanese, Word.romaji).where(
+                tuple_(Word.japanese, Word.romaji).in_(keys)
+            )
+        )
+        for word_id, japanese, romaji in existing:
+            word_ids[(japanese, romaji)] = word_id
+
+        for word in batch:
+            key = (word.japanese, word.romaji)
+            if key in seen or key in word_ids:
+                duplicates += 1
+                continue
+            seen.add(key)
+            new_rows.append(word.model_dump())
+
+        if new_rows:
+            inserted = (
+                await db.execute(
+                    insert(Word).returning(Word.id, Word.japanese, Word.romaji), new_rows
+                )
+            ).all()
+            for word_id, japanese, romaji in inserted:
+                word_ids[(japanese, romaji)] = word_id
+            await WordPartService.add(db, [
+                (word_ids[(row["japanese"], row["romaji"])], row["japanese"], row["parts"])
+                for row in new_rows
+            ])
+            await ChangeService.record(
+                db, "words", UPSERT, [{"word_id": row.id} for row in inserted]
+            )
+
+        linked = 0
+        if group_id is not None and word_ids:
+            links = [{"word_id": word_id, "group_id": group_id} for word_id in word_ids.values()]
+            new_links = (
+                await db.execute(
+                    dialect_insert(db, words_groups)
+                    .on_conflict_do_nothing()
+                    .returning(words_groups.c.word_id),
+                    links,
+                )
+            ).all()
+            linked = len(new_links)
+            await ChangeService.record(
+                db, "words_groups", UPSERT,
+                [{"word_id": row.word_id, "group_id": group_id} for row in new_links],
+            )
+
+        await db.commit()
+        return {
+            "received": len(batch),
+            "inserted": len(new_rows),
+            "duplicates": duplicates,
+            "linked": linked,
+        }
@@ -0,0 +1,176 @@
+"""In-process ASGI load harness: latency percentiles, throughput and baseline checks"""
+import asyncio
+import json
+import math
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+# Latency differences below this are scheduler noise, whatever the ratio
+LATENCY_NOISE_MS = 10.0
+
+# Clients issuing requests at once, per endpoint
+CONCURRENCY = 8
+
+# Each endpoint is measured this many times and its fastest round kept:
+# a background hiccup slows one round, never all of them
+ROUNDS = 3
+
+# Requests in the reference round run just before each endpoint round
+REFERENCE_REQUESTS = 100
+
+@dataclass
+class Endpoint:
+    name: str
+    path: str
+    method: str = "GET"
+    json: Optional[object] = None
+    requests: int = 200
+    concurrency: int = CONCURRENCY
+
+@dataclass
+class Result:
+    name: str
+    requests: int
+    concurrency: int
+    p50_ms: float
+    p99_ms: float
+    rps: float
+    # p50 of the reference endpoint, measured right before this result's round
+    reference_p50_ms: Optional[float] = None
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(samples)
+    return ordered[max(math.ceil(pct / 100 * len(ordered)) - 1, 0)]
+
+async def measure(
+    client,
+    endpoint: Endpoint,
+    warmup: int = 5,
+    rounds: int = ROUNDS,
+    reference: Optional[Endpoint] = None,
+) -> Result:
+    """Drive the endpoint's requests from `concurrency` clients at once,
+    `rounds` times over, and keep the round with the lowest p50.
+
+    Each request's latency includes the time it waits behind the others,
+    and throughput is completed requests over the wall time of the round.
+    With a `reference`, a round of it runs right before each round of the
+    endpoint, and its p50 is kept with the endpoint's, so both saw the same
+    load on the machine.
+    """
+    for _ in range(warmup):
+        await _call(client, endpoint)
+    results = []
+    for _ in range(rounds):
+        reference_p50_ms = None
+        if reference is not None:
+            reference_p50_ms = (await _measure_round(client, reference)).p50_ms
+        result = await _measure_round(client, endpoint)
+        result.reference_p50_ms = reference_p50_ms
+        results.append(result)
+    return min(results, key=lambda result: result.p50_ms)
+
+async def _call(client, endpoint: Endpoint):
+    response = await client.request(endpoint.method, endpoint.path, json=endpoint.json)
+    assert response.status_code < 400, f"{endpoint.name}: {response.status_code} {response.text[:200]}"
+
+async def _measure_round(client, endpoint: Endpoint) -> Result:
+    timings = []
+    remaining = endpoint.requests
+
+    async def run_client():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            request_started = time.perf_counter()
+            await _call(client, endpoint)
+            timings.append((time.perf_counter() - request_started) * 1000)
+
+    clients = min(endpoint.concurrency, endpoint.requests)
+    started = time.perf_counter()
+    await asyncio.gather(*(run_client() for _ in range(clients)))
+    elapsed = time.perf_counter() - started
+    return Result(
+        name=endpoint.name,
+        requests=endpoint.requests,
+        concurrency=clients,
+        p50_ms=round(percentile(timings, 50), 3),
+        p99_ms=round(percentile(timings, 99), 3),
+        rps=round(endpoint.requests / elapsed, 1),
+    )
+
+def load_baseline(path: Path = BASELINE_PATH) -> Dict[str, dict]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())["results"]
+
+def save_baseline(results: List[Result], dataset: dict, path: Path = BASELINE_PATH):
+    path.write_text(json.dumps(
+        {"dataset": dataset, "results": {result.name: asdict(result) for result in results}},
+        indent=2,
+    ) + "\n")
+
+def scaled_baseline(result: Result, expected: dict) -> dict:
+    """The endpoint's baseline rescaled to the speed of the machine in this round.
+
+    Each endpoint is held to its ratio to the reference measured alongside
+    it, in the baseline and now, so a machine slowed down uniformly (or only
+    while that endpoint ran) moves both alike and only relative regressions
+    remain. A reference faster than recorded never tightens the baseline: one
+    quick round of a primary key lookup does not make the machine faster.
+    Unscaled without a reference in both.
+    """
+    current, recorded = result.reference_p50_ms, expected.get("reference_p50_ms")
+    if not current or not recorded:
+        return expected
+    slowdown = max(current / recorded, 1.0)
+    return {
+        **expected,
+        "p50_ms": expected["p50_ms"] * slowdown,
+        "p99_ms": expected["p99_ms"] * slowdown,
+        "rps": expected["rps"] / slowdown,
+    }
+
+def compare(results: List[Result], baseline: Dict[str, dict], tolerance: float) -> List[str]:
+    """Regressions against the baseline, scaled by the reference endpoint:
+    p50 latency above tolerance x baseline, and by more than LATENCY_NOISE_MS.
+
+    p99 and throughput are reported only: under concurrent load the first is
+    close to the slowest of the requests, and the second follows the wall
+    time of the slowest client, so both swing with the scheduler. Endpoints
+    missing from the baseline are reported but never fail the run.
+    """
+    regressions = []
+    for result in results:
+        if result.name not in baseline:
+            continue
+        expected = scaled_baseline(result, baseline[result.name])
+        if (
+            result.p50_ms > expected["p50_ms"] * tolerance
+            and result.p50_ms - expected["p50_ms"] > LATENCY_NOISE_MS
+        ):
+            regressions.append(
+                f"{result.name}: p50_ms {result.p50_ms} > "
+                f"{tolerance} x scaled baseline {expected['p50_ms']:.3f}"
+            )
+    return regressions
+
+def format_report(results: List[Result], baseline: Dict[str, dict]) -> str:
+    lines = [
+        f"{'endpoint':<28}{'clients':>8}{'p50 ms':>10}{'p99 ms':>10}{'req/s':>10}"
+        f"{'ref p50':>10}{'base p50':>10}"
+    ]
+    for result in results:
+        base = "-"
+        if result.name in baseline:
+            base = f"{scaled_baseline(result, baseline[result.name])['p50_ms']:.3f}"
+        lines.append(
+            f"{result.name:<28}{result.concurrency:>8}{result.p50_ms:>10}{result.p99_ms:>10}"
+            f"{result.rps:>10}{result.reference_p50_ms or '-':>10}{base:>10}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,110 @@
+import asyncio
+import httpx
+import pytest
+from datetime import timedelta
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from src.core.database import Base, configure_sqlite, get_db, get_sessionmaker
+from src.core.metrics import instrument_engine
+from src.main import app
+from src.services.activity_service import utc_today
+from scripts.generate_synthetic_data import generate
+from tests.benchmarks.harness import (
+    REFERENCE_REQUESTS, Endpoint, compare, format_report, load_baseline, measure, save_baseline,
+)
+
+pytestmark = pytest.mark.benchmark
+
+# Changing the dataset invalidates the stored baseline; re-run with --benchmark-save
+DATASET = {"words": 5000, "groups": 20, "sessions": 500, "reviews": 50000, "seed": 0}
+
+def _reference(ids) -> Endpoint:
+    """A primary key lookup: the yardstick for this machine's speed, measured
+    right before each round of every other endpoint"""
+    return Endpoint(
+        "study_activities.detail",
+        f"/api/study_activities/{ids['activity_id']}",
+        requests=REFERENCE_REQUESTS,
+    )
+
+def _endpoints(ids) -> list:
+    word_id, group_id, session_id = ids["word_ids"][0], ids["group_ids"][0], ids["session_ids"][0]
+    today = utc_today()
+    return [
+        Endpoint("dashboard.summary", "/api/dashboard/summary"),
+        Endpoint("dashboard.quick_stats", "/api/dashboard/quick-stats"),
+        Endpoint("words.list", "/api/words?limit=100"),
+        Endpoint("words.detail", f"/api/words/{word_id}"),
+        Endpoint("words.search", "/api/words/search?q=ka"),
+        Endpoint("words.random", "/api/words/random?n=20"),
+        Endpoint("groups.list", "/api/groups"),
+        Endpoint("groups.detail", f"/api/groups/{group_id}"),
+        Endpoint(
+            "groups.words_sorted",
+            f"/api/groups/{group_id}/words?sort_by=correct_count&order=desc",
+        ),
+        Endpoint("groups.due", f"/api/groups/{group_id}/due"),
+        Endpoint("study_sessions.list", "/api/study_sessions"),
+        Endpoint("study_sessions.detail", f"/api/study_sessions/{session_id}"),
+        Endpoint(
+            "study_sessions.review_batch",
+            f"/api/study_sessions/{session_id}/reviews:batch",
+            method="POST",
+            json=[{"word_id": word_id, "correct": i % 3 != 0} for i in range(20)],
+        ),
+        Endpoint("changes.feed", "/api/changes?limit=500"),
+        Endpoint(
+            "stats.timeseries",
+            f"/api/stats/timeseries?bucket=week&from={today - timedelta(days=89)}&to={today}",
+        ),
+        Endpoint("export.reviews", "/api/export/reviews", requests=5),
+    ]
+
+@pytest.fixture(scope="module")
+def dataset(tmp_path_factory):
+    path = tmp_path_factory.mktemp("benchmark") / "bench.db"
+    engine = create_engine(f"sqlite:///{path}")
+    configure_sqlite(engine)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        ids = generate(db, **DATASET)
+    engine.dispose()
+
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    configure_sqlite(async_engine.sync_engine)
+    instrument_engine(async_engine.sync_engine)
+    sessionmaker = async_sessionmaker(
+        bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+    )
+
+    async def override_get_db():
+        async with sessionmaker() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_sessionmaker] = lambda: sessionmaker
+    yield ids
+    del app.dependency_overrides[get_db]
+    del app.dependency_overrides[get_sessionmaker]
+    asyncio.run(async_engine.dispose())
+
+def test_benchmarks(dataset, request):
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            reference = _reference(dataset)
+            return [
+                await measure(client, endpoint, reference=reference)
+                for endpoint in _endpoints(dataset)
+            ]
+
+    results = asyncio.run(run())
+    baseline = load_baseline()
+    print("\n" + format_report(results, baseline))
+
+    if request.config.getoption("--benchmark-save"):
+        save_baseline(results, DATASET)
+        return
+    regressions = compare(results, baseline, request.config.getoption("--benchmark-tolerance"))
+    assert not regressions, "\n".join(regressions)
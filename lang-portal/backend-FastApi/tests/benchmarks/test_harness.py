@@ -0,0 +1,74 @@
+import asyncio
+from tests.benchmarks.harness import Endpoint, Result, compare, measure
+
+def _result(name, p50, p99, rps, reference=None):
+    return Result(
+        name=name, requests=100, concurrency=8, p50_ms=p50, p99_ms=p99, rps=rps,
+        reference_p50_ms=reference,
+    )
+
+def test_measure_runs_clients_concurrently():
+    in_flight = peak = 0
+
+    class Client:
+        async def request(self, method, path, json=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return type("Response", (), {"status_code": 200, "text": ""})()
+
+    result = asyncio.run(
+        measure(Client(), Endpoint("fake", "/", requests=40, concurrency=4), rounds=1)
+    )
+    assert peak == 4
+    assert result.requests == 40 and result.concurrency == 4
+
+def test_compare_scales_baseline_by_reference():
+    baseline = {"list": {"p50_ms": 20.0, "p99_ms": 40.0, "rps": 100.0, "reference_p50_ms": 2.0}}
+    # A machine three times slower across the board is not a regression
+    slower = [_result("list", 60.0, 120.0, 33.3, reference=6.0)]
+    assert compare(slower, baseline, 1.5) == []
+
+    # The same machine getting slower on one endpoint only is
+    regressed = [_result("list", 60.0, 120.0, 33.3, reference=2.0)]
+    regressions = compare(regressed, baseline, 1.5)
+    assert [line.split(" ")[:2] for line in regressions] == [["list:", "p50_ms"]]
+
+def test_compare_ignores_fast_reference_and_small_differences():
+    baseline = {"list": {"p50_ms": 20.0, "p99_ms": 40.0, "rps": 400.0, "reference_p50_ms": 10.0}}
+    # A quick round of the reference does not tighten the baseline
+    quick_reference = [_result("list", 25.0, 80.0, 150.0, reference=2.0)]
+    assert compare(quick_reference, baseline, 1.5) == []
+
+    # Nor does a ratio over tolerance count when the absolute gap is noise
+    small = {"list": {"p50_ms": 2.0, "p99_ms": 4.0, "rps": 4000.0, "reference_p50_ms": 10.0}}
+    assert compare([_result("list", 6.0, 9.0, 1300.0, reference=10.0)], small, 1.5) == []
+
+def test_measure_keeps_fastest_round():
+    delays = iter([0.02] * 5 + [0.001] * 5 + [0.02] * 5)
+
+    class Client:
+        async def request(self, method, path, json=None):
+            await asyncio.sleep(next(delays))
+            return type("Response", (), {"status_code": 200, "text": ""})()
+
+    result = asyncio.run(
+        measure(Client(), Endpoint("fake", "/", requests=5, concurrency=1), warmup=0, rounds=3)
+    )
+    assert result.p50_ms < 10
+
+def test_measure_pairs_each_round_with_a_reference_round():
+    paths = []
+
+    class Client:
+        async def request(self, method, path, json=None):
+            paths.append(path)
+            return type("Response", (), {"status_code": 200, "text": ""})()
+
+    endpoint = Endpoint("list", "/list", requests=2, concurrency=1)
+    reference = Endpoint("ref", "/ref", requests=1, concurrency=1)
+    result = asyncio.run(measure(Client(), endpoint, warmup=0, rounds=2, reference=reference))
+    assert paths == ["/ref", "/list", "/list", "/ref", "/list", "/list"]
+    assert result.reference_p50_ms is not None
@@ -0,0 +1,78 @@
+import time
+import pytest
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, joinedload
+from typing import List
+from src.core.database import Base, configure_sqlite
+from src.core.responses import encode_rows
+from src.models.word import Word
+from src.models.word_review_stats import WordReviewStats
+from src.schemas.word import WordWithStats
+from src.services.word_service import WORD_ROW_COLUMNS
+from scripts.generate_synthetic_data import generate
+
+pytestmark = pytest.mark.benchmark
+
+ROWS = 10000
+ROUNDS = 5
+
+def _best_ms(fn) -> float:
+    """Fastest of ROUNDS runs, in milliseconds"""
+    timings = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings)
+
+@pytest.fixture(scope="module")
+def db(tmp_path_factory):
+    engine = create_engine(f"sqlite:///{tmp_path_factory.mktemp('serialization') / 'rows.db'}")
+    configure_sqlite(engine)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as session:
+        generate(session, words=ROWS, groups=10, sessions=100, reviews=20000)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+def test_list_serialization_per_10k_rows(db):
+    """WordWithStats list: ORM objects through Pydantic vs projected rows through orjson"""
+    adapter = TypeAdapter(List[WordWithStats])
+    orm_query = select(Word).options(joinedload(Word.stats)).order_by(Word.id)
+    row_query = (
+        select(*WORD_ROW_COLUMNS)
+        .outerjoin(WordReviewStats, WordReviewStats.word_id == Word.id)
+        .order_by(Word.id)
+    )
+
+    def load_orm():
+        db.expunge_all()
+        return db.scalars(orm_query).all()
+
+    def load_rows():
+        return db.execute(row_query).all()
+
+    words, rows = load_orm(), load_rows()
+    assert len(rows) == ROWS
+    before = adapter.dump_json(adapter.validate_python(words, from_attributes=True))
+    assert encode_rows(rows) == before
+
+    timings = {
+        "before: ORM load": _best_ms(load_orm),
+        "before: Pydantic validate + dump": _best_ms(
+            lambda: adapter.dump_json(adapter.validate_python(words, from_attributes=True))
+        ),
+        "after: row load": _best_ms(load_rows),
+        "after: orjson encode": _best_ms(lambda: encode_rows(rows)),
+    }
+    print(f"\n{'per 10k WordWithStats rows':<36}{'ms':>10}")
+    for name, ms in timings.items():
+        print(f"{name:<36}{ms:>10.1f}")
+
+    assert timings["after: orjson encode"] < timings["before: Pydantic validate + dump"]
+    assert (
+        timings["after: row load"] + timings["after: orjson encode"]
+        < timings["before: ORM load"] + timings["before: Pydantic validate + dump"]
+    )
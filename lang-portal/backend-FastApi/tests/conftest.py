@@ -1,22 +1,39 @@
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+import os
 import sys
 from pathlib import Path
 
 # Add src to Python path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from src.core.database import Base, get_db
+from src.core.config import async_database_url, sync_database_url
+from src.core.database import Base, configure_sqlite, get_db, get_sessionmaker
+from src.core.metrics import instrument_engine
 from src.main import app
 
-# Use SQLite in-memory database for testing
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+# A SQLite file by default; set TEST_DATABASE_URL (e.g. to the docker-compose
+# Postgres) to run the same suite against another backend
+SQLALCHEMY_DATABASE_URL = os.getenv("TEST_DATABASE_URL", "sqlite:///./test.db")
+ASYNC_SQLALCHEMY_DATABASE_URL = async_database_url(SQLALCHEMY_DATABASE_URL)
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+# Sync engine seeds fixtures; the app reads through the async engine
+engine = create_engine(sync_database_url(SQLALCHEMY_DATABASE_URL))
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# TestClient may run each request on a fresh event loop, so don't pool connections
+async_engine = create_async_engine(ASYNC_SQLALCHEMY_DATABASE_URL, poolclass=NullPool)
+configure_sqlite(engine)
+configure_sqlite(async_engine.sync_engine)
+instrument_engine(async_engine.sync_engine)
+AsyncTestingSessionLocal = async_sessionmaker(
+    bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
 @pytest.fixture
 def db_session():
     Base.metadata.create_all(bind=engine)
@@ -29,12 +46,61 @@ def db_session():
 
 @pytest.fixture
 def client(db_session):
-    def override_get_db():
-        try:
-            yield db_session
-        finally:
-            db_session.close()
-    
+    async def override_get_db():
+        async with AsyncTestingSessionLocal() as db:
+            yield db
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_sessionmaker] = lambda: AsyncTestingSessionLocal
     yield TestClient(app)
-    del app.dependency_overrides[get_db] 
\ No newline at end of file
+    del app.dependency_overrides[get_db]
+    del app.dependency_overrides[get_sessionmaker]
+
+class QueryCounter:
+    """Records every SQL statement the app sends through the async engine"""
+
+    def __init__(self):
+        self.statements = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+    def reset(self):
+        self.statements.clear()
+
+@pytest.fixture
+def query_counter():
+    counter = QueryCounter()
+    event.listen(async_engine.sync_engine, "before_cursor_execute", counter)
+    yield counter
+    event.remove(async_engine.sync_engine, "before_cursor_execute", counter)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmark", "lang-portal benchmarks (tests/benchmarks)")
+    group.addoption("--benchmark", action="store_true", help="run the load benchmarks")
+    group.addoption(
+        "--benchmark-save", action="store_true",
+        help="write the results to tests/benchmarks/baseline.json instead of comparing",
+    )
+    group.addoption(
+        "--benchmark-tolerance", type=float, default=1.5,
+        help="fail when p50 latency exceeds the baseline by this factor",
+    )
+
+def pytest_collection_modifyitems(config, items):
+    if engine.dialect.name != "sqlite":
+        skip_sqlite = pytest.mark.skip(reason=f"SQLite only, running on {engine.dialect.name}")
+        for item in items:
+            if "sqlite_only" in item.keywords:
+                item.add_marker(skip_sqlite)
+    if config.getoption("--benchmark"):
+        return
+    skip = pytest.mark.skip(reason="benchmarks run with --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
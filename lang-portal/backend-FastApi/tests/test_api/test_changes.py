@@ -0,0 +1,92 @@
+import asyncio
+
+def _create_word(client, japanese, romaji, english):
+    response = client.post(
+        "/api/words", json={"japanese": japanese, "romaji": romaji, "english": english}
+    )
+    return response.json()["id"]
+
+def test_change_feed_delta_sync(client):
+    word_id = _create_word(client, "猫", "neko", "cat")
+    group_id = client.post("/api/groups", json={"name": "Animals"}).json()["id"]
+    client.post(f"/api/groups/{group_id}/words", json={"word_ids": [word_id]})
+    client.put(
+        f"/api/words/{word_id}",
+        json={"japanese": "猫", "romaji": "neko", "english": "cat (animal)"},
+    )
+
+    feed = client.get("/api/changes").json()
+    assert feed["has_more"] is False
+    changes = [(c["table"], c["op"]) for c in feed["changes"]]
+    # The create and the update of the word collapse into its latest state
+    assert changes == [("groups", "upsert"), ("words_groups", "upsert"), ("words", "upsert")]
+    assert feed["changes"][-1]["data"]["english"] == "cat (animal)"
+
+    token = feed["next_token"]
+    assert client.get("/api/changes", params={"since": token}).json()["changes"] == []
+
+    client.delete(f"/api/words/{word_id}")
+    feed = client.get("/api/changes", params={"since": token}).json()
+    assert [(c["table"], c["op"], c["word_id"], c["group_id"]) for c in feed["changes"]] == [
+        ("words_groups", "delete", word_id, group_id),
+        ("words", "delete", word_id, None),
+    ]
+    assert client.get(f"/api/words/{word_id}").status_code == 404
+
+def test_change_feed_pages_by_sequence(client):
+    for i in range(3):
+        _create_word(client, f"語{i}", f"go{i}", f"word {i}")
+
+    first = client.get("/api/changes", params={"limit": 2}).json()
+    assert first["has_more"] is True
+    assert len(first["changes"]) == 2
+
+    second = client.get("/api/changes", params={"since": first["next_token"], "limit": 2}).json()
+    assert second["has_more"] is False
+    assert [c["data"]["romaji"] for c in second["changes"]] == ["go2"]
+
+def test_group_membership_endpoints(client):
+    word_id = _create_word(client, "犬", "inu", "dog")
+    group_id = client.post("/api/groups", json={"name": "Pets"}).json()["id"]
+
+    response = client.post(f"/api/groups/{group_id}/words", json={"word_ids": [word_id, 9999]})
+    assert response.status_code == 422
+
+    response = client.post(f"/api/groups/{group_id}/words", json={"word_ids": [word_id]})
+    assert response.json() == {"added": 1}
+    assert len(client.get(f"/api/groups/{group_id}/words").json()) == 1
+
+    assert client.delete(f"/api/groups/{group_id}/words/{word_id}").status_code == 204
+    assert client.get(f"/api/groups/{group_id}/words").json() == []
+    assert client.delete(f"/api/groups/{group_id}").status_code == 204
+    assert client.get(f"/api/groups/{group_id}").status_code == 404
+
+def test_change_feed_seq_follows_commit_order(db_session):
+    """A writer that commits later never gets a lower seq than one already visible"""
+    from sqlalchemy import select
+    from src.models.change_log import ChangeLogEntry
+    from src.services.change_service import ChangeService, UPSERT
+    from tests.conftest import AsyncTestingSessionLocal
+
+    async def race():
+        async with AsyncTestingSessionLocal() as first, AsyncTestingSessionLocal() as second:
+            await ChangeService.record(first, "words", UPSERT, [{"word_id": 1}])
+
+            async def write_second():
+                # Another table, so the change_versions row does not serialize them
+                await ChangeService.record(second, "groups", UPSERT, [{"group_id": 1}])
+                await second.commit()
+
+            task = asyncio.create_task(write_second())
+            await asyncio.sleep(0.3)
+            # The second writer waits for the first to commit
+            blocked = not task.done()
+            await first.commit()
+            await task
+            return blocked
+
+    assert asyncio.run(race())
+    tables = db_session.scalars(
+        select(ChangeLogEntry.table_name).order_by(ChangeLogEntry.seq)
+    ).all()
+    assert tables == ["words", "groups"]
@@ -11,4 +11,55 @@ def test_get_study_progress(client):
     assert response.status_code == 200
     data = response.json()
     assert "total_words_studied" in data
-    assert "total_available_words" in data 
\ No newline at end of file
+    assert "total_available_words" in data 
+
+def test_get_dashboard_summary(client, db_session):
+    from src.models.group import Group
+    from src.models.study_activity import StudyActivity
+    from src.models.study_session import StudySession
+    from src.models.word import Word
+    from src.models.word_review import WordReviewItem
+
+    group = Group(name="Summary Group")
+    activity = StudyActivity(name="Flashcards", type="flashcards")
+    word = Word(japanese="猫", romaji="neko", english="cat")
+    db_session.add_all([group, activity, word])
+    db_session.flush()
+    session = StudySession(group_id=group.id, study_activity_id=activity.id)
+    db_session.add(session)
+    db_session.flush()
+    db_session.add_all([
+        WordReviewItem(word_id=word.id, study_session_id=session.id, correct=True),
+        WordReviewItem(word_id=word.id, study_session_id=session.id, correct=False),
+    ])
+    db_session.commit()
+    session_id = session.id
+
+    response = client.get("/api/dashboard/summary")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["study_progress"] == {"total_words_studied": 1, "total_available_words": 1}
+    assert data["quick_stats"]["success_rate"] == 50.0
+    assert data["quick_stats"]["total_study_sessions"] == 1
+    assert data["quick_stats"]["total_active_groups"] == 1
+    assert data["last_study_session"]["id"] == session_id
+    assert data["last_study_session"]["group_name"] == "Summary Group"
+
+def test_dashboard_endpoints_read_only_their_tables(client, query_counter):
+    import re
+
+    client.get("/api/dashboard/study_progress")
+    assert query_counter.count == 1
+    assert "study_sessions" not in query_counter.statements[0]
+    assert "daily_activity" not in query_counter.statements[0]
+
+    query_counter.reset()
+    client.get("/api/dashboard/quick-stats")
+    # Review and session totals, then the streak
+    assert query_counter.count == 2
+    assert not re.search(r"\bwords\b", query_counter.statements[0])
+    assert "LIMIT" not in query_counter.statements[0]
+
+    query_counter.reset()
+    client.get("/api/dashboard/summary")
+    assert query_counter.count == 2
@@ -0,0 +1,85 @@
+import asyncio
+import csv
+import io
+import json
+
+def _seed(db_session):
+    from src.models.group import Group
+    from src.models.study_activity import StudyActivity
+    from src.models.study_session import StudySession
+    from src.models.word import Word
+    from src.models.word_review import WordReviewItem
+
+    words = [
+        Word(japanese="猫", romaji="neko", english="cat", parts={"kanji": "猫"}),
+        Word(japanese="犬", romaji="inu", english="dog, hound"),
+        Word(japanese="鳥", romaji="tori", english="bird"),
+    ]
+    group = Group(name="Animals", words=words)
+    activity = StudyActivity(name="Flashcards", type="flashcards")
+    db_session.add_all([group, activity])
+    db_session.flush()
+    session = StudySession(group_id=group.id, study_activity_id=activity.id)
+    db_session.add(session)
+    db_session.flush()
+    db_session.add_all([
+        WordReviewItem(word_id=word.id, study_session_id=session.id, correct=i % 2 == 0)
+        for i, word in enumerate(words)
+    ])
+    db_session.commit()
+    return [word.id for word in words], session.id
+
+def test_export_words_ndjson(client, db_session):
+    word_ids, _ = _seed(db_session)
+
+    response = client.get("/api/export/words")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert 'filename="words.ndjson"' in response.headers["content-disposition"]
+
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["id"] for row in rows] == word_ids
+    assert rows[0]["parts"] == {"kanji": "猫"}
+    assert rows[0]["japanese"] == "猫"
+    assert rows[1]["parts"] is None
+
+def test_export_reviews_csv(client, db_session):
+    word_ids, session_id = _seed(db_session)
+
+    response = client.get("/api/export/reviews?format=csv")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert list(rows[0]) == ["id", "word_id", "study_session_id", "correct", "created_at"]
+    assert [int(row["word_id"]) for row in rows] == word_ids
+    assert {row["study_session_id"] for row in rows} == {str(session_id)}
+    assert [row["correct"] for row in rows] == ["True", "False", "True"]
+
+    words = list(csv.DictReader(io.StringIO(client.get("/api/export/words?format=csv").text)))
+    assert words[1]["english"] == "dog, hound"
+
+def test_export_sessions_and_unknown_dataset(client, db_session):
+    _, session_id = _seed(db_session)
+    rows = [json.loads(line) for line in client.get("/api/export/sessions").text.splitlines()]
+    assert [row["id"] for row in rows] == [session_id]
+
+    assert client.get("/api/export/groups").status_code == 422
+    assert client.get("/api/export/words?format=xml").status_code == 422
+
+def test_export_streams_in_batches(db_session, monkeypatch):
+    from src.schemas.export import ExportDataset, ExportFormat
+    from src.services import export_service
+    from tests.conftest import AsyncTestingSessionLocal
+
+    _seed(db_session)
+    monkeypatch.setattr(export_service, "EXPORT_BATCH_SIZE", 2)
+
+    async def collect():
+        stream = export_service.ExportService.stream(
+            AsyncTestingSessionLocal, ExportDataset.reviews, ExportFormat.ndjson
+        )
+        return [chunk async for chunk in stream]
+
+    chunks = asyncio.run(collect())
+    assert [chunk.count("\n") for chunk in chunks] == [2, 1]
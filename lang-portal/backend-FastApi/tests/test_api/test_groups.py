@@ -1,3 +1,6 @@
+import pytest
+from sqlalchemy import text
+
 def test_create_group(client):
     group_data = {
         "name": "Test Group"
@@ -20,4 +23,199 @@ def test_get_group_words(client):
     # Get words in group
     response = client.get(f"/api/groups/{group_id}/words")
     assert response.status_code == 200
-    assert isinstance(response.json(), list) 
\ No newline at end of file
+    assert isinstance(response.json(), list) 
+def test_get_group_words_sorted_and_paged(client, db_session):
+    from src.models.group import Group
+    from src.models.word import Word
+
+    group = Group(name="Animals")
+    group.words = [
+        Word(japanese="犬", romaji="inu", english="dog"),
+        Word(japanese="猫", romaji="neko", english="cat"),
+        Word(japanese="鳥", romaji="tori", english="bird"),
+    ]
+    db_session.add(group)
+    db_session.add(Word(japanese="本", romaji="hon", english="book"))
+    db_session.commit()
+    group_id = group.id
+
+    response = client.get(
+        f"/api/groups/{group_id}/words",
+        params={"sort_by": "english", "limit": 2, "include_total": True},
+    )
+    assert response.status_code == 200
+    assert [w["english"] for w in response.json()] == ["bird", "cat"]
+    assert response.headers["X-Total-Count"] == "3"
+
+    response = client.get(
+        f"/api/groups/{group_id}/words",
+        params={"sort_by": "english", "limit": 2, "cursor": response.headers["X-Next-Cursor"]},
+    )
+    assert [w["english"] for w in response.json()] == ["dog"]
+    assert "X-Next-Cursor" not in response.headers
+
+    response = client.get(
+        f"/api/groups/{group_id}/words", params={"sort_by": "romaji", "order": "desc"}
+    )
+    assert [w["romaji"] for w in response.json()] == ["tori", "neko", "inu"]
+
+@pytest.mark.parametrize("values", [["cat"], [1, 1], ["cat", "1"], ["cat", None], [["cat"], 1]])
+def test_get_group_words_malformed_cursor(client, values):
+    from src.core.pagination import encode_cursor
+
+    group_id = client.post("/api/groups", json={"name": "Animals"}).json()["id"]
+    response = client.get(
+        f"/api/groups/{group_id}/words",
+        params={"sort_by": "english", "cursor": encode_cursor(values)},
+    )
+    assert response.status_code == 400
+
+def test_get_group_words_missing_group(client):
+    response = client.get("/api/groups/9999/words")
+    assert response.status_code == 404
+
+def test_sm2_intervals():
+    from src.services.schedule_service import NEW_CARD, sm2
+
+    state = NEW_CARD
+    intervals = []
+    for _ in range(3):
+        state = sm2(state, True)
+        intervals.append(state.interval_days)
+    assert intervals == [1.0, 6.0, 15.0]
+    assert state.ease == 2.5
+
+    lapsed = sm2(state, False)
+    assert (lapsed.repetitions, lapsed.interval_days) == (0, 1.0)
+    assert round(lapsed.ease, 2) == 2.18
+    assert sm2(lapsed._replace(ease=1.3), False).ease == 1.3
+
+def test_get_group_due_words(client, db_session):
+    from src.models.group import Group
+    from src.models.study_activity import StudyActivity
+    from src.models.word import Word
+
+    words = [
+        Word(japanese="犬", romaji="inu", english="dog"),
+        Word(japanese="猫", romaji="neko", english="cat"),
+        Word(japanese="鳥", romaji="tori", english="bird"),
+    ]
+    group = Group(name="Animals", words=words)
+    activity = StudyActivity(name="Flashcards", type="flashcards")
+    db_session.add_all([group, activity])
+    db_session.commit()
+    group_id, activity_id = group.id, activity.id
+    dog_id, cat_id, bird_id = (word.id for word in words)
+
+    # Nothing reviewed yet: every word is new, in id order
+    due = client.get(f"/api/groups/{group_id}/due").json()
+    assert [item["word"]["id"] for item in due] == [dog_id, cat_id, bird_id]
+    assert all(item["due_at"] is None and item["repetitions"] == 0 for item in due)
+
+    session_id = client.post(
+        "/api/study_sessions", json={"group_id": group_id, "study_activity_id": activity_id}
+    ).json()["id"]
+    response = client.post(
+        f"/api/study_sessions/{session_id}/reviews:batch",
+        json=[{"word_id": dog_id, "correct": True}, {"word_id": cat_id, "correct": False}],
+    )
+    assert response.status_code == 200
+
+    # Reviewed words are scheduled a day out, so only the new word is left
+    due = client.get(f"/api/groups/{group_id}/due").json()
+    assert [item["word"]["id"] for item in due] == [bird_id]
+    assert client.get(f"/api/groups/{group_id}/due?include_new=false").json() == []
+
+    # Move the clock forward by backdating the schedule
+    db_session.execute(text("UPDATE word_schedules SET due_at = '2000-01-01 00:00:00'"))
+    db_session.commit()
+    due = client.get(f"/api/groups/{group_id}/due?limit=2").json()
+    assert [item["word"]["id"] for item in due] == [dog_id, cat_id]
+    assert [item["repetitions"] for item in due] == [1, 0]
+    assert due[1]["ease"] < due[0]["ease"]
+
+def test_get_group_due_words_skips_outside_words(client, db_session):
+    from src.models.group import Group
+    from src.models.study_activity import StudyActivity
+    from src.models.word import Word
+
+    member = Word(japanese="犬", romaji="inu", english="dog")
+    outsider = Word(japanese="本", romaji="hon", english="book")
+    group = Group(name="Animals", words=[member])
+    activity = StudyActivity(name="Flashcards", type="flashcards")
+    db_session.add_all([group, outsider, activity])
+    db_session.commit()
+    group_id, member_id, outsider_id = group.id, member.id, outsider.id
+
+    session_id = client.post(
+        "/api/study_sessions", json={"group_id": group_id, "study_activity_id": activity.id}
+    ).json()["id"]
+    response = client.post(
+        f"/api/study_sessions/{session_id}/reviews:batch",
+        json=[{"word_id": outsider_id, "correct": True}, {"word_id": member_id, "correct": True}],
+    )
+    assert response.status_code == 200
+
+    scheduled = db_session.execute(text("SELECT word_id FROM word_schedules")).scalars().all()
+    assert scheduled == [member_id]
+
+    # A member later removed from the group leaves its due queue
+    db_session.execute(text("UPDATE word_schedules SET due_at = '2000-01-01 00:00:00'"))
+    db_session.commit()
+    due = client.get(f"/api/groups/{group_id}/due").json()
+    assert [item["word"]["id"] for item in due] == [member_id]
+    db_session.execute(text("DELETE FROM words_groups WHERE word_id = :id"), {"id": member_id})
+    db_session.commit()
+    assert client.get(f"/api/groups/{group_id}/due").json() == []
+
+@pytest.mark.sqlite_only
+def test_get_group_due_words_uses_index(db_session):
+    from datetime import datetime, timezone
+    from src.services.schedule_service import ScheduleService
+
+    query = ScheduleService.due_query(1, datetime.now(timezone.utc), 20)
+    compiled = query.compile(db_session.bind, compile_kwargs={"literal_binds": True})
+    plan = " ".join(
+        row[-1] for row in db_session.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))
+    )
+    assert "ix_word_schedules_group_due (group_id=? AND due_at<?)" in plan
+    assert "TEMP B-TREE" not in plan
+
+def test_get_group_due_words_missing_group(client):
+    assert client.get("/api/groups/9999/due").status_code == 404
+
+def test_group_counters(client, db_session):
+    from src.models.study_activity import StudyActivity
+
+    activity = StudyActivity(name="Flashcards", type="flashcards")
+    db_session.add(activity)
+    db_session.commit()
+    activity_id = activity.id
+
+    group_id = client.post("/api/groups", json={"name": "Animals"}).json()["id"]
+    word_ids = [
+        client.post(
+            "/api/words", json={"japanese": japanese, "romaji": romaji, "english": english}
+        ).json()["id"]
+        for japanese, romaji, english in [("猫", "neko", "cat"), ("犬", "inu", "dog"), ("鳥", "tori", "bird")]
+    ]
+    client.post(f"/api/groups/{group_id}/words", json={"word_ids": word_ids})
+    client.delete(f"/api/groups/{group_id}/words/{word_ids[0]}")
+    client.delete(f"/api/words/{word_ids[1]}")
+
+    group = client.get("/api/groups").json()[0]
+    assert (group["word_count"], group["session_count"], group["last_studied_at"]) == (1, 0, None)
+
+    sessions = [
+        client.post(
+            "/api/study_sessions", json={"group_id": group_id, "study_activity_id": activity_id}
+        ).json()
+        for _ in range(2)
+    ]
+    group = client.get("/api/groups").json()[0]
+    assert group["session_count"] == 2
+    assert group["last_studied_at"] == max(session["created_at"] for session in sessions)
+
+    detail = client.get(f"/api/groups/{group_id}").json()
+    assert (detail["total_words"], detail["study_sessions_count"]) == (1, 2)
+    assert client.delete(f"/api/groups/{group_id}").status_code == 409
@@ -0,0 +1,66 @@
+import pytest
+from src.core.metrics import metrics
+
+@pytest.fixture(autouse=True)
+def fresh_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+def _sample(text, name, **labels):
+    prefix = name + "{" + ",".join(f'{k}="{v}"' for k, v in labels.items())
+    return next(
+        float(line.rsplit(" ", 1)[1]) for line in text.splitlines() if line.startswith(prefix)
+    )
+
+def test_metrics_record_latency_and_sql_per_route(client, db_session):
+    from src.models.word import Word
+
+    word = Word(japanese="猫", romaji="neko", english="cat")
+    db_session.add(word)
+    db_session.commit()
+
+    for _ in range(2):
+        assert client.get(f"/api/words/{word.id}").status_code == 200
+    assert client.get("/api/words/9999").status_code == 404
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+
+    route = "/api/words/{word_id}"
+    assert _sample(
+        text, "http_request_duration_seconds_count", method="GET", route=route, status="200"
+    ) == 2
+    assert _sample(
+        text, "http_request_duration_seconds_count", method="GET", route=route, status="404"
+    ) == 1
+    # Statements issued inside the request are attributed to it: ETag lookup + word
+    assert _sample(text, "http_request_sql_statements_sum", method="GET", route=route) == 6
+    assert _sample(text, "http_request_sql_seconds_count", method="GET", route=route) == 3
+    # /metrics does not measure itself
+    assert 'route="/metrics"' not in text
+
+def test_metrics_slow_query_samples(client, monkeypatch):
+    from src.core.config import settings
+
+    monkeypatch.setattr(settings, "SLOW_QUERY_MS", 0.0)
+    client.get("/api/groups")
+
+    text = client.get("/metrics").text
+    assert _sample(text, "db_slow_queries_total", route="/api/groups") >= 1
+    assert 'db_slow_query_sample_seconds{route="/api/groups",statement="SELECT' in text
+
+def test_server_timing_header(client):
+    from fastapi.testclient import TestClient
+    from src.core.metrics import MetricsMiddleware
+    from src.main import app
+
+    # Off by default (settings.SERVER_TIMING_ENABLED)
+    assert "server-timing" not in client.get("/api/groups").headers
+
+    timed_client = TestClient(MetricsMiddleware(app, server_timing=True))
+    timing = timed_client.get("/api/groups").headers["server-timing"]
+    assert timing.startswith("app;dur=")
+    assert "db;dur=" in timing and 'queries"' in timing
@@ -0,0 +1,55 @@
+import pytest
+
+# Upper bound on SQL statements per detail endpoint, independent of data size.
+# Word and group reads include one change_versions lookup for their ETag.
+MAX_STATEMENTS = {
+    "word": 2,
+    "group": 3,
+    "study_session": 3,
+    "study_activity": 1,
+}
+
+@pytest.fixture
+def seeded(db_session):
+    from src.models.group import Group
+    from src.models.study_activity import StudyActivity
+    from src.models.study_session import StudySession
+    from src.models.word import Word
+    from src.models.word_review import WordReviewItem
+    from src.models.word_review_stats import WordReviewStats
+
+    words = [Word(japanese=f"語{i}", romaji=f"go{i}", english=f"word {i}") for i in range(50)]
+    group = Group(name="Large Group", words=words)
+    activity = StudyActivity(name="Flashcards", type="flashcards")
+    db_session.add_all([group, activity])
+    db_session.flush()
+
+    session = StudySession(group_id=group.id, study_activity_id=activity.id)
+    db_session.add(session)
+    db_session.flush()
+    for word in words:
+        db_session.add(WordReviewItem(word_id=word.id, study_session_id=session.id, correct=True))
+        db_session.add(WordReviewStats(word_id=word.id, correct_count=1, wrong_count=0))
+    db_session.commit()
+    return {
+        "word": f"/api/words/{words[0].id}",
+        "group": f"/api/groups/{group.id}",
+        "study_session": f"/api/study_sessions/{session.id}",
+        "study_activity": f"/api/study_activities/{activity.id}",
+    }
+
+@pytest.mark.parametrize("endpoint", sorted(MAX_STATEMENTS))
+def test_detail_endpoint_query_count(client, seeded, query_counter, endpoint):
+    response = client.get(seeded[endpoint])
+    assert response.status_code == 200
+    assert query_counter.count <= MAX_STATEMENTS[endpoint], query_counter.statements
+
+def test_detail_payloads_are_complete(client, seeded):
+    group = client.get(seeded["group"]).json()
+    assert len(group["words"]) == 50
+    assert group["total_words"] == 50
+    assert group["study_sessions_count"] == 1
+
+    session = client.get(seeded["study_session"]).json()
+    assert len(session["words"]) == 50
+    assert all(word["correct_count"] == 1 for word in session["words"])
@@ -0,0 +1,73 @@
+import pytest
+from src.core.snapshot_cache import Snapshot, SnapshotCache, snapshot_cache
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    snapshot_cache.clear()
+    yield
+    snapshot_cache.clear()
+
+@pytest.fixture
+def words(db_session):
+    from src.models.group import Group
+    from src.models.word import Word
+
+    words = [Word(japanese=f"語{i}", romaji=f"go{i}", english=f"word {i}") for i in range(3)]
+    db_session.add(Group(name="Basics", words=words))
+    db_session.commit()
+    return words
+
+def test_list_page_is_served_from_snapshot(client, words, query_counter):
+    first = client.get("/api/words?limit=2")
+    assert first.status_code == 200
+
+    query_counter.reset()
+    second = client.get("/api/words?limit=2")
+    assert second.status_code == 200
+    # Only the change_versions lookup behind the ETag
+    assert query_counter.count == 1
+    assert second.content == first.content
+    assert second.headers["X-Next-Cursor"] == first.headers["X-Next-Cursor"]
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert [word["japanese"] for word in second.json()] == ["語0", "語1"]
+    assert snapshot_cache.hits == 1
+
+def test_writes_invalidate_snapshot(client, words):
+    group_id = client.get("/api/groups").json()[0]["id"]
+    assert len(client.get(f"/api/groups/{group_id}/words").json()) == 3
+
+    word_id = client.post(
+        "/api/words", json={"japanese": "猫", "romaji": "neko", "english": "cat"}
+    ).json()["id"]
+    client.post(f"/api/groups/{group_id}/words", json={"word_ids": [word_id]})
+
+    assert len(client.get(f"/api/groups/{group_id}/words").json()) == 4
+    assert client.get("/api/groups").json()[0]["word_count"] == 4
+    assert snapshot_cache.hits == 0
+
+def test_snapshot_metrics(client, words):
+    for _ in range(4):
+        client.get("/api/groups")
+
+    text = client.get("/metrics").text
+    assert "snapshot_cache_hits_total 3" in text
+    assert "snapshot_cache_misses_total 1" in text
+    assert "snapshot_cache_hit_ratio 0.750000" in text
+    assert "snapshot_cache_entries 1" in text
+
+def test_byte_cap_evicts_least_recently_used():
+    cache = SnapshotCache(max_bytes=25)
+    versions = (("words", 1),)
+    cache.put(("/a", ""), Snapshot(versions, b"x" * 10, ()))
+    cache.put(("/b", ""), Snapshot(versions, b"x" * 10, ()))
+    assert cache.get(("/a", ""), versions) is not None
+
+    cache.put(("/c", ""), Snapshot(versions, b"x" * 10, ()))
+    assert list(cache.entries) == [("/a", ""), ("/c", "")]
+    assert cache.size == 20 and cache.evictions == 1
+    # Stale versions are a miss, and the page is dropped
+    assert cache.get(("/a", ""), (("words", 2),)) is None
+    assert list(cache.entries) == [("/c", "")]
+    # Pages bigger than the whole cap are never kept
+    cache.put(("/d", ""), Snapshot(versions, b"x" * 30, ()))
+    assert ("/d", "") not in cache.entries
@@ -0,0 +1,115 @@
+def test_study_streak(client, db_session):
+    from datetime import timedelta
+    from src.models.daily_activity import DailyActivity
+    from src.services.activity_service import utc_today
+
+    today = utc_today()
+    db_session.add_all([
+        DailyActivity(day=today - timedelta(days=1), group_id=1, reviews=3, correct=2),
+        DailyActivity(day=today - timedelta(days=2), group_id=0, sessions=1),
+        DailyActivity(day=today - timedelta(days=2), group_id=1, reviews=1, correct=1),
+        # Gap on day 3 ends the streak
+        DailyActivity(day=today - timedelta(days=4), group_id=1, reviews=5, correct=5),
+    ])
+    db_session.commit()
+
+    # No activity today yet: the streak still counts through yesterday
+    assert client.get("/api/dashboard/quick-stats").json()["study_streak_days"] == 2
+
+    db_session.add(DailyActivity(day=today, group_id=1, reviews=1, correct=0))
+    db_session.commit()
+    assert client.get("/api/dashboard/quick-stats").json()["study_streak_days"] == 3
+
+def test_stats_timeseries(client, db_session):
+    from datetime import timedelta
+    from src.models.group import Group
+    from src.models.study_activity import StudyActivity
+    from src.models.word import Word
+    from src.services.activity_service import utc_today
+
+    word = Word(japanese="猫", romaji="neko", english="cat")
+    group = Group(name="Animals", words=[word])
+    activity = StudyActivity(name="Flashcards", type="flashcards")
+    db_session.add_all([group, activity])
+    db_session.commit()
+    group_id, word_id = group.id, word.id
+
+    session_id = client.post(
+        "/api/study_sessions", json={"group_id": group_id, "study_activity_id": activity.id}
+    ).json()["id"]
+    client.post(
+        f"/api/study_sessions/{session_id}/reviews:batch",
+        json=[{"word_id": word_id, "correct": True}, {"word_id": word_id, "correct": False}],
+    )
+    client.post(f"/api/study_sessions/{session_id}/words/{word_id}/review", json={"correct": True})
+
+    today = utc_today()
+    start = today - timedelta(days=2)
+    response = client.get(f"/api/stats/timeseries?from={start}&to={today}")
+    assert response.status_code == 200
+    points = response.json()
+    assert [point["start"] for point in points] == [
+        str(start + timedelta(days=i)) for i in range(3)
+    ]
+    assert points[0] == {"start": str(start), "reviews": 0, "correct": 0, "sessions": 0}
+    assert points[-1] == {"start": str(today), "reviews": 3, "correct": 2, "sessions": 1}
+
+    monthly = client.get(
+        f"/api/stats/timeseries?from={today}&to={today}&bucket=month&group_id={group_id}"
+    ).json()
+    assert monthly == [{"start": str(today.replace(day=1)), "reviews": 3, "correct": 2, "sessions": 1}]
+    assert client.get(f"/api/stats/timeseries?group_id={group_id + 1}").json()[-1]["reviews"] == 0
+    assert client.get(f"/api/stats/timeseries?from={today}&to={start}").status_code == 400
+
+    # Deleting the word takes its reviews back out of the rollup
+    client.delete(f"/api/words/{word_id}")
+    point = client.get(f"/api/stats/timeseries?from={today}&to={today}").json()[0]
+    assert (point["reviews"], point["correct"], point["sessions"]) == (0, 0, 1)
+
+def test_rollup_days_follow_review_timestamps(client, db_session, monkeypatch):
+    """Live writes and word deletes bucket by the stored created_at, like the backfill"""
+    from datetime import timedelta
+    from sqlalchemy import select
+    from src.models.daily_activity import DailyActivity
+    from src.models.group import Group
+    from src.models.study_activity import StudyActivity
+    from src.models.word import Word
+    from src.services import activity_service
+    from src.services.activity_service import rollup_from_history, utc_today
+
+    word = Word(japanese="犬", romaji="inu", english="dog")
+    group = Group(name="Animals", words=[word])
+    activity = StudyActivity(name="Flashcards", type="flashcards")
+    db_session.add_all([group, activity])
+    db_session.commit()
+    group_id, word_id = group.id, word.id
+
+    # An application clock a day ahead of the database must not move any counts
+    today = utc_today()
+    monkeypatch.setattr(activity_service, "utc_today", lambda: today + timedelta(days=1))
+
+    session_id = client.post(
+        "/api/study_sessions", json={"group_id": group_id, "study_activity_id": activity.id}
+    ).json()["id"]
+    client.post(
+        f"/api/study_sessions/{session_id}/reviews:batch",
+        json=[{"word_id": word_id, "correct": True}, {"word_id": word_id, "correct": False}],
+    )
+    client.post(f"/api/study_sessions/{session_id}/words/{word_id}/review", json={"correct": True})
+
+    def rollup():
+        db_session.expire_all()
+        return sorted(
+            tuple(row) for row in db_session.execute(select(
+                DailyActivity.day, DailyActivity.group_id, DailyActivity.reviews,
+                DailyActivity.correct, DailyActivity.sessions,
+            )).all()
+            if any(row[2:])
+        )
+
+    history = sorted(tuple(row) for row in db_session.execute(rollup_from_history()).all())
+    assert rollup() == history
+    assert sum(row[2] for row in history) == 3
+
+    client.delete(f"/api/words/{word_id}")
+    assert rollup() == [(day, group_id, 0, 0, 1) for day, *_ in history]
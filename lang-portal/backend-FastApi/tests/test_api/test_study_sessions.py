@@ -0,0 +1,134 @@
+def _create_session(client, db_session):
+    from src.models.study_activity import StudyActivity
+
+    activity = StudyActivity(name="Flashcards", type="flashcards")
+    db_session.add(activity)
+    db_session.commit()
+    activity_id = activity.id
+
+    group_id = client.post("/api/groups", json={"name": "Review Group"}).json()["id"]
+    response = client.post(
+        "/api/study_sessions",
+        json={"group_id": group_id, "study_activity_id": activity_id},
+    )
+    assert response.status_code == 200
+    return response.json()["id"]
+
+
+def _create_word(client, japanese="猫", romaji="neko", english="cat"):
+    response = client.post(
+        "/api/words", json={"japanese": japanese, "romaji": romaji, "english": english}
+    )
+    return response.json()["id"]
+
+
+def test_review_word_updates_stats(client, db_session):
+    session_id = _create_session(client, db_session)
+    word_id = _create_word(client)
+
+    for correct in (True, True, False):
+        response = client.post(
+            f"/api/study_sessions/{session_id}/words/{word_id}/review",
+            json={"correct": correct},
+        )
+        assert response.status_code == 200
+        assert response.json()["word_id"] == word_id
+
+    word = client.get(f"/api/words/{word_id}").json()
+    assert word["correct_count"] == 2
+    assert word["wrong_count"] == 1
+    assert round(word["success_rate"], 1) == 66.7
+    assert word["last_reviewed"] is not None
+
+    words = client.get("/api/words").json()
+    assert words[0]["correct_count"] == 2
+
+    session = client.get(f"/api/study_sessions/{session_id}").json()
+    assert session["correct_count"] == 2
+    assert session["total_count"] == 3
+    assert [w["id"] for w in session["words"]] == [word_id]
+    assert session["words"][0]["wrong_count"] == 1
+
+
+def test_review_word_missing_session(client):
+    word_id = _create_word(client)
+    response = client.post(
+        f"/api/study_sessions/9999/words/{word_id}/review", json={"correct": True}
+    )
+    assert response.status_code == 404
+
+
+def test_review_words_batch(client, db_session):
+    session_id = _create_session(client, db_session)
+    cat_id = _create_word(client)
+    dog_id = _create_word(client, "犬", "inu", "dog")
+
+    response = client.post(
+        f"/api/study_sessions/{session_id}/reviews:batch",
+        json=[
+            {"word_id": cat_id, "correct": True},
+            {"word_id": dog_id, "correct": False},
+            {"word_id": cat_id, "correct": True},
+        ],
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "study_session_id": session_id,
+        "correct_count": 2,
+        "wrong_count": 1,
+        "total_count": 3,
+        "success_rate": 2 / 3 * 100,
+    }
+
+    cat = client.get(f"/api/words/{cat_id}").json()
+    assert (cat["correct_count"], cat["wrong_count"]) == (2, 0)
+    dog = client.get(f"/api/words/{dog_id}").json()
+    assert (dog["correct_count"], dog["wrong_count"]) == (0, 1)
+
+
+def test_review_words_batch_rejects_unknown_words(client, db_session):
+    session_id = _create_session(client, db_session)
+    word_id = _create_word(client)
+
+    response = client.post(
+        f"/api/study_sessions/{session_id}/reviews:batch",
+        json=[{"word_id": word_id, "correct": True}, {"word_id": 9999, "correct": True}],
+    )
+    assert response.status_code == 422
+    assert "9999" in response.json()["detail"]
+
+    # Nothing from the rejected batch was written
+    session = client.get(f"/api/study_sessions/{session_id}").json()
+    assert session["total_count"] == 0
+
+
+def test_encoded_lists_match_schema_serialization(client, db_session):
+    from pydantic import TypeAdapter
+    from typing import List
+    from src.models.study_session import StudySession as StudySessionModel
+    from src.models.word import Word as WordModel
+    from src.schemas.study_session import StudySession
+    from src.schemas.word import WordWithStats
+
+    session_id = _create_session(client, db_session)
+    word_id = _create_word(client)
+    client.post("/api/words", json={
+        "japanese": "猫", "romaji": "neko", "english": "cat", "parts": {"kanji": ["猫"]},
+    })
+    for correct in (True, False, False):
+        client.post(
+            f"/api/study_sessions/{session_id}/words/{word_id}/review", json={"correct": correct}
+        )
+
+    # Rows encoded with orjson give the bytes the response models would
+    db_session.expire_all()
+    words = db_session.query(WordModel).order_by(WordModel.id).all()
+    adapter = TypeAdapter(List[WordWithStats])
+    expected = adapter.dump_json(adapter.validate_python(words, from_attributes=True))
+    assert client.get("/api/words").content == expected
+    assert 33.3 < client.get("/api/words").json()[0]["success_rate"] < 33.4
+
+    sessions = db_session.query(StudySessionModel).order_by(StudySessionModel.id).all()
+    adapter = TypeAdapter(List[StudySession])
+    expected = adapter.dump_json(adapter.validate_python(sessions, from_attributes=True))
+    assert client.get("/api/study_sessions").content == expected
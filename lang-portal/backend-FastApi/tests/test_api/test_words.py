@@ -6,14 +6,17 @@ from pathlib import Path
 # Add src to Python path
 sys.path.append(str(Path(__file__).parent.parent))
 from src.main import app
+from src.core.pagination import encode_cursor
 
 client = TestClient(app)
 
+
 def test_read_words():
     response = client.get("/api/words")
     assert response.status_code == 200
     assert isinstance(response.json(), list)
 
+
 def test_create_word(client):
     word_data = {
         "japanese": "テスト",
@@ -29,11 +32,13 @@ def test_create_word(client):
     assert data["japanese"] == word_data["japanese"]
     assert data["english"] == word_data["english"]
 
+
 def test_get_words(client):
     response = client.get("/api/words")
     assert response.status_code == 200
     assert isinstance(response.json(), list)
 
+
 def test_get_word(client):
     # First create a word
     word_data = {
@@ -50,4 +55,394 @@ def test_get_word(client):
     # Then get it
     response = client.get(f"/api/words/{word_id}")
     assert response.status_code == 200
-    assert response.json()["japanese"] == word_data["japanese"] 
\ No newline at end of file
+    assert response.json()["japanese"] == word_data["japanese"]
+
+
+def test_get_words_cursor_pagination(client):
+    created = []
+    for i in range(5):
+        response = client.post(
+            "/api/words",
+            json={"japanese": f"語{i}", "romaji": f"go{i}", "english": f"word {i}"},
+        )
+        created.append(response.json()["id"])
+
+    seen = []
+    response = client.get("/api/words", params={"limit": 2})
+    while True:
+        assert response.status_code == 200
+        seen.extend(word["id"] for word in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        response = client.get("/api/words", params={"limit": 2, "cursor": cursor})
+    assert seen == created
+
+    # The legacy offset parameter keeps working alongside cursors
+    response = client.get("/api/words", params={"skip": 3, "limit": 2})
+    assert [word["id"] for word in response.json()] == created[3:]
+
+
+def test_get_words_invalid_cursor(client):
+    response = client.get("/api/words", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("values", [[[1]], [{}], [None], ["x"], [True], [1, 2]])
+def test_get_words_malformed_cursor(client, values):
+    client.post("/api/words", json={"japanese": "水", "romaji": "mizu", "english": "water"})
+    response = client.get("/api/words", params={"cursor": encode_cursor(values)})
+    assert response.status_code == 400
+
+
+def test_import_words_json(client):
+    group_id = client.post("/api/groups", json={"name": "Imported"}).json()["id"]
+    client.post("/api/words", json={"japanese": "水", "romaji": "mizu", "english": "water"})
+
+    body = {
+        "vocabulary": [
+            {"japanese": "水", "romaji": "mizu", "english": "water"},
+            {"japanese": "火", "romaji": "hi", "english": "fire", "parts": {"kanji": "火"}},
+            {"japanese": "火", "romaji": "hi", "english": "fire"},
+            {"japanese": "木", "romaji": "ki", "english": "tree"},
+            {"romaji": "missing japanese"},
+        ]
+    }
+    response = client.post(
+        "/api/words:import", params={"group_id": group_id, "batch_size": 2}, json=body
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["inserted"] == 2
+    assert data["duplicates"] == 2
+    assert data["invalid"] == 1
+    assert [batch["received"] for batch in data["batches"]] == [2, 2]
+
+    group_words = client.get(f"/api/groups/{group_id}/words").json()
+    assert sorted(word["romaji"] for word in group_words) == ["hi", "ki", "mizu"]
+
+
+def test_import_words_ndjson(client):
+    lines = "\n".join([
+        '{"japanese": "山", "romaji": "yama", "english": "mountain"}',
+        '{"japanese": "川", "romaji": "kawa", "english": "river"}',
+    ])
+    response = client.post(
+        "/api/words:import",
+        content=lines.encode(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    assert response.json()["inserted"] == 2
+    assert len(client.get("/api/words").json()) == 2
+
+
+def test_import_words_malformed(client):
+    response = client.post(
+        "/api/words:import", content=b"[{", headers={"Content-Type": "application/json"}
+    )
+    assert response.status_code == 400
+
+
+def test_import_words_malformed_reports_committed_progress(client):
+    lines = [f'{{"japanese": "語{i}", "romaji": "go{i}", "english": "word {i}"}}' for i in range(5)]
+    lines[3] = "{not json"
+    response = client.post(
+        "/api/words:import",
+        params={"batch_size": 2},
+        content="\n".join(lines).encode(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 400
+    detail = response.json()["detail"]
+    # Everything before the bad line is committed; a retry resumes at offset 3
+    assert detail["offset"] == 3
+    assert detail["inserted"] == 3
+    assert [batch["received"] for batch in detail["batches"]] == [2, 1]
+    assert len(client.get("/api/words").json()) == 3
+
+
+def test_import_parsers_across_chunks():
+    import asyncio
+    from src.core import json_stream
+
+    async def chunks(body: bytes, size: int):
+        for start in range(0, len(body), size):
+            yield body[start:start + size]
+
+    async def collect(body: bytes, size: int):
+        return [value async for value in json_stream.iter_ndjson(chunks(body, size))]
+
+    body = '{"japanese": "猫"}\n\n{"english": "%s"}\n[1]' % ("x" * 5000)
+    assert asyncio.run(collect(body.encode(), 3)) == [
+        {"japanese": "猫"}, {"english": "x" * 5000}, [1]
+    ]
+
+    too_long = b'{"english": "' + b"x" * json_stream.MAX_VALUE_CHARS + b'"}\n'
+    with pytest.raises(ValueError, match="longer than"):
+        asyncio.run(collect(too_long, 64 * 1024))
+    with pytest.raises(ValueError, match="longer than"):
+        asyncio.run(collect(too_long, len(too_long)))
+
+    async def collect_array(body: bytes, size: int):
+        return [value async for value in json_stream.iter_json_array(chunks(body, size))]
+
+    with pytest.raises(ValueError, match="longer than"):
+        asyncio.run(collect_array(b"[" + too_long, 64 * 1024))
+
+
+def test_get_words_conditional(client, query_counter):
+    client.post("/api/words", json={"japanese": "花", "romaji": "hana", "english": "flower"})
+
+    response = client.get("/api/words")
+    etag = response.headers["ETag"]
+
+    query_counter.reset()
+    response = client.get("/api/words", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    # Only the change_versions lookup runs; the words query is skipped
+    assert query_counter.count == 1
+
+    client.post("/api/words", json={"japanese": "空", "romaji": "sora", "english": "sky"})
+    response = client.get("/api/words", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert len(response.json()) == 2
+
+
+@pytest.mark.sqlite_only
+def test_search_words(client):
+    for word in [
+        {"japanese": "猫", "romaji": "neko", "english": "cat",
+         "parts": {"kanji": "猫", "hiragana": ["ね", "こ"]}},
+        {"japanese": "ネクタイ", "romaji": "nekutai", "english": "necktie"},
+        {"japanese": "東京", "romaji": "tōkyō", "english": "Tokyo"},
+        {"japanese": "犬", "romaji": "inu", "english": "dog"},
+    ]:
+        client.post("/api/words", json=word)
+
+    def search(q):
+        response = client.get("/api/words/search", params={"q": q})
+        assert response.status_code == 200
+        return [word["english"] for word in response.json()]
+
+    # Romaji and English prefixes
+    assert sorted(search("nek")) == ["cat", "necktie"]
+    assert search("DO") == ["dog"]
+    # Macrons and full-width input are normalized
+    assert search("tokyo") == ["Tokyo"]
+    assert search("ｔｏｋｙｏ") == ["Tokyo"]
+    # Hiragana finds the katakana spelling, and kanji words by their reading
+    assert search("ねく") == ["necktie"]
+    assert search("ねこ") == ["cat"]
+    assert search("猫") == ["cat"]
+    assert search("!!") == []
+
+    # Updates and deletes are picked up by the triggers
+    dog_id = next(w["id"] for w in client.get("/api/words").json() if w["english"] == "dog")
+    client.put(f"/api/words/{dog_id}", json={"japanese": "犬", "romaji": "inu", "english": "hound"})
+    assert search("dog") == []
+    assert search("hound") == ["hound"]
+    client.delete(f"/api/words/{dog_id}")
+    assert search("hound") == []
+
+
+@pytest.mark.sqlite_only
+def test_search_words_japanese_substring(client):
+    for word in [
+        {"japanese": "猫が好き", "romaji": "neko ga suki", "english": "I like cats"},
+        {"japanese": "好き", "romaji": "suki", "english": "liked"},
+        {"japanese": "大好きな食べ物", "romaji": "daisuki na tabemono", "english": "favourite food"},
+    ]:
+        client.post("/api/words", json=word)
+
+    def search(q):
+        response = client.get("/api/words/search", params={"q": q})
+        assert response.status_code == 200
+        return [word["japanese"] for word in response.json()]
+
+    # Whole-word prefix matches rank first, then substrings, shortest first
+    assert search("好き") == ["好き", "猫が好き", "大好きな食べ物"]
+    assert search("が") == ["猫が好き"]
+    assert search("が好") == ["猫が好き"]
+    assert search("食べ物") == ["大好きな食べ物"]
+
+    word_id = client.get("/api/words").json()[0]["id"]
+    client.put(
+        f"/api/words/{word_id}",
+        json={"japanese": "犬が好き", "romaji": "inu ga suki", "english": "I like dogs"},
+    )
+    assert search("猫が") == []
+    assert search("犬が") == ["犬が好き"]
+
+
+def test_get_random_words(client, db_session):
+    from src.models.group import Group
+    from src.models.word import Word
+
+    animals = [Word(japanese=f"動物{i}", romaji=f"doubutsu{i}", english=f"animal {i}") for i in range(5)]
+    others = [Word(japanese=f"語{i}", romaji=f"go{i}", english=f"word {i}") for i in range(5)]
+    group = Group(name="Animals", words=animals)
+    db_session.add_all([group, *others])
+    db_session.commit()
+    group_id = group.id
+    animal_ids = {word.id for word in animals}
+
+    words = client.get("/api/words/random?n=4").json()
+    assert len(words) == 4
+    assert len({word["id"] for word in words}) == 4
+
+    # Sampling without replacement never returns more than the group holds
+    words = client.get(f"/api/words/random?n=50&group_id={group_id}").json()
+    assert {word["id"] for word in words} == animal_ids
+    assert len(words) == 5
+
+    # Membership changes bump the version and rebuild the cached ids
+    new_id = client.post(
+        "/api/words", json={"japanese": "猫", "romaji": "neko", "english": "cat"}
+    ).json()["id"]
+    client.post(f"/api/groups/{group_id}/words", json={"word_ids": [new_id]})
+    words = client.get(f"/api/words/random?n=50&group_id={group_id}").json()
+    assert {word["id"] for word in words} == animal_ids | {new_id}
+
+    assert client.get("/api/words/random?group_id=9999").status_code == 404
+    assert client.get("/api/words/random?n=0").status_code == 422
+
+
+def test_random_id_cache_is_bounded_and_skips_stale_ids(db_session):
+    import asyncio
+    from src.models.group import Group
+    from src.models.word import Word
+    from src.services.word_service import _RandomIdCache
+    from tests.conftest import AsyncTestingSessionLocal
+
+    groups = [
+        Group(name=f"Group {i}", words=[Word(japanese=f"語{i}", romaji=f"go{i}", english=f"word {i}")])
+        for i in range(3)
+    ]
+    db_session.add_all(groups)
+    db_session.commit()
+    group_ids = [group.id for group in groups]
+    cache = _RandomIdCache(max_groups=2)
+
+    async def run():
+        async with AsyncTestingSessionLocal() as db:
+            for group_id in group_ids:
+                await cache.get(db, group_id)
+            # Unknown groups are answered but not remembered
+            assert await cache.get(db, 9999) is None
+            cached = list(cache.ids)
+
+            scalars = db.scalars
+
+            async def racing_scalars(*args, **kwargs):
+                # Another request resets the cache for newer versions mid-scan
+                cache.versions, cache.ids = {"words": -1}, {}
+                return await scalars(*args, **kwargs)
+
+            db.scalars = racing_scalars
+            ids = await cache.get(db, None)
+            return cached, ids
+
+    cached, ids = asyncio.run(run())
+    assert cached == group_ids[1:]
+    assert len(ids) == 3
+    assert cache.ids == {}
+
+
+def test_get_words_by_ids(client, db_session, query_counter):
+    from src.models.word import Word
+
+    words = [Word(japanese=f"語{i}", romaji=f"go{i}", english=f"word {i}") for i in range(5)]
+    db_session.add_all(words)
+    db_session.commit()
+    ids = [words[3].id, words[0].id, 9999, words[2].id]
+
+    query_counter.reset()
+    response = client.get("/api/words", params={"ids": ",".join(map(str, ids))})
+    assert response.status_code == 200
+    assert [word["id"] for word in response.json()] == [ids[0], ids[1], ids[3]]
+    # ETag lookup + one IN query
+    assert query_counter.count == 2, query_counter.statements
+
+    assert client.get("/api/words?ids=1,x").status_code == 400
+    assert client.get("/api/words", params={"ids": ",".join(["1"] * 501)}).status_code == 400
+
+
+def test_patch_words_batch(client, db_session):
+    from src.models.word import Word
+
+    words = [Word(japanese=f"語{i}", romaji=f"go{i}", english=f"word {i}") for i in range(3)]
+    db_session.add_all(words)
+    db_session.commit()
+    first, second, third = (word.id for word in words)
+
+    response = client.patch("/api/words:batch", json=[
+        {"id": second, "english": "second", "parts": {"kanji": "語"}},
+        {"id": first, "romaji": "ichi"},
+    ])
+    assert response.status_code == 200
+    body = response.json()
+    assert [word["id"] for word in body] == [second, first]
+    assert (body[0]["english"], body[0]["romaji"], body[0]["parts"]) == ("second", "go1", {"kanji": "語"})
+    assert (body[1]["english"], body[1]["romaji"]) == ("word 0", "ichi")
+    assert client.get(f"/api/words/{third}").json()["english"] == "word 2"
+
+    # The search index follows bulk updates
+    assert [word["id"] for word in client.get("/api/words/search?q=ichi").json()] == [first]
+
+    # Unknown ids reject the batch without writing anything
+    response = client.patch("/api/words:batch", json=[
+        {"id": third, "english": "changed"}, {"id": 9999, "english": "x"},
+    ])
+    assert response.status_code == 422
+    assert "9999" in response.json()["detail"]
+    assert client.get(f"/api/words/{third}").json()["english"] == "word 2"
+
+    assert client.patch("/api/words:batch", json=[{"id": first, "japanese": None}]).status_code == 422
+
+
+def test_get_words_contains_char(client):
+    def words_with(char):
+        response = client.get("/api/words", params={"contains_char": char})
+        assert response.status_code == 200
+        return [word["english"] for word in response.json()]
+
+    cat = client.post("/api/words", json={
+        "japanese": "猫", "romaji": "neko", "english": "cat",
+        "parts": {"kanji": ["猫"], "reading": "ねこ"},
+    }).json()
+    client.post("/api/words", json={"japanese": "子猫", "romaji": "koneko", "english": "kitten"})
+    client.post(
+        "/api/words:import",
+        json=[{"japanese": "猫舌", "romaji": "nekojita", "english": "cat's tongue"}],
+    )
+    assert words_with("猫") == ["cat", "kitten", "cat's tongue"]
+    assert words_with("ね") == ["cat"]
+    assert words_with("ｺ") == []  # half-width katakana is normalized first
+
+    client.patch("/api/words:batch", json=[{"id": cat["id"], "japanese": "ネコ", "parts": None}])
+    assert words_with("猫") == ["kitten", "cat's tongue"]
+    assert words_with("コ") == ["cat"]
+    client.put(f"/api/words/{cat['id']}", json={"japanese": "犬", "romaji": "inu", "english": "dog"})
+    assert words_with("犬") == ["dog"] and words_with("コ") == []
+    client.delete(f"/api/words/{cat['id']}")
+    assert words_with("犬") == []
+
+    assert client.get("/api/words", params={"contains_char": "ab"}).status_code == 400
+    assert client.get("/api/words", params={"contains_char": "a"}).status_code == 400
+
+
+@pytest.mark.sqlite_only
+def test_get_words_contains_char_uses_primary_key(db_session):
+    from sqlalchemy import text
+    from sqlalchemy.dialects import sqlite
+    from src.services.word_service import WordService
+
+    # Answered from the word_parts primary key, already in word id order
+    query = WordService.list_query(limit=10, after=[1], contains_char="猫")
+    compiled = query.compile(dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True})
+    plan = " ".join(row[-1] for row in db_session.execute(text(f"EXPLAIN QUERY PLAN {compiled}")))
+    assert "SEARCH word_parts USING PRIMARY KEY (char=? AND word_id>?)" in plan
+    assert "TEMP B-TREE" not in plan
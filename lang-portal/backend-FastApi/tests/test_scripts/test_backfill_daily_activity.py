@@ -0,0 +1,39 @@
+from scripts.backfill_daily_activity import backfill_daily_activity
+
+def test_backfill_matches_history(db_session):
+    from datetime import date, datetime
+    from src.models.daily_activity import DailyActivity
+    from src.models.group import Group
+    from src.models.study_activity import StudyActivity
+    from src.models.study_session import StudySession
+    from src.models.word import Word
+    from src.models.word_review import WordReviewItem
+
+    group = Group(name="Animals")
+    activity = StudyActivity(name="Flashcards", type="flashcards")
+    word = Word(japanese="猫", romaji="neko", english="cat")
+    db_session.add_all([group, activity, word])
+    db_session.flush()
+    monday = datetime(2025, 2, 3, 9, 0)
+    tuesday = datetime(2025, 2, 4, 23, 30)
+    sessions = [
+        StudySession(group_id=group.id, study_activity_id=activity.id, created_at=monday),
+        StudySession(group_id=None, study_activity_id=activity.id, created_at=tuesday),
+    ]
+    db_session.add_all(sessions)
+    db_session.flush()
+    db_session.add_all([
+        WordReviewItem(word_id=word.id, study_session_id=sessions[0].id, correct=True, created_at=monday),
+        WordReviewItem(word_id=word.id, study_session_id=sessions[0].id, correct=False, created_at=monday),
+        WordReviewItem(word_id=word.id, study_session_id=sessions[1].id, correct=True, created_at=tuesday),
+    ])
+    # Stale rollup rows are replaced, not added to
+    db_session.add(DailyActivity(day=date(2025, 2, 3), group_id=group.id, reviews=99))
+    db_session.commit()
+
+    assert backfill_daily_activity(db_session) == 2
+    rows = db_session.query(DailyActivity).order_by(DailyActivity.day).all()
+    assert [(r.day, r.group_id, r.reviews, r.correct, r.sessions) for r in rows] == [
+        (date(2025, 2, 3), group.id, 2, 1, 1),
+        (date(2025, 2, 4), 0, 1, 1, 1),
+    ]
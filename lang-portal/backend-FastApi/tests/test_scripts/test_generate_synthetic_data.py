@@ -0,0 +1,33 @@
+from sqlalchemy import func, select
+from scripts.generate_synthetic_data import generate
+
+def test_generate_skewed_data_with_consistent_rollups(db_session):
+    from src.models.change_log import ChangeLogEntry
+    from src.models.daily_activity import DailyActivity
+    from src.models.word import Word, words_groups
+    from src.models.word_review import WordReviewItem
+    from src.models.word_review_stats import WordReviewStats
+
+    ids = generate(db_session, words=200, groups=5, sessions=20, reviews=1000, seed=7)
+    assert len(ids["word_ids"]) == 200
+    assert ids["reviews"] == 1000
+
+    # Every word belongs to a group, and the rollups match the review history
+    assert db_session.scalar(select(func.count(words_groups.c.word_id.distinct()))) == 200
+    assert db_session.scalar(select(func.sum(WordReviewStats.correct_count + WordReviewStats.wrong_count))) == 1000
+    assert db_session.scalar(select(func.sum(DailyActivity.reviews))) == 1000
+    assert db_session.scalar(select(func.sum(DailyActivity.sessions))) == 20
+
+    # The change feed carries every group, word and link
+    links = db_session.scalar(select(func.count()).select_from(words_groups))
+    assert db_session.scalar(select(func.count()).select_from(ChangeLogEntry)) == 5 + 200 + links
+
+    # Skewed: the most reviewed word gets far more than an even share (5 per word)
+    top = db_session.scalar(
+        select(func.count()).select_from(WordReviewItem)
+        .group_by(WordReviewItem.word_id).order_by(func.count().desc()).limit(1)
+    )
+    assert top > 25
+
+    words = db_session.execute(select(Word.japanese, Word.romaji)).all()
+    assert all(japanese and romaji.isascii() for japanese, romaji in words)
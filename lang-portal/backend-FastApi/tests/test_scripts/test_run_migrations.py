@@ -0,0 +1,137 @@
+import os
+import sqlite3
+import pytest
+from sqlalchemy import create_engine, inspect, make_url
+from sqlalchemy.pool import NullPool
+from scripts.run_migrations import MigrationError, reset_database, run_migrations
+from src.core.config import sync_database_url
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL", "")
+
+def _write(migrations_dir, name, sql):
+    (migrations_dir / name).write_text(sql)
+
+def _tables(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+
+def test_applies_only_new_migrations(tmp_path):
+    migrations_dir = tmp_path / "migrations"
+    migrations_dir.mkdir()
+    db_path = tmp_path / "words.db"
+    _write(migrations_dir, "0001_init.sql", "CREATE TABLE words (id INTEGER PRIMARY KEY);")
+
+    run_migrations(db_path, migrations_dir)
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("INSERT INTO words (id) VALUES (1)")
+
+    _write(migrations_dir, "0002_groups.sql", "CREATE TABLE groups (id INTEGER PRIMARY KEY);")
+    run_migrations(db_path, migrations_dir)
+
+    assert {"words", "groups", "schema_migrations"} <= _tables(db_path)
+    with sqlite3.connect(db_path) as conn:
+        # Existing data survives a deploy
+        assert conn.execute("SELECT COUNT(*) FROM words").fetchone()[0] == 1
+        versions = [row[0] for row in conn.execute("SELECT version FROM schema_migrations ORDER BY version")]
+    assert versions == ["0001_init", "0002_groups"]
+
+def test_failed_migration_is_rolled_back(tmp_path):
+    migrations_dir = tmp_path / "migrations"
+    migrations_dir.mkdir()
+    db_path = tmp_path / "words.db"
+    _write(migrations_dir, "0001_bad.sql", "CREATE TABLE words (id INTEGER);\nNOT VALID SQL;")
+
+    with pytest.raises(sqlite3.Error):
+        run_migrations(db_path, migrations_dir)
+    assert "words" not in _tables(db_path)
+
+def test_modified_migration_is_rejected(tmp_path):
+    migrations_dir = tmp_path / "migrations"
+    migrations_dir.mkdir()
+    db_path = tmp_path / "words.db"
+    _write(migrations_dir, "0001_init.sql", "CREATE TABLE words (id INTEGER PRIMARY KEY);")
+    run_migrations(db_path, migrations_dir)
+
+    _write(migrations_dir, "0001_init.sql", "CREATE TABLE words (id INTEGER PRIMARY KEY, extra TEXT);")
+    with pytest.raises(MigrationError):
+        run_migrations(db_path, migrations_dir)
+
+def test_legacy_database_requires_baseline(tmp_path):
+    migrations_dir = tmp_path / "migrations"
+    migrations_dir.mkdir()
+    db_path = tmp_path / "words.db"
+    _write(migrations_dir, "0001_init.sql", "CREATE TABLE words (id INTEGER PRIMARY KEY);")
+    _write(migrations_dir, "0002_groups.sql", "CREATE TABLE groups (id INTEGER PRIMARY KEY);")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE words (id INTEGER PRIMARY KEY)")
+
+    with pytest.raises(MigrationError):
+        run_migrations(db_path, migrations_dir)
+
+    run_migrations(db_path, migrations_dir, baseline="0001_init")
+    assert "groups" in _tables(db_path)
+
+def test_postgres_migrations_cover_models():
+    import re
+    from src.core.config import settings
+    from src.core.database import Base
+    from src.main import app  # noqa: F401 - imports every model
+
+    sql = "\n".join(f.read_text() for f in sorted((settings.MIGRATIONS_DIR / "postgresql").glob("*.sql")))
+    tables = set(re.findall(r"CREATE TABLE IF NOT EXISTS (\w+)", sql))
+    indexes = set(re.findall(r"CREATE INDEX IF NOT EXISTS (\w+)", sql))
+
+    assert tables == set(Base.metadata.tables)
+    # As in the SQLite migrations: id indexes duplicate the primary key,
+    # ix_words_japanese is a prefix of ix_words_japanese_romaji, and
+    # ix_groups_name was never migrated
+    model_indexes = {
+        index.name
+        for table in Base.metadata.tables.values()
+        for index in table.indexes
+        if [column.name for column in index.columns] != ["id"]
+    }
+    assert model_indexes - {"ix_groups_name", "ix_words_japanese"} <= indexes
+
+def _schema(url):
+    """Columns (name -> nullable), primary key and indexes of each model table"""
+    from src.core.database import Base
+    from src.main import app  # noqa: F401 - imports every model
+
+    engine = create_engine(sync_database_url(url), poolclass=NullPool)
+    try:
+        inspector = inspect(engine)
+        schema = {}
+        for table in sorted(Base.metadata.tables):
+            primary_key = inspector.get_pk_constraint(table)["constrained_columns"]
+            schema[table] = {
+                "columns": {
+                    column["name"]: column["nullable"] and column["name"] not in primary_key
+                    for column in inspector.get_columns(table)
+                },
+                "primary_key": primary_key,
+                "indexes": {
+                    index["name"]: (index["column_names"], bool(index["unique"]))
+                    for index in inspector.get_indexes(table)
+                    if "duplicates_constraint" not in index
+                },
+            }
+        return schema
+    finally:
+        engine.dispose()
+
+@pytest.mark.skipif(
+    not TEST_DATABASE_URL.startswith("postgresql"),
+    reason="compares against PostgreSQL; set TEST_DATABASE_URL=postgresql://...",
+)
+def test_migration_histories_match(tmp_path):
+    """migrations/ on SQLite and migrations/postgresql/ build the same schema"""
+    sqlite_path = tmp_path / "words.db"
+    run_migrations(sqlite_path)
+    postgres_url = make_url(TEST_DATABASE_URL).set(drivername="postgresql").render_as_string(False)
+    reset_database(database_url=postgres_url)
+    try:
+        run_migrations(database_url=postgres_url)
+        assert _schema(postgres_url) == _schema(f"sqlite:///{sqlite_path}")
+    finally:
+        reset_database(database_url=postgres_url)
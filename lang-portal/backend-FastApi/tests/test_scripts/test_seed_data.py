@@ -0,0 +1,24 @@
+from sqlalchemy import func, select
+from scripts.seed_data import seed
+
+def test_seeded_vocabulary_is_in_change_feed(client, db_session):
+    from src.models.change_version import ChangeVersion
+    from src.models.word import Word, words_groups
+
+    seed(db_session)
+    words = db_session.scalar(select(func.count()).select_from(Word))
+    links = db_session.scalar(select(func.count()).select_from(words_groups))
+    assert words > 0
+
+    feed = client.get("/api/changes", params={"limit": 5000}).json()
+    assert feed["has_more"] is False
+    counts = {}
+    for change in feed["changes"]:
+        assert change["op"] == "upsert"
+        counts[change["table"]] = counts.get(change["table"], 0) + 1
+    assert counts == {"groups": 6, "words": words, "words_groups": links}
+    assert all("data" in c for c in feed["changes"] if c["table"] == "words")
+
+    # Cached pages and ETags see the load too
+    versions = dict(db_session.execute(select(ChangeVersion.table_name, ChangeVersion.version)).all())
+    assert versions["groups"] == versions["words"] == versions["words_groups"] == 1